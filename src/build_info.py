@@ -5,6 +5,7 @@
 """Convert JSON to C variables"""
 
 
+import os
 import json
 import re
 import struct
@@ -12,6 +13,13 @@ import hashlib
 import collections
 import time
 import datetime
+import subprocess
+import shutil
+import tempfile
+import zlib
+import asyncio
+import threading
+import functools
 
 try:
     import git
@@ -20,6 +28,7 @@ except ModuleNotFoundError as e:
     print("Warning: Not able to read Git repositories.")
     print("Warning: To install the required module run")
     print("Warning: pip install GitPython")
+    print('Warning: or use Git_Repository Backend "python" or "binary"')
 
     # Set to None to allow testing without the module
     git = None
@@ -55,6 +64,153 @@ CodeData = collections.namedtuple(
     "CodeData", "macro header variable function", defaults=["", "", "", ""]
 )
 
+Accessor = collections.namedtuple("Accessor", "prefix name prototype body")
+
+# Data entry of an object, used to generate the code of the whole module.
+# ref is the C expression of the storage and length the size of strings.
+Entry = collections.namedtuple(
+    "Entry",
+    "key_data c_type name_var ref value length version index stored data seq",
+    defaults=[None, None, True, None, None],
+)
+
+# Defined in the header to describe the entries of the option Entry_Table.
+ENTRY_TYPE_DEFINES = """\
+#ifndef BUILD_INFO_ENTRY_T_
+#define BUILD_INFO_ENTRY_T_
+#define BUILD_INFO_TYPE_STRING 0
+#define BUILD_INFO_TYPE_INT8 1
+#define BUILD_INFO_TYPE_INT16 2
+#define BUILD_INFO_TYPE_INT32 3
+#define BUILD_INFO_TYPE_INT64 4
+#define BUILD_INFO_TYPE_UINT8 5
+#define BUILD_INFO_TYPE_UINT16 6
+#define BUILD_INFO_TYPE_UINT32 7
+#define BUILD_INFO_TYPE_UINT64 8
+#define BUILD_INFO_TYPE_FLOAT 9
+#define BUILD_INFO_TYPE_DOUBLE 10
+#define BUILD_INFO_TYPE_BOOL 11
+#define BUILD_INFO_FLAG_WRITABLE 0x01
+typedef struct {
+    const void *address;
+    uint16_t size;
+    uint8_t type;
+    uint8_t flags;
+} BuildInfo_Entry_t;
+#endif
+"""
+
+# Defined in the C file to hash entry names for the option Name_Lookup.
+NAME_HASH_FUNCTION = """\
+static uint32_t BuildInfo_NameHash(uint32_t seed, const char *name) {
+    uint32_t hash = seed != 0 ? seed : 2166136261UL;
+    while (*name != 0) {
+        hash ^= (uint8_t)*name++;
+        hash *= 16777619UL;
+    }
+    hash ^= hash >> 16;
+    hash *= 0x85EBCA6BUL;
+    hash ^= hash >> 13;
+    hash *= 0xC2B2AE35UL;
+    hash ^= hash >> 16;
+    return hash;
+}
+"""
+
+# Header of the binary image of the option Image, in the image endianness.
+IMAGE_MAGIC = 0x464E4942
+IMAGE_HEADER_SIZE = 16
+IMAGE_FORMATS = {
+    # "type": struct format
+    "int8": "b",
+    "int16": "h",
+    "int32": "i",
+    "int64": "q",
+    "uint8": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+    "float": "f",
+    "double": "d",
+    "bool": "?",
+}
+
+# Defined in the header to map the binary image of the option Image.
+IMAGE_HEADER_DEFINES = """\
+#ifndef BUILD_INFO_IMAGE_HEADER_T_
+#define BUILD_INFO_IMAGE_HEADER_T_
+#define BUILD_INFO_IMAGE_MAGIC 0x464E4942UL
+#if defined(__GNUC__)
+#define BUILD_INFO_PACKED __attribute__((packed))
+#else
+#define BUILD_INFO_PACKED
+#endif
+typedef struct {
+    uint32_t magic;
+    uint32_t layout_hash;
+    uint32_t size;
+    uint32_t crc;
+} BuildInfo_Image_Header_t;
+#endif
+"""
+
+# Header of the delta between images, in the image endianness, followed by the
+# records (uint16_t ID and value of each changed entry) and the CRC-32 of all
+# the bytes before it.
+DELTA_MAGIC = 0x444E4942
+DELTA_HEADER_FORMAT = "5I2H"
+
+# Defined in the header to apply deltas of the option Image_Delta.
+DELTA_HEADER_DEFINES = """\
+#ifndef BUILD_INFO_DELTA_HEADER_T_
+#define BUILD_INFO_DELTA_HEADER_T_
+#define BUILD_INFO_DELTA_MAGIC 0x444E4942UL
+typedef struct {
+    uint32_t magic;
+    uint32_t layout_hash;
+    uint32_t base_crc;
+    uint32_t crc;
+    uint32_t size;
+    uint16_t count;
+    uint16_t reserved;
+} BuildInfo_Delta_Header_t;
+typedef struct {
+    uint32_t offset;
+    uint32_t size;
+} BuildInfo_Image_Field_t;
+#endif
+"""
+
+# Defined in the C file to check images (same CRC-32 as zlib).
+CRC32_FUNCTION = """\
+static uint32_t BuildInfo_Crc32(const uint8_t *data, uint32_t size) {
+    uint32_t crc = 0xFFFFFFFFUL;
+    uint8_t bit;
+    while (size-- != 0) {
+        crc ^= *data++;
+        for (bit = 0; bit < 8; bit++) {
+            crc = (crc >> 1) ^ (0xEDB88320UL & (0 - (crc & 1)));
+        }
+    }
+    return ~crc;
+}
+"""
+
+# Defined in the C file to place variables and functions in sections.
+# Define BUILD_INFO_SECTION(name) before to support other compilers.
+SECTION_MACRO = """\
+#ifndef BUILD_INFO_SECTION
+#if defined(__GNUC__) && !defined(__APPLE__)
+#define BUILD_INFO_SECTION(name) __attribute__((section(name)))
+#else
+#define BUILD_INFO_SECTION(name)
+#endif
+#endif
+"""
+
+# Array with the read-only strings of the option String_Pool.
+STRING_POOL_NAME = "BuildInfo_String_Pool"
+
 
 class DefaultFormatter:
     """Formatter for names.
@@ -151,13 +307,926 @@ class SecondFormatter:
 
 
 class GitData:
+    """Describe the commit of a Git repository using GitPython.
+
+    Dirty detection strategies (suffix "-D" when the work tree is dirty):
+
+    Strategy        | Cost
+    ----------------------------------------------------------------------
+    full            | Stat every tracked file (git describe --dirty)
+    fsmonitor       | Same, assisted by the fsmonitor of the repository
+    index_only      | Compare only the index with HEAD, no file is stat'ed
+    off             | No dirty detection
+
+    With a time budget (seconds) a describe that takes too long is killed
+    and the last commit string of the repository computed by this process
+    is used. The cache is not persisted, so it helps only processes that
+    generate the code many times (e.g. a build server); a command line run
+    starts without it. If there is none, the describe has half of the time
+    budget and the undecorated describe the rest.
+
+    The fsmonitor strategy uses the fsmonitor configured in the repository
+    (core.fsmonitor, e.g. the builtin daemon or a Watchman hook), and is the
+    same as full without it. It does not override the configuration, as
+    forcing the builtin daemon would replace a hook and does nothing where
+    git is built without it.
+
+    With a path (relative to the repository argument) the last commit that
+    touched the path is described and only the path is checked for dirty
+    files, so unrelated commits do not change the commit string.
+    """
+
+    DIRTY_DETECTIONS = ("full", "fsmonitor", "index_only", "off")
+
+    DESCRIBE_ARGS = ["--always", "--tags"]
+    DIRTY_ARGS = ["--dirty=-D", "--broken=-B"]
+
+    # Last commit strings: {(path, dirty_detection): commit_string}
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, dirty_detection="full", time_budget=None, path=None):
+        if dirty_detection not in self.DIRTY_DETECTIONS:
+            raise ValueError(f"invalid dirty detection '{dirty_detection}'")
+        self._dirty_detection = dirty_detection
+        self._time_budget = time_budget
+        self._path = path
+
     def GetCommitString(self, repository):
+        git_cmd = self._GitCommand(repository)
+        path = self._AbsolutePath(repository)
+
+        if self._time_budget is None:
+            return self._Run(self._Describe(git_cmd, path), deadline=None)
+
+        cache_key = (path or os.path.abspath(repository), self._dirty_detection)
+        deadline, end = self._Deadlines(cache_key)
+        try:
+            commit_string = self._Run(self._Describe(git_cmd, path), deadline)
+        except self._GitCommandError():
+            if time.monotonic() < deadline:
+                raise
+            with self._cache_lock:
+                commit_string = self._cache.get(cache_key)
+            if commit_string is None:
+                steps = self._DescribeCommit(git_cmd, path)
+                commit_string = self._Run(steps, end)
+        else:
+            with self._cache_lock:
+                self._cache[cache_key] = commit_string
+        return commit_string
+
+    async def GetCommitStringAsync(self, repository):
+        """GetCommitString() in a thread, GitPython has no asyncio API."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.GetCommitString, repository
+        )
+
+    def _Deadlines(self, cache_key):
+        """Deadlines of the describe and of the undecorated describe, run
+        when the first one is killed and the cache has no commit string. Both
+        are within the time budget."""
+        end = time.monotonic() + self._time_budget
+        with self._cache_lock:
+            cached = cache_key in self._cache
+        if cached:
+            return end, end
+        return end - self._time_budget / 2, end
+
+    def _AbsolutePath(self, repository):
+        if self._path is None:
+            return None
+        return os.path.abspath(os.path.join(repository, self._path))
+
+    def _GitCommand(self, repository):
+        if git is None:
+            raise ModuleNotFoundError(
+                "GitPython is required by the gitpython Backend,"
+                + " run pip install GitPython or use other Backend"
+            )
         repo = git.Repo(repository, search_parent_directories=True)
-        describe_args = ["--always", "--tags", "--dirty=-D", "--broken=-B"]
-        commit_string = repo.git.describe(describe_args)
+        return repo.git
+
+    def _GitCommandError(self):
+        return git.GitCommandError
+
+    def _Run(self, steps, deadline):
+        """Run the git commands yielded by the steps generator.
+
+        Steps yield (git_cmd, command, args), receive the output of
+        git_cmd.command(args) or have its exception thrown into, and return
+        the result.
+        """
+        output = None
+        error = None
+        while True:
+            try:
+                if error is None:
+                    git_cmd, command, args = steps.send(output)
+                else:
+                    git_cmd, command, args = steps.throw(error)
+            except StopIteration as e:
+                return e.value
+            try:
+                output = self._Git(git_cmd, command, args, deadline)
+                error = None
+            except self._GitCommandError() as e:
+                output = None
+                error = e
+
+    def _Describe(self, git_cmd, path):
+        if path is not None:
+            return (yield from self._DescribePath(git_cmd, path))
+
+        elif self._dirty_detection in ("full", "fsmonitor"):
+            describe_args = self.DESCRIBE_ARGS + self.DIRTY_ARGS
+            return (yield git_cmd, "describe", describe_args)
+
+        commit_string = yield from self._DescribeCommit(git_cmd, None)
+
+        if self._dirty_detection == "index_only":
+            diff_args = ["--cached", "--quiet", "HEAD"]
+            if (yield from self._IsDiff(git_cmd, "diff_index", diff_args)):
+                commit_string += "-D"
+
+        return commit_string
+
+    def _DescribePath(self, git_cmd, path):
+        commit_string = yield from self._DescribeCommit(git_cmd, path)
+
+        if self._dirty_detection == "off":
+            return commit_string
+        elif self._dirty_detection == "index_only":
+            command = "diff_index"
+            diff_args = ["--cached", "--quiet", "HEAD", "--", path]
+        else:
+            # Porcelain diff refreshes the index like describe --dirty.
+            command = "diff"
+            diff_args = ["--quiet", "HEAD", "--", path]
+
+        if (yield from self._IsDiff(git_cmd, command, diff_args)):
+            commit_string += "-D"
+        return commit_string
+
+    def _DescribeCommit(self, git_cmd, path):
+        """Undecorated describe of HEAD or of the last commit of the path."""
+        if path is None:
+            describe_args = self.DESCRIBE_ARGS
+        else:
+            log_args = ["-1", "--format=%H", "--", path]
+            commit = yield git_cmd, "log", log_args
+            describe_args = self.DESCRIBE_ARGS + [commit or "HEAD"]
+        return (yield git_cmd, "describe", describe_args)
+
+    def _IsDiff(self, git_cmd, command, diff_args):
+        try:
+            yield git_cmd, command, diff_args
+        except self._GitCommandError() as e:
+            if e.status != 1:
+                raise
+            return True
+        return False
+
+    def _Git(self, git_cmd, command, args, deadline):
+        """Run git_cmd.command(args), killing it after the deadline."""
+        if deadline is None:
+            return getattr(git_cmd, command)(args)
+        timeout = max(deadline - time.monotonic(), 0.0)
+        return getattr(git_cmd, command)(args, kill_after_timeout=timeout)
+
+
+class GitCommandError(Exception):
+    """The git executable failed (status -9 if killed after a timeout)."""
+
+    def __init__(self, command, status, stderr=""):
+        super().__init__(f"{command} returned {status}: {stderr}")
+        self.command = command
+        self.status = status
+        self.stderr = stderr
+
+
+class GitBinary:
+    """Subset of GitPython's Git command interface using the git executable.
+
+    git_cmd.diff_index(["--quiet"]) runs "git diff-index --quiet" and
+    await git_cmd.RunAsync("diff_index", ["--quiet"]) does the same using
+    an asyncio subprocess.
+    """
+
+    def __init__(self, working_dir):
+        self._working_dir = working_dir
+
+    def __getattr__(self, command):
+        if command.startswith("_"):
+            raise AttributeError(command)
+
+        def Command(args, kill_after_timeout=None):
+            return self.Run(command, args, kill_after_timeout)
+
+        return Command
+
+    def Run(self, command, args, kill_after_timeout=None):
+        command = self._Command(command, args)
+        try:
+            result = subprocess.run(
+                command,
+                cwd=self._working_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                timeout=kill_after_timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise GitCommandError(command, -9)
+        return self._Output(
+            command, result.returncode, result.stdout, result.stderr
+        )
+
+    async def RunAsync(self, command, args, kill_after_timeout=None):
+        command = self._Command(command, args)
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=self._working_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), kill_after_timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise GitCommandError(command, -9)
+        return self._Output(
+            command, process.returncode, stdout.decode(), stderr.decode()
+        )
+
+    def _Command(self, command, args):
+        return ["git", command.replace("_", "-"), *args]
+
+    def _Output(self, command, returncode, stdout, stderr):
+        if returncode != 0:
+            raise GitCommandError(command, returncode, stderr)
+        return stdout.rstrip("\n")
+
+
+class GitBinaryData(GitData):
+    """Describe the commit of a Git repository running the git executable."""
+
+    async def GetCommitStringAsync(self, repository):
+        """Same as GetCommitString() running git as asyncio subprocesses."""
+        git_cmd = self._GitCommand(repository)
+        path = self._AbsolutePath(repository)
+
+        if self._time_budget is None:
+            steps = self._Describe(git_cmd, path)
+            return await self._RunAsync(steps, deadline=None)
+
+        cache_key = (path or os.path.abspath(repository), self._dirty_detection)
+        deadline, end = self._Deadlines(cache_key)
+        try:
+            steps = self._Describe(git_cmd, path)
+            commit_string = await self._RunAsync(steps, deadline)
+        except GitCommandError:
+            if time.monotonic() < deadline:
+                raise
+            with self._cache_lock:
+                commit_string = self._cache.get(cache_key)
+            if commit_string is None:
+                steps = self._DescribeCommit(git_cmd, path)
+                commit_string = await self._RunAsync(steps, end)
+        else:
+            with self._cache_lock:
+                self._cache[cache_key] = commit_string
+        return commit_string
+
+    def _GitCommand(self, repository):
+        return GitBinary(repository)
+
+    def _GitCommandError(self):
+        return GitCommandError
+
+    async def _RunAsync(self, steps, deadline):
+        """Same as _Run() with asyncio subprocesses."""
+        output = None
+        error = None
+        while True:
+            try:
+                if error is None:
+                    git_cmd, command, args = steps.send(output)
+                else:
+                    git_cmd, command, args = steps.throw(error)
+            except StopIteration as e:
+                return e.value
+            if deadline is None:
+                timeout = None
+            else:
+                timeout = max(deadline - time.monotonic(), 0.0)
+            try:
+                output = await git_cmd.RunAsync(command, args, timeout)
+                error = None
+            except GitCommandError as e:
+                output = None
+                error = e
+
+
+class GitDirData(GitBinaryData):
+    """Describe the commit of a Git repository reading the .git directory.
+
+    No process is spawned when the reader can decide the commit string,
+    which needs dirty detection "index_only" or "off" and no path. Otherwise
+    the git executable is used.
+    """
+
+    def GetCommitString(self, repository):
+        commit_string = self._ReadCommitString(repository)
+        if commit_string is not None:
+            return commit_string
+        return super().GetCommitString(repository)
+
+    async def GetCommitStringAsync(self, repository):
+        commit_string = self._ReadCommitString(repository)
+        if commit_string is not None:
+            return commit_string
+        return await super().GetCommitStringAsync(repository)
+
+    def _ReadCommitString(self, repository):
+        if self._path is not None or self._dirty_detection not in (
+            "index_only",
+            "off",
+        ):
+            return None
+
+        reader = GitDirReader(repository)
+        commit_string = reader.Describe()
+        if commit_string is not None and self._dirty_detection != "off":
+            is_dirty = reader.IsIndexDirty()
+            if is_dirty is None:
+                commit_string = None
+            elif is_dirty:
+                commit_string += "-D"
         return commit_string
 
 
+class GitDirReader:
+    """Read refs, objects and the index directly from a .git directory.
+
+    Supports loose and packed refs, loose and packed (v2 index) objects,
+    linked worktrees (gitdir: files) and alternates. Methods return None
+    when the repository uses something else, or when the result cannot be
+    decided without the git executable (e.g. merges between HEAD and the
+    nearest tag).
+    """
+
+    FALLBACK_DEFAULT_ABBREV = 7
+    MAX_DEPTH = 10000
+
+    OBJ_TYPES = {1: b"commit", 2: b"tree", 3: b"blob", 4: b"tag"}
+    OBJ_OFS_DELTA = 6
+    OBJ_REF_DELTA = 7
+
+    def __init__(self, repository):
+        self._git_dir = None
+        self._common_dir = None
+        self._object_dirs = []
+        self._packs = None
+        self._FindGitDir(os.path.abspath(repository))
+
+    def _FindGitDir(self, path):
+        while True:
+            dot_git = os.path.join(path, ".git")
+            if os.path.isdir(dot_git):
+                self._git_dir = dot_git
+                break
+            elif os.path.isfile(dot_git):
+                gitdir = self._ReadText(dot_git)
+                if not gitdir.startswith("gitdir: "):
+                    return
+                gitdir = gitdir[len("gitdir: ") :].strip()
+                self._git_dir = os.path.join(path, gitdir)
+                break
+            parent = os.path.dirname(path)
+            if parent == path:
+                return
+            path = parent
+
+        commondir = os.path.join(self._git_dir, "commondir")
+        if os.path.isfile(commondir):
+            commondir = self._ReadText(commondir).strip()
+            self._common_dir = os.path.join(self._git_dir, commondir)
+        else:
+            self._common_dir = self._git_dir
+
+        objects = os.path.join(self._common_dir, "objects")
+        self._object_dirs = [objects]
+        alternates = os.path.join(objects, "info", "alternates")
+        if os.path.isfile(alternates):
+            for line in self._ReadText(alternates).splitlines():
+                if line and not line.startswith("#"):
+                    self._object_dirs.append(os.path.join(objects, line))
+
+    def _ReadText(self, filename):
+        with open(filename, "r") as fp:
+            return fp.read()
+
+    def _ReadBinary(self, filename):
+        with open(filename, "rb") as fp:
+            return fp.read()
+
+    def _IsSupported(self):
+        if self._git_dir is None:
+            return False
+        for unsupported in ("shallow", "reftable", "refs/replace"):
+            if os.path.exists(os.path.join(self._common_dir, unsupported)):
+                return False
+        for objects in self._object_dirs:
+            midx = os.path.join(objects, "pack", "multi-pack-index")
+            if os.path.exists(midx):
+                return False
+        # Configuration changing the describe output or the object format.
+        config_files = [
+            os.path.join(self._common_dir, "config"),
+            os.path.join(self._git_dir, "config.worktree"),
+            os.path.expanduser("~/.gitconfig"),
+            os.path.join(
+                os.environ.get(
+                    "XDG_CONFIG_HOME", os.path.expanduser("~/.config")
+                ),
+                "git",
+                "config",
+            ),
+            "/etc/gitconfig",
+        ]
+        for config_file in config_files:
+            if not os.path.isfile(config_file):
+                continue
+            config = self._ReadText(config_file).lower()
+            for option in ("abbrev", "objectformat", "include", "refstorage"):
+                if option in config:
+                    return False
+        for variable in ("GIT_DIR", "GIT_CONFIG", "GIT_OBJECT_DIRECTORY"):
+            if variable in os.environ:
+                return False
+        return True
+
+    def Describe(self):
+        """Return the same as "git describe --always --tags" or None."""
+        try:
+            if not self._IsSupported():
+                return None
+            return self._Describe()
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            IndexError,
+            zlib.error,
+            struct.error,
+        ):
+            return None
+
+    def _Describe(self):
+        head = self.ResolveRef("HEAD")
+        if head is None:
+            return None
+
+        tags = self._TagsByCommit()
+        if head in tags:
+            return self._BestTag(tags[head])
+        elif not tags:
+            return self._Abbrev(head)
+
+        commit = head
+        for depth in range(1, self.MAX_DEPTH):
+            parents = self._CommitParents(commit)
+            if len(parents) == 0:
+                return self._Abbrev(head)
+            elif len(parents) != 1:
+                # Git counts the commits reachable from HEAD and not from
+                # the tag, which is the distance only on linear history.
+                return None
+            commit = parents[0]
+            if commit in tags:
+                tag = self._BestTag(tags[commit])
+                if tag is None:
+                    return None
+                return f"{tag}-{depth}-g{self._Abbrev(head)}"
+        return None
+
+    def _BestTag(self, tags):
+        """Prefer annotated tags, as git does, and give up on ties."""
+        annotated = [name for name, is_annotated in tags if is_annotated]
+        candidates = annotated if annotated else [name for name, _ in tags]
+        if len(candidates) != 1:
+            return None
+        return candidates[0]
+
+    def ResolveRef(self, ref):
+        for _ in range(10):
+            if ref == "HEAD" or ref.startswith(
+                ("refs/worktree/", "refs/bisect/")
+            ):
+                ref_dir = self._git_dir
+            else:
+                ref_dir = self._common_dir
+
+            ref_file = os.path.join(ref_dir, *ref.split("/"))
+            if os.path.isfile(ref_file):
+                value = self._ReadText(ref_file).strip()
+            else:
+                value = self._PackedRefs().get(ref, (None, None))[0]
+
+            if value is None:
+                return None
+            elif value.startswith("ref: "):
+                ref = value[len("ref: ") :]
+            else:
+                return value
+        return None
+
+    def _PackedRefs(self):
+        """{ref: (sha, peeled_sha)} from the packed-refs file."""
+        refs = {}
+        packed_refs = os.path.join(self._common_dir, "packed-refs")
+        if not os.path.isfile(packed_refs):
+            return refs
+        last_ref = None
+        for line in self._ReadText(packed_refs).splitlines():
+            if line.startswith("#") or not line:
+                continue
+            elif line.startswith("^"):
+                refs[last_ref] = (refs[last_ref][0], line[1:])
+            else:
+                sha, last_ref = line.split(" ", 1)
+                refs[last_ref] = (sha, None)
+        return refs
+
+    def _TagsByCommit(self):
+        """{commit_sha: [(tag_name, is_annotated), ...]}"""
+        tag_refs = {
+            ref: shas
+            for ref, shas in self._PackedRefs().items()
+            if ref.startswith("refs/tags/")
+        }
+
+        tags_dir = os.path.join(self._common_dir, "refs", "tags")
+        for dirpath, _, filenames in os.walk(tags_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, tags_dir).replace(os.sep, "/")
+                sha = self._ReadText(path).strip()
+                tag_refs["refs/tags/" + name] = (sha, None)
+
+        tags = {}
+        for ref, (sha, peeled) in tag_refs.items():
+            obj_type, data = self.ReadObject(sha)
+            is_annotated = obj_type == b"tag"
+            while obj_type == b"tag":
+                sha = peeled or data.split(b"\n", 1)[0].split(b" ")[1].decode()
+                peeled = None
+                obj_type, data = self.ReadObject(sha)
+            if obj_type == b"commit":
+                name = ref[len("refs/tags/") :]
+                tags.setdefault(sha, []).append((name, is_annotated))
+        return tags
+
+    def _CommitParents(self, sha):
+        obj_type, data = self.ReadObject(sha)
+        if obj_type != b"commit":
+            raise ValueError(f"{sha} is not a commit")
+        parents = []
+        for line in data.split(b"\n\n", 1)[0].split(b"\n"):
+            if line.startswith(b"parent "):
+                parents.append(line[len(b"parent ") :].decode())
+        return parents
+
+    def _Abbrev(self, sha):
+        """Shortest unique prefix, with git's default length for the repo."""
+        # About 2^bits objects are expected to collide with 2^(bits/2)
+        # and an hexadecimal digit holds 4 bits: bits/2/4 rounded up.
+        count = sum(pack_index.count for pack_index in self._Packs())
+        bits = max(count.bit_length(), 1)
+        length = max(self.FALLBACK_DEFAULT_ABBREV, (bits + 1) // 2)
+        for other in self._ObjectsStartingWith(sha[:2]):
+            if other != sha:
+                common = len(os.path.commonprefix([sha, other]))
+                length = max(length, common + 1)
+        return sha[:length]
+
+    def _ObjectsStartingWith(self, prefix):
+        for objects in self._object_dirs:
+            loose_dir = os.path.join(objects, prefix)
+            if os.path.isdir(loose_dir):
+                for filename in os.listdir(loose_dir):
+                    yield prefix + filename
+        first_byte = int(prefix, 16)
+        for pack_index in self._Packs():
+            for i in range(*pack_index.FanoutRange(first_byte)):
+                yield pack_index.Name(i).hex()
+
+    def _Packs(self):
+        """[GitPackIndex(), ...] of all packs."""
+        if self._packs is not None:
+            return self._packs
+        self._packs = []
+        for objects in self._object_dirs:
+            pack_dir = os.path.join(objects, "pack")
+            if not os.path.isdir(pack_dir):
+                continue
+            for filename in sorted(os.listdir(pack_dir)):
+                if filename.endswith(".idx"):
+                    idx = os.path.join(pack_dir, filename)
+                    pack = idx[: -len(".idx")] + ".pack"
+                    data = self._ReadBinary(idx)
+                    self._packs.append(GitPackIndex(data, pack))
+        return self._packs
+
+    def ReadObject(self, sha):
+        """Return (type, data) of an object, e.g. (b"commit", b"tree ...")."""
+        for objects in self._object_dirs:
+            loose = os.path.join(objects, sha[:2], sha[2:])
+            if os.path.isfile(loose):
+                raw = zlib.decompress(self._ReadBinary(loose))
+                header, data = raw.split(b"\x00", 1)
+                return header.split(b" ")[0], data
+
+        name = bytes.fromhex(sha)
+        for pack_index in self._Packs():
+            offset = pack_index.Find(name)
+            if offset is not None:
+                with open(pack_index.pack, "rb") as fp:
+                    return self._ReadPackedObject(fp, offset)
+        raise KeyError(f"object {sha} not found")
+
+    def _ReadPackedObject(self, fp, offset):
+        fp.seek(offset)
+        byte = fp.read(1)[0]
+        obj_type = (byte >> 4) & 7
+        size = byte & 0x0F
+        shift = 4
+        while byte & 0x80:
+            byte = fp.read(1)[0]
+            size |= (byte & 0x7F) << shift
+            shift += 7
+
+        if obj_type == self.OBJ_OFS_DELTA:
+            byte = fp.read(1)[0]
+            base_offset = byte & 0x7F
+            while byte & 0x80:
+                byte = fp.read(1)[0]
+                base_offset = ((base_offset + 1) << 7) | (byte & 0x7F)
+            delta = self._Inflate(fp)
+            base_type, base = self._ReadPackedObject(fp, offset - base_offset)
+            return base_type, self._ApplyDelta(base, delta)
+        elif obj_type == self.OBJ_REF_DELTA:
+            base_sha = fp.read(20).hex()
+            delta = self._Inflate(fp)
+            base_type, base = self.ReadObject(base_sha)
+            return base_type, self._ApplyDelta(base, delta)
+        else:
+            return self.OBJ_TYPES[obj_type], self._Inflate(fp)
+
+    def _Inflate(self, fp):
+        decompressor = zlib.decompressobj()
+        data = b""
+        while not decompressor.eof:
+            chunk = fp.read(4096)
+            if not chunk:
+                raise ValueError("truncated pack")
+            data += decompressor.decompress(chunk)
+        return data
+
+    def _ApplyDelta(self, base, delta):
+        pos = 0
+        for _ in range(2):
+            # Skip source and target sizes
+            while delta[pos] & 0x80:
+                pos += 1
+            pos += 1
+
+        result = []
+        while pos < len(delta):
+            cmd = delta[pos]
+            pos += 1
+            if cmd & 0x80:
+                copy_offset = 0
+                copy_size = 0
+                for i in range(4):
+                    if cmd & (1 << i):
+                        copy_offset |= delta[pos] << (8 * i)
+                        pos += 1
+                for i in range(3):
+                    if cmd & (0x10 << i):
+                        copy_size |= delta[pos] << (8 * i)
+                        pos += 1
+                if copy_size == 0:
+                    copy_size = 0x10000
+                result.append(base[copy_offset : copy_offset + copy_size])
+            elif cmd:
+                result.append(delta[pos : pos + cmd])
+                pos += cmd
+            else:
+                raise ValueError("invalid delta")
+        return b"".join(result)
+
+    def IsIndexDirty(self):
+        """Same as "git diff-index --cached --quiet HEAD" or None."""
+        try:
+            if not self._IsSupported():
+                return None
+            return self._IsIndexDirty()
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            IndexError,
+            zlib.error,
+            struct.error,
+        ):
+            return None
+
+    def _IsIndexDirty(self):
+        head = self.ResolveRef("HEAD")
+        if head is None:
+            return None
+        obj_type, data = self.ReadObject(head)
+        head_tree = data.split(b"\n", 1)[0].split(b" ")[1].decode()
+
+        entries, root_tree = self._ReadIndex()
+        if entries is None:
+            return None
+        elif root_tree == head_tree:
+            # Valid cache-tree extension: no need to walk the HEAD tree.
+            return False
+        return entries != self._ReadTree(head_tree, "")
+
+    def _ReadIndex(self):
+        """Return ({path: (mode, sha)}, root_tree_sha or None)."""
+        data = self._ReadBinary(os.path.join(self._git_dir, "index"))
+        signature, version, count = struct.unpack(">4sII", data[:12])
+        if signature != b"DIRC" or version not in (2, 3):
+            return None, None
+
+        entries = {}
+        pos = 12
+        for _ in range(count):
+            mode = struct.unpack(">I", data[pos + 24 : pos + 28])[0]
+            sha = data[pos + 40 : pos + 60].hex()
+            flags = struct.unpack(">H", data[pos + 60 : pos + 62])[0]
+            name_start = pos + 62
+            if flags & 0x4000:
+                extended_flags = struct.unpack(">H", data[pos + 62 : pos + 64])[
+                    0
+                ]
+                if extended_flags & 0x2000:
+                    # Intent-to-add entries
+                    return None, None
+                name_start += 2
+            name_end = data.index(b"\x00", name_start)
+            path = data[name_start:name_end].decode()
+            if (flags >> 12) & 3 or mode == 0o40000:
+                # Unmerged or sparse directory entries
+                return None, None
+            entries[path] = (mode, sha)
+            entry_len = name_end - pos
+            pos += (entry_len + 8) & ~7
+
+        root_tree = None
+        while pos + 8 <= len(data) - 20:
+            signature, size = struct.unpack(">4sI", data[pos : pos + 8])
+            ext = data[pos + 8 : pos + 8 + size]
+            if signature == b"link":
+                return None, None
+            elif signature == b"TREE" and ext.startswith(b"\x00"):
+                header_end = ext.index(b"\n")
+                entry_count = int(ext[1:header_end].split(b" ")[0])
+                if entry_count >= 0:
+                    root_tree = ext[header_end + 1 : header_end + 21].hex()
+            pos += 8 + size
+
+        return entries, root_tree
+
+    def _ReadTree(self, sha, prefix):
+        entries = {}
+        obj_type, data = self.ReadObject(sha)
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\x00", space)
+            mode = int(data[pos:space], 8)
+            name = data[space + 1 : nul].decode()
+            entry_sha = data[nul + 1 : nul + 21].hex()
+            pos = nul + 21
+            if mode == 0o40000:
+                entries.update(self._ReadTree(entry_sha, prefix + name + "/"))
+            else:
+                entries[prefix + name] = (mode, entry_sha)
+        return entries
+
+
+class GitPackIndex:
+    """Look up objects in a version 2 pack index (.idx) by binary search."""
+
+    def __init__(self, data, pack=None):
+        if data[:8] != b"\xfftOc\x00\x00\x00\x02":
+            raise ValueError("unsupported pack index")
+        self._data = data
+        self._fanout = struct.unpack(">256I", data[8 : 8 + 1024])
+        self.count = self._fanout[255]
+        self._names_start = 8 + 1024
+        self._offsets_start = self._names_start + 24 * self.count
+        self._large_offsets_start = self._offsets_start + 4 * self.count
+        self.pack = pack
+
+    def FanoutRange(self, first_byte):
+        start = self._fanout[first_byte - 1] if first_byte else 0
+        return start, self._fanout[first_byte]
+
+    def Name(self, i):
+        start = self._names_start + 20 * i
+        return self._data[start : start + 20]
+
+    def Find(self, name):
+        """Return the pack offset of the object or None."""
+        low, high = self.FanoutRange(name[0])
+        while low < high:
+            mid = (low + high) // 2
+            mid_name = self.Name(mid)
+            if mid_name < name:
+                low = mid + 1
+            elif mid_name > name:
+                high = mid
+            else:
+                return self._Offset(mid)
+        return None
+
+    def _Offset(self, i):
+        start = self._offsets_start + 4 * i
+        (offset,) = struct.unpack(">I", self._data[start : start + 4])
+        if offset & 0x80000000:
+            start = self._large_offsets_start + 8 * (offset & 0x7FFFFFFF)
+            (offset,) = struct.unpack(">Q", self._data[start : start + 8])
+        return offset
+
+
+# Escape sequences of C string literals: octal, hexadecimal, universal
+# character names and simple (one character).
+CEscapeRegex = re.compile(
+    r"\\(?:([0-7]{1,3})|x([0-9A-Fa-f]+)|u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))",
+    re.DOTALL,
+)
+C_SIMPLE_ESCAPES = {
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+
+
+def CStringBytes(value):
+    """Bytes of the C string literal with the value (UTF-8), after the escape
+    sequences are processed, without the terminator. Other characters after a
+    backslash are themselves, as in GCC. Raise ValueError if an escape
+    sequence is out of range or the value ends with a backslash."""
+    data = b""
+    position = 0
+    for match in CEscapeRegex.finditer(value):
+        data += value[position : match.start()].encode()
+        position = match.end()
+        octal, hexadecimal, ucn4, ucn8, simple = match.groups()
+        if simple is not None:
+            data += C_SIMPLE_ESCAPES.get(simple, simple).encode()
+            continue
+        number = int(octal, 8) if octal is not None else None
+        if hexadecimal is not None:
+            number = int(hexadecimal, 16)
+        if number is not None:
+            if number > 0xFF:
+                raise ValueError(f"escape sequence out of range '{value}'")
+            data += bytes((number,))
+        else:
+            data += chr(int(ucn4 or ucn8, 16)).encode()
+    if "\\" in value[position:]:
+        raise ValueError(f"string ends with a backslash '{value}'")
+    return data + value[position:].encode()
+
+
+def _Synchronized(method):
+    """Decorator to run the method holding the instance lock."""
+
+    @functools.wraps(method)
+    def SynchronizedMethod(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return SynchronizedMethod
+
+
 class BuildInfo:
     INT_TYPES = (
         "int8",
@@ -188,20 +1257,111 @@ class BuildInfo:
         "double": (DOUBLE_MIN, DOUBLE_MAX),
     }
 
+    TYPE_SIZES = {
+        # "type": bytes
+        "int8": 1,
+        "int16": 2,
+        "int32": 4,
+        "int64": 8,
+        "uint8": 1,
+        "uint16": 2,
+        "uint32": 4,
+        "uint64": 8,
+        "float": 4,
+        "double": 8,
+        "bool": 1,
+    }
+    WORD_SIZES = (8, 16, 32, 64)
+
     ALLOWED_QUALIFIERS = "rw"
 
-    def __init__(self, filename_base=None, formatter=DefaultFormatter()):
-        self.Reset()
-        self.SetFilename(filename_base)
+    OPTIONS = {
+        # "Option": default
+        "Accessors": ("Len", "Ptr", "Get", "Set"),
+        "Function_Sections": False,
+        "Inline_Accessors": False,
+        "Header_Constants": False,
+        "Rodata_Section": False,
+        "Packed_Struct": False,
+        "Entry_Table": False,
+        "Name_Lookup": False,
+        "Image": False,
+        "Image_Endianness": "little",
+        "Image_Alignment": 8,
+        "Image_Delta": False,
+        "Tlv_Serialize": False,
+        "Target_Word_Size": None,
+        "Seqlock": None,
+        "Dirty_Tracking": False,
+        "String_Copy": "loop",
+        "String_Chunk_Size": None,
+        "String_Pool": False,
+    }
+    ENTRY_OPTIONS = (
+        "Accessors",
+        "Inline_Accessors",
+        "Header_Constants",
+        "Seqlock",
+        "String_Copy",
+        "String_Chunk_Size",
+    )
+    STRING_COPIES = ("loop", "memcpy")
+    SEQLOCKS = ("entry", "module")
+    IMAGE_ENDIANNESSES = ("little", "big")
+    IMAGE_ALIGNMENTS = (1, 2, 4, 8)
+    READ_ACCESSORS = ("Len", "Ptr", "Get")
+
+    GIT_BACKENDS = {
+        "gitpython": GitData,
+        "binary": GitBinaryData,
+        "python": GitDirData,
+    }
+    GIT_OPTIONS = (
+        "Directory",
+        "Dirty_Detection",
+        "Time_Budget",
+        "Backend",
+        "Path",
+    )
+
+    def __init__(self, filename_base=None, formatter=None):
+        """Configuration is set here and is never changed by processing.
+
+        Public methods hold an instance lock, so an instance can be shared by
+        threads. Instances do not share mutable state.
+        """
+        self._lock = threading.RLock()
+        self._default_filename_base = filename_base
+        if formatter is None:
+            formatter = DefaultFormatter()
         self._formatter = formatter
-        self._bool_integer = False
+        self.Reset()
 
+    @_Synchronized
     def Reset(self):
-        """Reset on initialization and when user calls."""
+        """Reset on initialization and when user calls.
+
+        All the state changed by processing is (re)initialized here.
+        """
         self._SemiReset()
+        self.SetFilename(self._default_filename_base)
+        self._bool_integer = False
+        self._errors = None
+        self._query_git = True
+        self._pending_git = None
+        self._options = dict(self.OPTIONS)
+        self._entry_options = {}
 
+        self._c_code_defines = []
         self._c_code_vars = []
+        self._h_code_defines = []
         self._c_code_funcs = []
+        self._images = []
+        self._tlv_fields = {}
+        self._features = []
+        self._code_ranges = []
+        self._string_pool = []
+        self._string_pool_section = ""
         self._h_code_macros = []
         self._h_code_funcs = []
 
@@ -211,13 +1371,21 @@ class BuildInfo:
     def _SemiReset(self):
         """_SemiReset when new object starts."""
         self.SetModuleName()
-
+        self._entries = []
+        self._entry_index = None
+        self._struct_extern = False
+        self._seq_module_extern = False
+        self._dirty_used = False
+        self._constants = []
+
+    @_Synchronized
     def SetModuleName(self, name=None):
         if name == None:
             self._module_name = self._GetDefaultModuleName()
         else:
             self._module_name = name
 
+    @_Synchronized
     def SetFilename(self, filename_base):
         self._filename_base = filename_base
 
@@ -229,7 +1397,9 @@ class BuildInfo:
             return "INFO"
         return self._module_name
 
+    @_Synchronized
     def ProcessJSON(self, json_data):
+        self._AssertNotProcessingAsync()
         data = json.loads(json_data)
 
         if type(data) is dict:
@@ -241,9 +1411,33 @@ class BuildInfo:
                 "json_data must have an object (dict) or an array of objects (list of dict)"
             )
 
+    @_Synchronized
+    def CheckJSON(self, json_data, query_git=False):
+        """Process json_data and return a list with all errors found.
+
+        Git repositories are queried only if query_git is True, which is
+        needed to use GetC() and GetH() afterwards.
+        """
+        self._errors = []
+        self._query_git = query_git
+        try:
+            self.ProcessJSON(json_data)
+        except ValueError as e:
+            self._errors.append(str(e))
+        finally:
+            errors = self._errors
+            self._errors = None
+            self._query_git = True
+        return errors
+
     def _ProcessJSONArray(self, data):
-        for obj in data:
-            self._ProcessJSONObject(obj)
+        for i, obj in enumerate(data):
+            try:
+                self._ProcessJSONObject(obj)
+            except ValueError as e:
+                if self._errors is None:
+                    raise
+                self._errors.append(f"object {i}: {e}")
 
     def _ProcessJSONObject(self, obj):
         if type(obj) is not dict:
@@ -253,17 +1447,113 @@ class BuildInfo:
 
         self._SemiReset()
 
+        code_ranges = []
         for raw_type_data, value in obj.items():
-            self._GenAndAddVariable(raw_type_data, value)
+            first = len(self._c_code_vars)
+            try:
+                self._GenAndAddVariable(raw_type_data, value)
+            except ValueError as e:
+                if self._errors is None:
+                    raise
+                self._errors.append(f"'{raw_type_data}': {e}")
             self._AddNewlineSeparators()
+            code_ranges.append((raw_type_data, first))
+
+        code_ranges.append(("(module)", len(self._c_code_vars)))
+        self._AddCode(self._GenModuleCode())
+        self._RepalceTags()
+
+        for raw_type_data, first in code_ranges:
+            self._code_ranges.append((self._module_name, raw_type_data, first))
+
+    async def ProcessJSONAsync(self, json_data):
+        """Same as ProcessJSON(), querying Git repositories concurrently.
+
+        Each query starts as soon as its Git_Repository key is processed and
+        the other entries of the object are generated meanwhile. The commit
+        string is inserted at the position of the key. The backends "binary"
+        and "python" run git as asyncio subprocesses, "gitpython" runs it in
+        the default executor of the event loop.
+        """
+        with self._lock:
+            self._AssertNotProcessingAsync()
+            data = json.loads(json_data)
+
+            if type(data) is dict:
+                data = [data]
+            elif type(data) is not list:
+                raise ValueError(
+                    "json_data must have an object (dict) or an array of objects (list of dict)"
+                )
 
+            self._pending_git = []
+            try:
+                for obj in data:
+                    await self._ProcessJSONObjectAsync(obj)
+            finally:
+                for _, task, _, _ in self._pending_git:
+                    task.cancel()
+                self._pending_git = None
+
+    def _AssertNotProcessingAsync(self):
+        """The lock is reentrant: other coroutines of the thread that runs
+        ProcessJSONAsync() would pass it while it awaits."""
+        if self._pending_git is not None:
+            raise RuntimeError("BuildInfo is already processing a JSON")
+
+    async def _ProcessJSONObjectAsync(self, obj):
+        if type(obj) is not dict:
+            raise ValueError(
+                "json_data must have an object (dict) or an array of objects (list of dict)"
+            )
+
+        self._SemiReset()
+
+        code_ranges = []
+        for raw_type_data, value in obj.items():
+            first = len(self._c_code_vars)
+            num_pending = len(self._pending_git)
+            self._GenAndAddVariable(raw_type_data, value)
+            self._AddNewlineSeparators()
+            code_ranges.append((raw_type_data, first))
+            if len(self._pending_git) != num_pending:
+                # Let the new task start git before generating the others.
+                await asyncio.sleep(0)
+
+        while self._pending_git:
+            index, task, options, entry_options = self._pending_git[0]
+            commit = await task
+            self._pending_git.pop(0)
+            # Generate it with the options of the position of the key.
+            current_options = self._options
+            self._options = options
+            self._entry_options = entry_options
+            self._entry_index = index
+            try:
+                code_data = self._GenVariable(
+                    "string[]:Git_Commit_Str", f"{commit}"
+                )
+            finally:
+                self._entry_index = None
+                self._entry_options = {}
+                self._options = current_options
+            self._SetCode(index, code_data)
+
+        code_ranges.append(("(module)", len(self._c_code_vars)))
+        self._AddCode(self._GenModuleCode())
         self._RepalceTags()
 
+        for raw_type_data, first in code_ranges:
+            self._code_ranges.append((self._module_name, raw_type_data, first))
+
     def _GenAndAddVariable(self, raw_type_data, value):
-        key_data = self._SplitTypeSizeNameMacro(raw_type_data)
-        code_data = self._GenCodeFromTypeSizeNameValueMacro(key_data, value)
+        code_data = self._GenVariable(raw_type_data, value)
         self._AddCode(code_data)
 
+    def _GenVariable(self, raw_type_data, value):
+        key_data = self._SplitTypeSizeNameMacro(raw_type_data)
+        return self._GenCodeFromTypeSizeNameValueMacro(key_data, value)
+
     def _SplitTypeSizeNameMacro(self, raw_type_data):
         key_data = KeyRegex.findall(raw_type_data)
         if len(key_data) != 1:
@@ -307,22 +1597,59 @@ class BuildInfo:
             raise ValueError(
                 f"a macro cannot use [] in the type '{raw_type_data}'"
             )
+        elif key_data.type == "feature" and (
+            key_data.size is not None or "w" in key_data.qualif
+        ):
+            raise ValueError(
+                f"a feature cannot use [] or :w in the type '{raw_type_data}'"
+            )
 
     def _GenCodeFromTypeSizeNameValueMacro(self, key_data, value):
         if key_data.type == "config":
             return self._ProcessConfig(key_data, value)
-        elif key_data.type == "string":
-            return self._GenString(key_data, value)
-        elif key_data.type in self.INT_TYPES:
-            return self._GenNumberWithUnderscoreT(key_data, value)
-        elif key_data.type in self.FLOAT_TYPES:
-            return self._GenNumber(key_data, value)
-        elif key_data.type == "bool":
-            return self._GenBool(key_data, value)
         elif key_data.type == "macro":
             return self._GenMacro(key_data, value)
-        else:
-            raise ValueError(f"invalid type '{key_data.type}'")
+        elif key_data.type == "feature":
+            return self._GenFeature(key_data, value)
+
+        if type(value) is dict:
+            value = self._SetEntryOptions(value)
+        try:
+            if key_data.size is not None and (
+                key_data.type in self.INT_TYPES
+                or key_data.type in self.FLOAT_TYPES
+            ):
+                return self._GenArray(key_data, value)
+            elif key_data.type == "string":
+                return self._GenString(key_data, value)
+            elif key_data.type in self.INT_TYPES:
+                return self._GenNumberWithUnderscoreT(key_data, value)
+            elif key_data.type in self.FLOAT_TYPES:
+                return self._GenNumber(key_data, value)
+            elif key_data.type == "bool":
+                return self._GenBool(key_data, value)
+            else:
+                raise ValueError(f"invalid type '{key_data.type}'")
+        finally:
+            self._entry_options = {}
+
+    def _SetEntryOptions(self, value):
+        """Entry as an object {"Value": VALUE, "Option": ...}: the options
+        apply only to the entry. Return the value."""
+        if "Value" not in value:
+            raise ValueError(f"entry object without Value '{value}'")
+        for option in value:
+            if option != "Value" and option not in self.ENTRY_OPTIONS:
+                raise ValueError(f"invalid entry option '{option}'")
+        self._entry_options = {
+            option: self._ValidateOption(option, option_value)
+            for option, option_value in value.items()
+            if option != "Value"
+        }
+        return value["Value"]
+
+    def _GetOption(self, option):
+        return self._entry_options.get(option, self._options[option])
 
     def _ProcessConfig(self, key_data, value):
         if key_data.name == "Section_Prefix":
@@ -341,6 +1668,8 @@ class BuildInfo:
             return self._ConfigTimeData(key_data, value)
         elif key_data.name == "Version":
             return self._ConfigVersion(key_data, value)
+        elif key_data.name in self.OPTIONS:
+            return self._ConfigOption(key_data, value)
         else:
             raise ValueError(f"invalid config '{key_data.name}'")
 
@@ -385,13 +1714,135 @@ class BuildInfo:
         return CodeData()
 
     def _ConfigGitCommitStr(self, key_data, value):
-        if type(value) is not str:
-            raise ValueError(f"invalid str '{value}'")
-        git_data = GitData()
-        commit = git_data.GetCommitString(value)
+        if type(value) is str:
+            value = {"Directory": value}
+        elif type(value) is not dict:
+            raise ValueError(f"invalid str or object '{value}'")
+
+        repository = value.get("Directory")
+        dirty_detection = value.get("Dirty_Detection", "full")
+        time_budget = value.get("Time_Budget")
+        backend = value.get("Backend", "gitpython")
+        path = value.get("Path")
+
+        if type(repository) is not str:
+            raise ValueError(f"invalid str Directory '{repository}'")
+        elif dirty_detection not in GitData.DIRTY_DETECTIONS:
+            raise ValueError(
+                f"invalid Dirty_Detection '{dirty_detection}',"
+                + f" should be one of {GitData.DIRTY_DETECTIONS}"
+            )
+        elif time_budget is not None and (
+            type(time_budget) not in (int, float) or time_budget <= 0
+        ):
+            raise ValueError(f"invalid Time_Budget '{time_budget}'")
+        elif path is not None and type(path) is not str:
+            raise ValueError(f"invalid str Path '{path}'")
+        elif backend not in self.GIT_BACKENDS:
+            raise ValueError(
+                f"invalid Backend '{backend}',"
+                + f" should be one of {tuple(self.GIT_BACKENDS)}"
+            )
+
+        for option in value:
+            if option not in self.GIT_OPTIONS:
+                raise ValueError(f"invalid Git_Repository option '{option}'")
+
+        git_data = self.GIT_BACKENDS[backend](
+            dirty_detection, time_budget, path
+        )
+        if not self._query_git:
+            return CodeData()
+        elif self._pending_git is not None:
+            # ProcessJSONAsync(): reserve the position of the commit string.
+            coroutine = git_data.GetCommitStringAsync(repository)
+            task = asyncio.ensure_future(coroutine)
+            options = (dict(self._options), dict(self._entry_options))
+            self._pending_git.append((len(self._c_code_vars), task, *options))
+            self._AddCode(CodeData())
+            return CodeData()
+        commit = git_data.GetCommitString(repository)
         self._GenAndAddVariable("string[]:Git_Commit_Str", f"{commit}")
         return CodeData()
 
+    def _ConfigOption(self, key_data, value):
+        """Options apply to the entries that follow, also in the next
+        objects."""
+        self._options[key_data.name] = self._ValidateOption(
+            key_data.name, value
+        )
+        return CodeData()
+
+    def _ValidateOption(self, option, value):
+        """Return the value of the option if it is valid."""
+        if option == "Accessors":
+            if type(value) is not list:
+                raise ValueError(f"invalid array '{value}'")
+            for accessor in value:
+                if accessor not in self.OPTIONS["Accessors"]:
+                    raise ValueError(
+                        f"invalid accessor '{accessor}',"
+                        + f" should be one of {self.OPTIONS['Accessors']}"
+                    )
+            return tuple(value)
+        elif option in (
+            "Function_Sections",
+            "Inline_Accessors",
+            "Header_Constants",
+            "Rodata_Section",
+            "Packed_Struct",
+            "Entry_Table",
+            "Name_Lookup",
+            "Image",
+            "Image_Delta",
+            "Tlv_Serialize",
+            "Dirty_Tracking",
+            "String_Pool",
+        ):
+            if type(value) is not bool:
+                raise ValueError(f"invalid bool '{value}'")
+            return value
+        elif option == "Target_Word_Size":
+            if value not in self.WORD_SIZES or type(value) is not int:
+                raise ValueError(
+                    f"invalid Target_Word_Size '{value}',"
+                    + f" should be one of {self.WORD_SIZES}"
+                )
+            return value
+        elif option == "Image_Endianness":
+            if value not in self.IMAGE_ENDIANNESSES:
+                raise ValueError(
+                    f"invalid Image_Endianness '{value}',"
+                    + f" should be one of {self.IMAGE_ENDIANNESSES}"
+                )
+            return value
+        elif option == "Image_Alignment":
+            if value not in self.IMAGE_ALIGNMENTS or type(value) is not int:
+                raise ValueError(
+                    f"invalid Image_Alignment '{value}',"
+                    + f" should be one of {self.IMAGE_ALIGNMENTS}"
+                )
+            return value
+        elif option == "Seqlock":
+            if value not in self.SEQLOCKS:
+                raise ValueError(
+                    f"invalid Seqlock '{value}',"
+                    + f" should be one of {self.SEQLOCKS}"
+                )
+            return value
+        elif option == "String_Copy":
+            if value not in self.STRING_COPIES:
+                raise ValueError(
+                    f"invalid String_Copy '{value}',"
+                    + f" should be one of {self.STRING_COPIES}"
+                )
+            return value
+        elif option == "String_Chunk_Size":
+            if type(value) is not int or value <= 0:
+                raise ValueError(f"invalid String_Chunk_Size '{value}'")
+            return value
+        raise ValueError(f"invalid option '{option}'")
+
     def _ConfigTimeData(self, key_data, value):
         if type(value) is not bool:
             raise ValueError(f"invalid bool '{value}'")
@@ -458,115 +1909,341 @@ class BuildInfo:
             raise ValueError(f"invalid string '{value}'")
 
         name_var = self._formatter.NameToGlobalVariable(key_data.name)
+        ref = self._StorageRef(key_data, name_var)
 
+        # The length of the C string, with the escape sequences processed
+        data = CStringBytes(value)
         if key_data.size in (None, True):
             size = ""
-        elif len(value) + 1 <= key_data.size:
+            length = len(data) + 1
+        elif len(data) + 1 <= key_data.size:
             size = str(key_data.size)
+            length = key_data.size
         else:
             raise ValueError(
                 f"string does not fit size={key_data.size} string='{value}'"
             )
 
-        if "r" in key_data.qualif:
+        if "w" in key_data.qualif:
             qualif = ""
         else:
-            qualif = ""
+            qualif = "const "
 
-        # Variable
-        variable = f'static {qualif}char <<MODULE_NAME>>{name_var}[{size}] = "{value}";\n'
+        # The pool is static in the C file, so these strings cannot be used
+        # by inline accessors in the header. The offsets in the pool are the
+        # lengths of the values, which are not the lengths of the C strings
+        # if they have escape sequences.
+        pool = None
+        if (
+            self._GetOption("String_Pool")
+            and "w" not in key_data.qualif
+            and key_data.size in (None, True)
+            and not self._GetOption("Inline_Accessors")
+            and "\\" not in value
+        ):
+            pool = len(self._string_pool)
+            self._string_pool.append(value.encode())
+            if self._GetOption("Function_Sections") or self._GetOption(
+                "Rodata_Section"
+            ):
+                self._AddCDefine(SECTION_MACRO)
+                self._string_pool_section = (
+                    f' BUILD_INFO_SECTION(".rodata.{STRING_POOL_NAME}")'
+                )
+
+        memcpy = self._GetOption("String_Copy") == "memcpy"
+        if memcpy:
+            self._AddInclude(self._c_code_includes, "<string.h>")
+            if self._GetOption("Inline_Accessors"):
+                self._AddInclude(self._h_code_includes, "<string.h>")
+
+        # Reads copy chunks in separate critical sections. If the string is
+        # writable, reads are retried when Set changes the version meanwhile.
+        # Set is not chunked: a read interrupting it would retry forever.
+        chunk_size = self._GetOption("String_Chunk_Size")
+        name_seq = self._SeqCounter(key_data)
+        seq = None if name_seq is None else f"<<MODULE_NAME>>{name_seq}"
+        chunked = (
+            memcpy
+            and chunk_size is not None
+            and length > chunk_size
+            and self._IsReadLocked(key_data)
+            and seq is None
+        )
+        versioned = chunked and "w" in key_data.qualif
+        name_version = self._formatter.NameToGlobalVariable(
+            f"{key_data.name}_Version"
+        )
+
+        accessors = []
 
         # Length
-        func_prefix = "Len"
-        name_func = self._formatter.NameToFunction(
-            f"{func_prefix}_{key_data.name}"
-        )
-        prototype1 = f"uint16_t <<MODULE_NAME>>{name_func}(void)"
-        header1 = f"{prototype1};\n"
-        function1 = f"""
-{prototype1} {{
-    return sizeof(<<MODULE_NAME>>{name_var});
-}}
+        name_func = self._FunctionName("Len", key_data)
+        prototype = f"uint16_t <<MODULE_NAME>>{name_func}(void)"
+        body = f"""
+    return sizeof({ref});
 """
+        accessors.append(Accessor("Len", name_func, prototype, body))
 
         # Ptr
-        func_prefix = "Ptr"
-        name_func = self._formatter.NameToFunction(
-            f"{func_prefix}_{key_data.name}"
-        )
-        prototype2 = f"const char *<<MODULE_NAME>>{name_func}(void)"
-        header2 = f"{prototype2};\n"
-        function2 = f"""
-{prototype2} {{
-    return &<<MODULE_NAME>>{name_var}[0];
-}}
+        name_func = self._FunctionName("Ptr", key_data)
+        prototype = f"const char *<<MODULE_NAME>>{name_func}(void)"
+        body = f"""
+    return &{ref}[0];
 """
+        accessors.append(Accessor("Ptr", name_func, prototype, body))
 
         # Get
-        func_prefix = "Get"
-        name_func = self._formatter.NameToFunction(
-            f"{func_prefix}_{key_data.name}"
-        )
-        prototype3 = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(char *buff_ptr, uint16_t len)"
-        header3 = f"{prototype3};\n"
-        function3 = f"""
-{prototype3} {{
-    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
-    uint16_t i;
-    const char *ptr = &<<MODULE_NAME>>{name_var}[0];
-    char *buff_end_ptr = &buff_ptr[len - 1];
+        name_func = self._FunctionName("Get", key_data)
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(char *buff_ptr, uint16_t len)"
+        if seq is not None:
+            body = self._GenStringGetSeqlock(ref, seq, memcpy)
+        elif chunked:
+            body = self._GenStringGetChunks(ref, name_version, versioned)
+        elif memcpy:
+            body = self._GenStringGetMemcpy(key_data, ref)
+        else:
+            body = self._GenStringGetLoop(key_data, ref)
+        accessors.append(Accessor("Get", name_func, prototype, body))
 
-    CRITICAL_BLOCK(
-        for (i = 0; i < sizeof(<<MODULE_NAME>>{name_var}); i++) {{
+        # Set
+        if "w" in key_data.qualif:
+            name_func = self._FunctionName("Set", key_data)
+            prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(const char *buff_ptr, uint16_t len)"
+            dirty = self._DirtyBit(key_data)
+            if memcpy:
+                body = self._GenStringSetMemcpy(
+                    ref, name_version if versioned else None, seq, dirty
+                )
+            else:
+                body = self._GenStringSetLoop(ref, seq, dirty)
+            accessors.append(Accessor("Set", name_func, prototype, body))
+
+        header, function, inline = self._GenAccessors(accessors)
+
+        # Variable
+        version = None
+        if versioned and header != "":
+            version = f"<<MODULE_NAME>>{name_version}"
+        if header == "":
+            name_seq = seq = None
+        entry = Entry(
+            key_data,
+            "char",
+            name_var,
+            ref,
+            f'"{value}"',
+            length,
+            version,
+            data=value,
+            seq=seq,
+        )
+        declaration, variable = self._GenEntryStorage(
+            entry,
+            f"{qualif}char <<MODULE_NAME>>{name_var}[{size}]",
+            f"{qualif}char <<MODULE_NAME>>{name_var}[{length}]",
+            header != "",
+            inline,
+            pool,
+        )
+        if versioned and header != "":
+            declaration_version, variable_version = self._GenStorage(
+                name_version,
+                f"uint16_t <<MODULE_NAME>>{name_version}",
+                f"uint16_t <<MODULE_NAME>>{name_version}",
+                "0",
+                inline,
+            )
+            declaration += declaration_version
+            variable += variable_version
+        declaration_seq, variable_seq = self._GenSeqStorage(name_seq, inline)
+        header = declaration + declaration_seq + header
+        variable += variable_seq
+        macro = self._GenConstant(key_data, length, "_Len")
+
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
+
+    def _GenStringGetLoop(self, key_data, ref):
+        copy = f"""\
+        for (i = 0; i < sizeof({ref}); i++) {{
             if (i >= len) {{
                 success = <<BOOL_FALSE>>;
                 break;
             }}
             *buff_ptr++ = *ptr++;
         }}
-    );
+"""
+        copy = self._GenCriticalBlock(copy, self._IsReadLocked(key_data))
+        return f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+    uint16_t i;
+    const char *ptr = &{ref}[0];
+    char *buff_end_ptr = &buff_ptr[len - 1];
 
+{copy}
     *buff_end_ptr = 0;
     return success;
-}}
 """
 
-        # Set
-        if "w" in key_data.qualif:
-            func_prefix = "Set"
-            name_func = self._formatter.NameToFunction(
-                f"{func_prefix}_{key_data.name}"
-            )
-            prototype4 = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(const char *buff_ptr, uint16_t len)"
-            header4 = f"{prototype4};\n"
-            function4 = f"""
-{prototype4} {{
-    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
-    uint16_t i;
-    char *ptr = &<<MODULE_NAME>>{name_var}[0];
-
-    CRITICAL_BLOCK(
+    def _GenStringSetLoop(self, ref, seq=None, dirty=None):
+        copy = f"""\
         for (i = 0; i < len; i++) {{
-            if (i >= sizeof(<<MODULE_NAME>>{name_var})) {{
+            if (i >= sizeof({ref})) {{
                 success = <<BOOL_FALSE>>;
                 break;
             }}
             *ptr++ = *buff_ptr++;
         }}
-    );
+"""
+        terminate = f"    {ref}[sizeof({ref}) - 1] = 0;\n"
+        if seq is not None:
+            # Readers must not see the string without the terminator.
+            copy += "    " + terminate
+            terminate = ""
+        return f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+    uint16_t i;
+    char *ptr = &{ref}[0];
+
+{self._GenWriteBlock(copy, seq, dirty)}
+{terminate}    return success;
+"""
+
+    def _GenStringGetMemcpy(self, key_data, ref):
+        """Copy up to the terminator, the same result of the loop."""
+        copy = f"""\
+        n = strlen({ref}) + 1;
+        if (n > len) {{
+            n = len;
+        }}
+        memcpy(buff_ptr, {ref}, n);
+"""
+        copy = self._GenCriticalBlock(copy, self._IsReadLocked(key_data))
+        return f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+    size_t n;
+
+    if (len == 0) {{
+        return <<BOOL_FALSE>>;
+    }} else if (len < sizeof({ref})) {{
+        success = <<BOOL_FALSE>>;
+    }}
 
-    <<MODULE_NAME>>{name_var}[sizeof(<<MODULE_NAME>>{name_var}) - 1] = 0;
+{copy}
+    buff_ptr[len - 1] = 0;
     return success;
-}}
+"""
+
+    def _GenStringGetSeqlock(self, ref, seq, memcpy):
+        """Copy without locking, repeated if Set changed the string
+        meanwhile. The string may have no terminator during the copy."""
+        if memcpy:
+            declarations = "    const char *end_ptr;\n    size_t n;\n"
+            copy = f"""\
+        end_ptr = (const char *)memchr({ref}, 0, sizeof({ref}));
+        n = end_ptr != NULL ? (size_t)(end_ptr - {ref}) + 1 : sizeof({ref});
+        if (n > len) {{
+            n = len;
+        }}
+        memcpy(buff_ptr, {ref}, n);
+"""
+        else:
+            declarations = "    uint16_t i;\n"
+            copy = f"""\
+        for (i = 0; i < sizeof({ref}) && i < len; i++) {{
+            buff_ptr[i] = {ref}[i];
+        }}
+"""
+        return f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+{declarations}    {self._SeqType()} seq;
+
+    if (len == 0) {{
+        return <<BOOL_FALSE>>;
+    }} else if (len < sizeof({ref})) {{
+        success = <<BOOL_FALSE>>;
+    }}
+
+{self._GenSeqlockRead(copy, seq)}
+    buff_ptr[len - 1] = 0;
+    return success;
+"""
+
+    def _GenStringGetChunks(self, ref, name_version, versioned):
+        """Copy chunks of String_Chunk_Size bytes up to the terminator."""
+        chunk_size = self._GetOption("String_Chunk_Size")
+        copy = f"""\
+        for (i = 0; i < max; i += n) {{
+            n = max - i < {chunk_size} ? max - i : {chunk_size};
+            CRITICAL_BLOCK(
+                memcpy(&buff_ptr[i], &{ref}[i], n);
+            );
+            if (memchr(&buff_ptr[i], 0, n) != NULL) {{
+                break;
+            }}
+        }}
+"""
+        if versioned:
+            declarations = "    uint16_t version;\n    <<BOOL_TYPE>> retry;\n"
+            copy = f"""\
+    do {{
+        CRITICAL_BLOCK(
+            version = <<MODULE_NAME>>{name_version};
+        );
+{copy}        CRITICAL_BLOCK(
+            retry = version != <<MODULE_NAME>>{name_version};
+        );
+    }} while (retry);
 """
         else:
-            header4 = ""
-            function4 = ""
+            declarations = ""
+            copy = re.sub("^    ", "", copy, flags=re.MULTILINE)
+        return f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+{declarations}    size_t i;
+    size_t n;
+    size_t max = sizeof({ref});
+
+    if (len == 0) {{
+        return <<BOOL_FALSE>>;
+    }} else if (len < max) {{
+        success = <<BOOL_FALSE>>;
+        max = len;
+    }}
+
+{copy}
+    buff_ptr[len - 1] = 0;
+    return success;
+"""
 
-        header = header1 + header2 + header3 + header4
-        function = function1 + function2 + function3 + function4
+    def _GenStringSetMemcpy(self, ref, name_version, seq=None, dirty=None):
+        """Copy up to the terminator, the same result of the loop."""
+        copy = f"""\
+        memcpy({ref}, buff_ptr, n);
+        {ref}[sizeof({ref}) - 1] = 0;
+"""
+        if name_version is not None:
+            copy += f"        <<MODULE_NAME>>{name_version}++;\n"
+        return f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+    const char *end_ptr = (const char *)memchr(buff_ptr, 0, len);
+    size_t n = len;
+
+    if (end_ptr != NULL) {{
+        n = (size_t)(end_ptr - buff_ptr) + 1;
+    }}
+    if (len > sizeof({ref})) {{
+        success = <<BOOL_FALSE>>;
+        if (n > sizeof({ref})) {{
+            n = sizeof({ref});
+        }}
+    }}
 
-        return CodeData(header=header, variable=variable, function=function)
+{self._GenWriteBlock(copy, seq, dirty)}
+    return success;
+"""
 
     def _GenNumberWithUnderscoreT(self, key_data, value):
         return self._GenNumber(key_data, value, add_undersdore_t=True)
@@ -591,120 +2268,1455 @@ class BuildInfo:
                 f"invalid number type or value type={key_data.type} {value=}"
             )
 
-        name_var = self._formatter.NameToGlobalVariable(key_data.name)
-
         if add_undersdore_t:
-            key_data = key_data._replace(type=key_data.type + "_t")
+            c_type = key_data.type + "_t"
+        else:
+            c_type = key_data.type
+
+        return self._GenScalar(key_data, c_type, value)
+
+    def _GenBool(self, key_data, value):
+        if type(value) is not bool:
+            raise ValueError(f"invalid bool '{value}'")
+
+        text = "<<BOOL_TRUE>>" if value else "<<BOOL_FALSE>>"
+
+        return self._GenScalar(key_data, "<<BOOL_TYPE>>", text, value)
 
-        if "r" in key_data.qualif:
+    def _GenScalar(self, key_data, c_type, value, data=None):
+        """Variable and Get/Set functions of a number or a bool."""
+        name_var = self._formatter.NameToGlobalVariable(key_data.name)
+        ref = self._StorageRef(key_data, name_var)
+
+        if "w" in key_data.qualif:
             qualif = ""
         else:
-            qualif = ""
+            qualif = "const "
 
-        # Variable
-        variable = f"static {qualif}{key_data.type} <<MODULE_NAME>>{name_var} = {value};\n"
+        name_seq = self._SeqCounter(key_data)
+        seq = None if name_seq is None else f"<<MODULE_NAME>>{name_seq}"
+
+        accessors = []
 
         # Get
-        func_prefix = "Get"
-        name_func = self._formatter.NameToFunction(
-            f"{func_prefix}_{key_data.name}"
-        )
-        prototype1 = f"{key_data.type} <<MODULE_NAME>>{name_func}(void)"
-        header1 = f"{prototype1};\n"
-        function1 = f"""
-{prototype1} {{
-    {key_data.type} val;
+        name_func = self._FunctionName("Get", key_data)
+        prototype = f"{c_type} <<MODULE_NAME>>{name_func}(void)"
+        if "w" not in key_data.qualif and not self._IsReadLocked(key_data):
+            body = f"""
+    return {ref};
+"""
+        elif not self._IsAccessLocked(key_data):
+            body = f"""
+    return *(volatile {c_type} *)&{ref};
+"""
+        elif seq is not None:
+            copy = self._GenSeqlockRead(f"        val = {ref};\n", seq)
+            body = f"""
+    {c_type} val;
+    {self._SeqType()} seq;
+
+{copy}
+    return val;
+"""
+        else:
+            body = f"""
+    {c_type} val;
 
     CRITICAL_BLOCK(
-        val = <<MODULE_NAME>>{name_var};
+        val = {ref};
     );
 
     return val;
-}}
 """
+        accessors.append(Accessor("Get", name_func, prototype, body))
 
         # Set
         if "w" in key_data.qualif:
-            func_prefix = "Set"
-            name_func = self._formatter.NameToFunction(
-                f"{func_prefix}_{key_data.name}"
-            )
-            prototype2 = f"void <<MODULE_NAME>>{name_func}({key_data.type} val)"
-            header2 = f"{prototype2};\n"
-            function2 = f"""
-{prototype2} {{
-    CRITICAL_BLOCK(
-        <<MODULE_NAME>>{name_var} = val;
-    );
-}}
+            name_func = self._FunctionName("Set", key_data)
+            prototype = f"void <<MODULE_NAME>>{name_func}({c_type} val)"
+            dirty = self._DirtyBit(key_data)
+            if not self._IsAccessLocked(key_data) and dirty is None:
+                body = f"""
+    *(volatile {c_type} *)&{ref} = val;
 """
-        else:
-            header2 = ""
-            function2 = ""
-
-        header = header1 + header2
-        function = function1 + function2
-
-        return CodeData(header=header, variable=variable, function=function)
+            else:
+                write = self._GenWriteBlock(
+                    f"        {ref} = val;\n", seq, dirty
+                )
+                body = f"""
+{write}"""
+            accessors.append(Accessor("Set", name_func, prototype, body))
 
-    def _GenBool(self, key_data, value):
-        if type(value) is not bool:
-            raise ValueError(f"invalid bool '{value}'")
+        header, function, inline = self._GenAccessors(accessors)
 
-        name_var = self._formatter.NameToGlobalVariable(key_data.name)
+        # Variable
+        if data is None:
+            data = value
+        if header == "":
+            name_seq = seq = None
+        entry = Entry(
+            key_data, c_type, name_var, ref, value, None, data=data, seq=seq
+        )
+        declaration, variable = self._GenEntryStorage(
+            entry,
+            f"{qualif}{c_type} <<MODULE_NAME>>{name_var}",
+            f"{qualif}{c_type} <<MODULE_NAME>>{name_var}",
+            header != "",
+            inline,
+        )
+        declaration_seq, variable_seq = self._GenSeqStorage(name_seq, inline)
+        header = declaration + declaration_seq + header
+        variable += variable_seq
 
-        value = "<<BOOL_TRUE>>" if value else "<<BOOL_FALSE>>"
+        # Constant
+        if "w" in key_data.qualif:
+            macro = ""
+        elif c_type in self.FLOAT_TYPES:
+            macro = self._GenConstant(key_data, f"(({c_type}){value})")
+        elif key_data.type in self.INT_TYPES:
+            macro = self._GenConstant(
+                key_data, self._IntLiteral(key_data, value)
+            )
+        else:
+            macro = self._GenConstant(key_data, value)
 
-        if "r" in key_data.qualif:
-            qualif = ""
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
+
+    def _GenConstant(self, key_data, value, suffix="_Val"):
+        """Define with a value known when generating the code, if the option
+        Header_Constants is set. The compiler can fold it and #if can use it.
+
+        The suffix keeps the define from having the name of the variable
+        when the name of the entry is in upper case."""
+        if not self._GetOption("Header_Constants"):
+            return ""
+        name_macro = self._formatter.NameToMacro(key_data.name + suffix)
+        self._constants.append(name_macro)
+        return f"#define <<MODULE_NAME>>{name_macro} {value}\n"
+
+    def _IntLiteral(self, key_data, value):
+        """Integer literal with the sign of the type, usable in #if."""
+        if key_data.type.startswith("u"):
+            return f"{value}u"
+        elif value == self.INT_LIMITS["int64"][0]:
+            # The literal 9223372036854775808 does not fit int64_t
+            return f"({value + 1} - 1)"
+        elif value < 0:
+            return f"({value})"
+        return str(value)
+
+    def _GenArray(self, key_data, value):
+        """Array of numbers, its Get/Set functions of one element and of a
+        range of elements."""
+        if type(value) is not list:
+            raise ValueError(f"invalid array '{value}'")
+        elif key_data.size is True:
+            length = len(value)
+        elif len(value) != key_data.size:
+            raise ValueError(
+                f"array has {len(value)} values, not size={key_data.size}"
+            )
         else:
+            length = key_data.size
+        if length == 0 or length > 0xFFFF:
+            raise ValueError(f"invalid array size {length}")
+        self._ValidateArray(key_data.type, value)
+
+        if key_data.type in self.INT_TYPES:
+            c_type = key_data.type + "_t"
+        else:
+            c_type = key_data.type
+        name_var = self._formatter.NameToGlobalVariable(key_data.name)
+        ref = self._StorageRef(key_data, name_var)
+
+        if "w" in key_data.qualif:
             qualif = ""
+        else:
+            qualif = "const "
 
-        # Variable
-        variable = f"static {qualif}<<BOOL_TYPE>> <<MODULE_NAME>>{name_var} = {value};\n"
+        read_locked = self._IsReadLocked(key_data)
+        write_locked = "w" in key_data.qualif
+        dirty = self._DirtyBit(key_data)
+
+        accessors = []
+
+        # Length
+        name_func = self._FunctionName("Len", key_data)
+        prototype = f"uint16_t <<MODULE_NAME>>{name_func}(void)"
+        body = f"""
+    return {length};
+"""
+        accessors.append(Accessor("Len", name_func, prototype, body))
+
+        # Ptr
+        name_func = self._FunctionName("Ptr", key_data)
+        prototype = f"const {c_type} *<<MODULE_NAME>>{name_func}(void)"
+        body = f"""
+    return &{ref}[0];
+"""
+        accessors.append(Accessor("Ptr", name_func, prototype, body))
 
         # Get
-        func_prefix = "Get"
-        name_func = self._formatter.NameToFunction(
-            f"{func_prefix}_{key_data.name}"
+        name_func = self._FunctionName("Get", key_data)
+        prototype = f"{c_type} <<MODULE_NAME>>{name_func}(uint16_t index)"
+        if "w" not in key_data.qualif and not read_locked:
+            copy = f"        val = {ref}[index];\n"
+        elif not self._IsAccessLocked(key_data):
+            copy = f"        val = *(volatile {c_type} *)&{ref}[index];\n"
+        else:
+            copy = f"        val = {ref}[index];\n"
+        copy = self._GenCriticalBlock(
+            copy, self._IsAccessLocked(key_data) and read_locked
         )
-        prototype1 = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(void)"
-        header1 = f"{prototype1};\n"
-        function1 = f"""
-{prototype1} {{
-    <<BOOL_TYPE>> val;
+        body = f"""
+    {c_type} val;
 
-    CRITICAL_BLOCK(
-        val = <<MODULE_NAME>>{name_var};
-    );
+    if (index >= {length}) {{
+        return 0;
+    }}
 
+{copy}
     return val;
-}}
 """
+        accessors.append(Accessor("Get", name_func, prototype, body))
+
+        name_func = self._FunctionName("Get_Range", key_data)
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(uint16_t first, uint16_t count, {c_type} *buff_ptr)"
+        copy = f"""\
+        memcpy(buff_ptr, &{ref}[first], count * sizeof({ref}[0]));
+"""
+        body = f"""
+    if (first > {length} || count > {length} - first) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+{self._GenCriticalBlock(copy, write_locked)}
+    return <<BOOL_TRUE>>;
+"""
+        accessors.append(Accessor("Get", name_func, prototype, body))
 
         # Set
-        if "w" in key_data.qualif:
-            func_prefix = "Set"
-            name_func = self._formatter.NameToFunction(
-                f"{func_prefix}_{key_data.name}"
-            )
-            prototype2 = f"void <<MODULE_NAME>>{name_func}(<<BOOL_TYPE>> val)"
-            header2 = f"{prototype2};\n"
-            function2 = f"""
-{prototype2} {{
+        if write_locked:
+            name_func = self._FunctionName("Set", key_data)
+            prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(uint16_t index, {c_type} val)"
+            if not self._IsAccessLocked(key_data) and dirty is None:
+                write = f"""\
+    *(volatile {c_type} *)&{ref}[index] = val;
+"""
+            else:
+                write = self._GenWriteBlock(
+                    f"        {ref}[index] = val;\n", None, dirty
+                )
+            body = f"""
+    if (index >= {length}) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+{write}
+    return <<BOOL_TRUE>>;
+"""
+            accessors.append(Accessor("Set", name_func, prototype, body))
+
+            name_func = self._FunctionName("Set_Range", key_data)
+            prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(uint16_t first, uint16_t count, const {c_type} *buff_ptr)"
+            write = self._GenWriteBlock(
+                f"        memcpy(&{ref}[first], buff_ptr, count * sizeof({ref}[0]));\n",
+                None,
+                dirty,
+            )
+            body = f"""
+    if (first > {length} || count > {length} - first) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+{write}
+    return <<BOOL_TRUE>>;
+"""
+            accessors.append(Accessor("Set", name_func, prototype, body))
+
+        header, function, inline = self._GenAccessors(accessors)
+        if "Get" in self._GetOption("Accessors") or (
+            write_locked and "Set" in self._GetOption("Accessors")
+        ):
+            self._AddInclude(self._c_code_includes, "<string.h>")
+            if inline:
+                self._AddInclude(self._h_code_includes, "<string.h>")
+
+        # Variable
+        values = "{" + ", ".join(str(element) for element in value) + "}"
+        entry = Entry(
+            key_data, c_type, name_var, ref, values, length, data=value
+        )
+        declaration, variable = self._GenEntryStorage(
+            entry,
+            f"{qualif}{c_type} <<MODULE_NAME>>{name_var}[{length}]",
+            f"{qualif}{c_type} <<MODULE_NAME>>{name_var}[{length}]",
+            header != "",
+            inline,
+        )
+        header = declaration + header
+        macro = self._GenConstant(key_data, length, "_Len")
+
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
+
+    def _ValidateArray(self, entry_type, values):
+        """Check all the values in one pass and report every invalid one."""
+        if entry_type in self.INT_TYPES:
+            low, high = self.INT_LIMITS[entry_type]
+            invalid = [
+                index
+                for index, element in enumerate(values)
+                if type(element) is not int or not low <= element < high
+            ]
+        else:
+            low, high = self.FLOAT_LIMITS[entry_type]
+            invalid = [
+                index
+                for index, element in enumerate(values)
+                if type(element) not in (float, int)
+                or not low <= element <= high
+            ]
+        if len(invalid) != 0:
+            raise ValueError(
+                f"invalid values of type {entry_type} at indexes {invalid}: "
+                + ", ".join(f"'{values[index]}'" for index in invalid)
+            )
+
+    def _StorageRef(self, key_data, name_var):
+        """C expression of the storage of the entry."""
+        if self._IsInStruct(key_data):
+            name_struct = self._formatter.NameToGlobalVariable("Config")
+            return f"<<MODULE_NAME>>{name_struct}.{name_var}"
+        return f"<<MODULE_NAME>>{name_var}"
+
+    def _IsInStruct(self, key_data):
+        return "w" in key_data.qualif and self._GetOption("Packed_Struct")
+
+    def _GenEntryStorage(
+        self, entry, definition, declaration, used, extern, pool=None
+    ):
+        """Record the entry of the module and return the declaration for the
+        header and the variable for the C file.
+
+        Entries in the struct of the option Packed_Struct and strings in the
+        pool of the option String_Pool (pool is their index) have no variable
+        and entries without accessors need none."""
+        if self._IsInStruct(entry.key_data):
+            self._AddEntry(entry)
+            self._struct_extern = self._struct_extern or extern
+            return "", ""
+        elif (
+            not used
+            and not self._IsEntryTable()
+            and not self._GetOption("Tlv_Serialize")
+        ):
+            self._AddEntry(entry._replace(stored=False))
+            if pool is not None:
+                self._string_pool[pool] = None
+            return "", ""
+        self._AddEntry(entry)
+        if pool is not None:
+            # The name of the variable is the string in the pool
+            return (
+                "",
+                f"#define {entry.ref} (*(const char (*)[{entry.length}])"
+                + f"&{STRING_POOL_NAME}[<<STRING_POOL_{pool}>>])\n",
+            )
+        read_only = "w" not in entry.key_data.qualif
+        return self._GenStorage(
+            entry.name_var,
+            definition,
+            declaration,
+            entry.value,
+            extern,
+            read_only,
+        )
+
+    def _AddEntry(self, entry):
+        """Entries are kept in the order of the JSON object. Git_Commit_Str
+        generated by ProcessJSONAsync() goes to the position of its key."""
+        if self._entry_index is None:
+            index = len(self._c_code_vars)
+        else:
+            index = self._entry_index
+        self._entries.append(entry._replace(index=index))
+
+    def _ModuleEntries(self):
+        return sorted(self._entries, key=lambda entry: entry.index)
+
+    def _GenModuleCode(self):
+        """Code of the whole module (object), generated after its entries."""
+        for entry in self._ModuleEntries():
+            if entry.stored and entry.name_var in self._constants:
+                raise ValueError(
+                    f"define '{entry.name_var}' of Header_Constants has the"
+                    + " name of a variable"
+                )
+        code = CodeData()
+        for code_data in (
+            self._GenDirty(),
+            self._GenSeqModule(),
+            self._GenPackedStruct(),
+            self._GenEntryTable(),
+            self._GenTlv(),
+            self._GenImage(),
+        ):
+            code = CodeData(*map(str.__add__, code, code_data))
+        return code
+
+    def _GenEntryTable(self):
+        """Entry IDs, table describing the entries and functions to access
+        them by ID."""
+        if not self._IsEntryTable():
+            return CodeData()
+        entries = [entry for entry in self._ModuleEntries() if entry.stored]
+        if len(entries) == 0:
+            return CodeData()
+
+        self._AddHDefine(ENTRY_TYPE_DEFINES)
+        self._AddInclude(self._c_code_includes, "<string.h>")
+
+        name_count = self._formatter.NameToMacro("Id_Count")
+        name_type = (
+            f"<<MODULE_NAME>>{self._formatter.NameToGlobalVariable('Id')}_t"
+        )
+        name_table = self._formatter.NameToGlobalVariable("Entries")
+
+        ids = ""
+        labels = []
+        for entry in entries:
+            name_id = self._formatter.NameToMacro(f"Id_{entry.key_data.name}")
+            ids += f"    <<MODULE_NAME>>{name_id},\n"
+            labels.append(f"<<MODULE_NAME>>{name_id}")
+        descriptors = self._GenEntryDescriptors(entries)
+        versions_before = self._GenVersionSwitch(entries, labels, before=True)
+        versions = self._GenVersionSwitch(entries, labels)
+        dirty = self._GenMarkDirty("id") if self._dirty_used else ""
+
+        macro = f"""
+typedef enum {{
+{ids}    <<MODULE_NAME>>{name_count}
+}} {name_type};
+
+extern const BuildInfo_Entry_t <<MODULE_NAME>>{name_table}[<<MODULE_NAME>>{name_count}];
+"""
+        variable = f"""
+const BuildInfo_Entry_t <<MODULE_NAME>>{name_table}[<<MODULE_NAME>>{name_count}] = {{
+{descriptors}}};
+"""
+
+        functions = []
+
+        # Get
+        name_func = self._formatter.NameToFunction("Get_By_Id")
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}({name_type} id, void *buff_ptr, uint16_t len)"
+        body = f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+    const BuildInfo_Entry_t *entry;
+    uint16_t size;
+
+    if ((unsigned)id >= <<MODULE_NAME>>{name_count} || len == 0) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    entry = &<<MODULE_NAME>>{name_table}[id];
+    size = entry->size;
+    if (entry->type == BUILD_INFO_TYPE_STRING) {{
+        if (len < size) {{
+            success = <<BOOL_FALSE>>;
+            size = len;
+        }}
+    }} else if (len < size) {{
+        return <<BOOL_FALSE>>;
+    }}
+
     CRITICAL_BLOCK(
-        <<MODULE_NAME>>{name_var} = val;
+        memcpy(buff_ptr, entry->address, size);
     );
+
+    if (entry->type == BUILD_INFO_TYPE_STRING) {{
+        ((char *)buff_ptr)[size - 1] = 0;
+    }}
+    return success;
+"""
+        functions.append(Accessor("Get", name_func, prototype, body))
+
+        # Set
+        name_func = self._formatter.NameToFunction("Set_By_Id")
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}({name_type} id, const void *buff_ptr, uint16_t len)"
+        body = f"""
+    <<BOOL_TYPE>> success = <<BOOL_TRUE>>;
+    const BuildInfo_Entry_t *entry;
+    char *ptr;
+    uint16_t size;
+
+    if ((unsigned)id >= <<MODULE_NAME>>{name_count}) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    entry = &<<MODULE_NAME>>{name_table}[id];
+    if ((entry->flags & BUILD_INFO_FLAG_WRITABLE) == 0) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    ptr = (char *)entry->address;
+    size = entry->size;
+    if (entry->type == BUILD_INFO_TYPE_STRING) {{
+        if (len > size) {{
+            success = <<BOOL_FALSE>>;
+        }} else {{
+            size = len;
+        }}
+    }} else if (len != size) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    CRITICAL_BLOCK(
+{versions_before}        memcpy(ptr, buff_ptr, size);
+        if (entry->type == BUILD_INFO_TYPE_STRING) {{
+            ptr[entry->size - 1] = 0;
+        }}
+{dirty}{versions}    );
+
+    return success;
+"""
+        functions.append(Accessor("Set", name_func, prototype, body))
+
+        if self._GetOption("Name_Lookup"):
+            code = self._GenNameLookup(entries, name_type)
+            macro += code.macro
+            variable += code.variable
+            functions += code.function
+
+        header, function = self._GenModuleFunctions(functions)
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
+
+    def _GenEntryDescriptors(self, entries):
+        """Initializers of the BuildInfo_Entry_t of the entries."""
+        descriptors = ""
+        for entry in entries:
+            entry_type = self._formatter.NameToMacro(entry.key_data.type)
+            if "w" in entry.key_data.qualif:
+                flags = "BUILD_INFO_FLAG_WRITABLE"
+            else:
+                flags = "0"
+            descriptors += f"    {{&{entry.ref}, sizeof({entry.ref}), BUILD_INFO_TYPE_{entry_type}, {flags}}},\n"
+        return descriptors
+
+    def _GenVersionSwitch(self, entries, labels, indent=8, before=False):
+        """Switch on the variable id incrementing the version counter of the
+        strings copied in chunks and the sequence counter of the option
+        Seqlock, indented for a CRITICAL_BLOCK. Empty if there is none.
+
+        Sequence counters are incremented before and after the write."""
+        cases = ""
+        for entry, label in zip(entries, labels):
+            if entry.seq is not None and before:
+                code = f"{entry.seq}++;\n    MEMORY_BARRIER();"
+            elif entry.seq is not None:
+                code = f"MEMORY_BARRIER();\n    {entry.seq}++;"
+            elif entry.version is not None and not before:
+                code = f"{entry.version}++;"
+            else:
+                continue
+            cases += f"""\
+case {label}:
+    {code}
+    break;
+"""
+        if cases == "":
+            return ""
+        code = f"""\
+switch (id) {{
+{cases}default:
+    break;
 }}
 """
+        return "".join(
+            " " * indent + line for line in code.splitlines(keepends=True)
+        )
+
+    def _GenTlv(self):
+        """Functions to serialize all the entries of the module in TLV
+        records (ID, length and value) and to deserialize them."""
+        if not self._GetOption("Tlv_Serialize"):
+            return CodeData()
+        entries = [entry for entry in self._ModuleEntries() if entry.stored]
+        if len(entries) == 0:
+            return CodeData()
+        if len(entries) > 256:
+            raise ValueError(
+                f"too many entries for Tlv_Serialize {len(entries)} > 256"
+            )
+
+        self._AddHDefine(ENTRY_TYPE_DEFINES)
+        self._AddInclude(self._c_code_includes, "<string.h>")
+
+        name_table = self._formatter.NameToGlobalVariable("Entries")
+        name_max = self._formatter.NameToMacro("Tlv_Max_Size")
+
+        max_size = 0
+        fields = []
+        for entry in entries:
+            if entry.key_data.type == "string":
+                size = entry.length - 1
+            else:
+                size = self.TYPE_SIZES[entry.key_data.type]
+                size *= entry.length or 1
+            if size > 255:
+                raise ValueError(
+                    f"entry too large for Tlv_Serialize {entry.key_data.name}"
+                    + f" {size} > 255"
+                )
+            max_size += 2 + size
+            fields.append(
+                (entry.key_data.name, entry.key_data.type, entry.length)
+            )
+        self._tlv_fields[self._module_name] = fields
+
+        macro = f"""
+#define <<MODULE_NAME>>{name_max} {max_size}
+"""
+        variable = ""
+        if not self._IsEntryTable():
+            variable = f"""
+static const BuildInfo_Entry_t <<MODULE_NAME>>{name_table}[{len(entries)}] = {{
+{self._GenEntryDescriptors(entries)}}};
+"""
+        ids = range(len(entries))
+        versions_before = self._GenVersionSwitch(entries, ids, 12, True)
+        versions = self._GenVersionSwitch(entries, ids, 12)
+        dirty = ""
+        if self._dirty_used:
+            dirty = "    " + self._GenMarkDirty("id")
+
+        functions = []
+
+        # Serialize
+        name_func = self._formatter.NameToFunction("Serialize")
+        prototype = f"uint16_t <<MODULE_NAME>>{name_func}(uint8_t *buff_ptr, uint16_t len)"
+        body = f"""
+    const BuildInfo_Entry_t *entry;
+    uint16_t size = 0;
+    uint16_t n;
+    uint16_t id;
+
+    if (len < <<MODULE_NAME>>{name_max}) {{
+        return 0;
+    }}
+
+    CRITICAL_BLOCK(
+        for (id = 0; id < {len(entries)}; id++) {{
+            entry = &<<MODULE_NAME>>{name_table}[id];
+            n = entry->size;
+            if (entry->type == BUILD_INFO_TYPE_STRING) {{
+                n = (uint16_t)strlen((const char *)entry->address);
+            }}
+            buff_ptr[size++] = (uint8_t)id;
+            buff_ptr[size++] = (uint8_t)n;
+            memcpy(&buff_ptr[size], entry->address, n);
+            size += n;
+        }}
+    );
+
+    return size;
+"""
+        functions.append(Accessor("Serialize", name_func, prototype, body))
+
+        # Deserialize
+        name_func = self._formatter.NameToFunction("Deserialize")
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(const uint8_t *buff_ptr, uint16_t len)"
+        body = f"""
+    const BuildInfo_Entry_t *entry;
+    uint16_t i;
+    uint16_t n = 0;
+    uint16_t id;
+
+    /* Check all the records before changing the entries. */
+    for (i = 0; i < len; i += 2 + n) {{
+        if (len - i < 2) {{
+            return <<BOOL_FALSE>>;
+        }}
+        id = buff_ptr[i];
+        n = buff_ptr[i + 1];
+        if (len - i - 2 < n) {{
+            return <<BOOL_FALSE>>;
+        }}
+        if (id >= {len(entries)}) {{
+            continue;
+        }}
+        entry = &<<MODULE_NAME>>{name_table}[id];
+        if (entry->type == BUILD_INFO_TYPE_STRING ? n >= entry->size : n != entry->size) {{
+            return <<BOOL_FALSE>>;
+        }}
+    }}
+
+    CRITICAL_BLOCK(
+        for (i = 0; i < len; i += 2 + n) {{
+            id = buff_ptr[i];
+            n = buff_ptr[i + 1];
+            if (id >= {len(entries)}) {{
+                continue;
+            }}
+            entry = &<<MODULE_NAME>>{name_table}[id];
+            if ((entry->flags & BUILD_INFO_FLAG_WRITABLE) == 0) {{
+                continue;
+            }}
+{versions_before}            memcpy((uint8_t *)entry->address, &buff_ptr[i + 2], n);
+            if (entry->type == BUILD_INFO_TYPE_STRING) {{
+                ((char *)entry->address)[n] = 0;
+            }}
+{dirty}{versions}        }}
+    );
+
+    return <<BOOL_TRUE>>;
+"""
+        functions.append(Accessor("Deserialize", name_func, prototype, body))
+
+        header, function = self._GenModuleFunctions(functions)
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
+
+    def _IsEntryTable(self):
+        return self._GetOption("Entry_Table") or self._GetOption("Name_Lookup")
+
+    def _GenNameLookup(self, entries, name_type):
+        """Minimal perfect hash of the entry names (hash and displace) and the
+        function to find the ID of an entry by its name.
+
+        The function is returned in the field function of CodeData as a list
+        of Accessor."""
+        self._AddCDefine(NAME_HASH_FUNCTION)
+
+        names = [entry.key_data.name for entry in entries]
+        displacements, slots = self._PerfectHash(names)
+
+        name_count = self._formatter.NameToMacro("Id_Count")
+        name_names = self._formatter.NameToGlobalVariable("Names")
+        name_displacements = self._formatter.NameToGlobalVariable(
+            "Name_Displacements"
+        )
+        name_slots = self._formatter.NameToGlobalVariable("Name_Slots")
+
+        macro = f"""
+extern const char *const <<MODULE_NAME>>{name_names}[<<MODULE_NAME>>{name_count}];
+"""
+        variable = f"""
+const char *const <<MODULE_NAME>>{name_names}[<<MODULE_NAME>>{name_count}] = {{
+{"".join(f'    "{name}",{chr(10)}' for name in names)}}};
+
+static const int32_t <<MODULE_NAME>>{name_displacements}[{len(names)}] = {{
+{"".join(f"    {value},{chr(10)}" for value in displacements)}}};
+
+static const uint16_t <<MODULE_NAME>>{name_slots}[{len(names)}] = {{
+{"".join(f"    {value},{chr(10)}" for value in slots)}}};
+"""
+
+        name_func = self._formatter.NameToFunction("Id_By_Name")
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(const char *name, {name_type} *id_ptr)"
+        body = f"""
+    int32_t displacement;
+    uint16_t slot;
+
+    displacement = <<MODULE_NAME>>{name_displacements}[BuildInfo_NameHash(0, name) % {len(names)}U];
+    if (displacement < 0) {{
+        slot = (uint16_t)(-displacement - 1);
+    }} else {{
+        slot = (uint16_t)(BuildInfo_NameHash((uint32_t)displacement, name) % {len(names)}U);
+    }}
+
+    if (strcmp(name, <<MODULE_NAME>>{name_names}[<<MODULE_NAME>>{name_slots}[slot]]) != 0) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    *id_ptr = ({name_type})<<MODULE_NAME>>{name_slots}[slot];
+    return <<BOOL_TRUE>>;
+"""
+        function = [Accessor("Get", name_func, prototype, body)]
+        return CodeData(macro=macro, variable=variable, function=function)
+
+    @staticmethod
+    def _NameHash(seed, name):
+        """FNV-1a hash of the name with the final mix of MurmurHash3, same as
+        BuildInfo_NameHash() in C. The seed replaces the offset basis, if not
+        zero."""
+        value = seed if seed != 0 else 2166136261
+        for byte in name.encode():
+            value = ((value ^ byte) * 16777619) & 0xFFFFFFFF
+        value ^= value >> 16
+        value = (value * 0x85EBCA6B) & 0xFFFFFFFF
+        value ^= value >> 13
+        value = (value * 0xC2B2AE35) & 0xFFFFFFFF
+        value ^= value >> 16
+        return value
+
+    @classmethod
+    def _PerfectHash(cls, names):
+        """Minimal perfect hash of the names, by hash and displace.
+
+        Names are put in buckets by their hash with seed zero. Starting from
+        the largest bucket, a displacement (seed) is searched to place all its
+        names in free slots. Buckets with one name go to a free slot directly,
+        stored as -slot-1.
+
+        Return the displacement of each bucket and the index of the name in
+        each slot."""
+        size = len(names)
+        buckets = [[] for _ in range(size)]
+        for index, name in enumerate(names):
+            buckets[cls._NameHash(0, name) % size].append(index)
+
+        displacements = [0] * size
+        slots = [None] * size
+        order = sorted(range(size), key=lambda b: len(buckets[b]), reverse=True)
+        for bucket in order:
+            if len(buckets[bucket]) <= 1:
+                break
+            for seed in range(1, 1 << 20):
+                positions = [
+                    cls._NameHash(seed, names[index]) % size
+                    for index in buckets[bucket]
+                ]
+                if len(set(positions)) == len(positions) and all(
+                    slots[position] is None for position in positions
+                ):
+                    break
+            else:
+                raise ValueError(
+                    "Could not generate perfect hash of names " + str(names)
+                )
+            displacements[bucket] = seed
+            for index, position in zip(buckets[bucket], positions):
+                slots[position] = index
+
+        free = [slot for slot in range(size) if slots[slot] is None]
+        for bucket in order:
+            if len(buckets[bucket]) == 1:
+                slot = free.pop()
+                displacements[bucket] = -slot - 1
+                slots[slot] = buckets[bucket][0]
+        return displacements, slots
+
+    def _GenImage(self):
+        """Binary image with the values of the entries of the module, its
+        layout for the manifest and the C struct to map it in place."""
+        if not self._GetOption("Image") and not self._GetOption("Image_Delta"):
+            return CodeData()
+        entries = self._ModuleEntries()
+        if len(entries) == 0:
+            return CodeData()
+
+        endianness = self._GetOption("Image_Endianness")
+        alignment = self._GetOption("Image_Alignment")
+        byte_order = "<" if endianness == "little" else ">"
+
+        self._AddHDefine(IMAGE_HEADER_DEFINES)
+        self._AddCDefine(CRC32_FUNCTION)
+
+        name_type = (
+            f"<<MODULE_NAME>>{self._formatter.NameToGlobalVariable('Image')}_t"
+        )
+        name_hash = self._formatter.NameToMacro("Image_Layout_Hash")
+
+        payload = b""
+        members = ""
+        layout = []
+        manifest = []
+        offset = IMAGE_HEADER_SIZE
+        for entry in entries:
+            entry_type = entry.key_data.type
+            if entry_type == "string":
+                size = entry.length
+                data = CStringBytes(entry.data).ljust(size, b"\0")
+                array = f"[{size}]"
+                align = 1
+            elif entry.length is not None:
+                size = self.TYPE_SIZES[entry_type] * entry.length
+                data = struct.pack(
+                    f"{byte_order}{entry.length}{IMAGE_FORMATS[entry_type]}",
+                    *entry.data,
+                )
+                array = f"[{entry.length}]"
+                align = min(self.TYPE_SIZES[entry_type], alignment)
+            else:
+                size = self.TYPE_SIZES[entry_type]
+                data = struct.pack(
+                    byte_order + IMAGE_FORMATS[entry_type], entry.data
+                )
+                array = ""
+                align = min(size, alignment)
+
+            padding = -offset % align
+            if padding != 0:
+                members += f"    uint8_t pad_{offset}[{padding}];\n"
+                payload += b"\0" * padding
+                offset += padding
+
+            members += f"    {entry.c_type} {entry.name_var}{array};\n"
+            payload += data
+            layout.append(f"{entry.name_var}:{entry_type}{array}@{offset}")
+            manifest.append(
+                {
+                    "name": entry.key_data.name,
+                    "type": entry_type,
+                    "offset": offset,
+                    "size": size,
+                    "writable": "w" in entry.key_data.qualif,
+                }
+            )
+            offset += size
+
+        padding = -offset % alignment
+        if padding != 0:
+            members += f"    uint8_t pad_{offset}[{padding}];\n"
+            payload += b"\0" * padding
+            offset += padding
+
+        layout.append(endianness)
+        layout_hash = zlib.crc32(";".join(layout).encode())
+        crc = zlib.crc32(payload)
+        header = struct.pack(
+            byte_order + "4I", IMAGE_MAGIC, layout_hash, len(payload), crc
+        )
+        if len(self._images) == 0:
+            image_offset = 0
         else:
-            header2 = ""
-            function2 = ""
+            last = self._images[-1]
+            image_offset = last["offset"] + last["size"]
+            image_offset += -image_offset % 8
+        self._images.append(
+            {
+                "module": self._module_name,
+                "offset": image_offset,
+                "endianness": endianness,
+                "alignment": alignment,
+                "size": offset,
+                "layout_hash": f"0x{layout_hash:08X}",
+                "crc": f"0x{crc:08X}",
+                "entries": manifest,
+                "image": header + payload,
+            }
+        )
+
+        packed = " BUILD_INFO_PACKED" if alignment < 8 else ""
+        macro = f"""
+typedef struct{packed} {{
+    BuildInfo_Image_Header_t header;
+{members}}} {name_type};
+
+typedef char <<MODULE_NAME>>{self._formatter.NameToGlobalVariable('Image_Size_Check')}[sizeof({name_type}) == {offset} ? 1 : -1];
+
+#define <<MODULE_NAME>>{name_hash} 0x{layout_hash:08X}UL
+"""
+
+        name_func = self._formatter.NameToFunction("Map_Image")
+        prototype = f"const {name_type} *<<MODULE_NAME>>{name_func}(const void *address, uint32_t size)"
+        body = f"""
+    const {name_type} *image = (const {name_type} *)address;
+
+    if (size < sizeof({name_type}) ||
+        image->header.magic != BUILD_INFO_IMAGE_MAGIC ||
+        image->header.layout_hash != <<MODULE_NAME>>{name_hash} ||
+        image->header.size != sizeof({name_type}) - sizeof(BuildInfo_Image_Header_t) ||
+        image->header.crc != BuildInfo_Crc32((const uint8_t *)address + sizeof(BuildInfo_Image_Header_t), image->header.size)) {{
+        return 0;
+    }}
+
+    return image;
+"""
+        functions = [Accessor("Map", name_func, prototype, body)]
+
+        variable = ""
+        if self._GetOption("Image_Delta"):
+            names = [entry.name_var for entry in entries]
+            code = self._GenImageDelta(name_type, name_hash, names)
+            macro += code.macro
+            variable += code.variable
+            functions += code.function
+
+        header, function = self._GenModuleFunctions(functions)
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
 
-        header = header1 + header2
-        function = function1 + function2
+    def _GenImageDelta(self, name_type, name_hash, names):
+        """Table with the offset and size of the entries in the image and the
+        function to apply a delta (generated by GetImageDelta()) in place.
 
-        return CodeData(header=header, variable=variable, function=function)
+        The function is returned in the field function of CodeData as a list
+        of Accessor."""
+        self._AddHDefine(DELTA_HEADER_DEFINES)
+        self._AddInclude(self._c_code_includes, "<stddef.h>")
+        self._AddInclude(self._c_code_includes, "<string.h>")
+
+        name_fields = self._formatter.NameToGlobalVariable("Image_Fields")
+        fields = "".join(
+            f"    {{offsetof({name_type}, {name}), sizeof((({name_type} *)0)->{name})}},\n"
+            for name in names
+        )
+        variable = f"""
+static const BuildInfo_Image_Field_t <<MODULE_NAME>>{name_fields}[{len(names)}] = {{
+{fields}}};
+"""
+
+        name_func = self._formatter.NameToFunction("Apply_Delta")
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(void *address, const uint8_t *delta, uint32_t delta_size)"
+        body = f"""
+    {name_type} *image = ({name_type} *)address;
+    BuildInfo_Delta_Header_t header;
+    const uint8_t *record;
+    const uint8_t *end;
+    uint32_t crc;
+    uint16_t id;
+    uint16_t i;
+
+    if (delta_size < sizeof(header) + sizeof(crc)) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    memcpy(&header, delta, sizeof(header));
+    if (header.magic != BUILD_INFO_DELTA_MAGIC ||
+        header.size < sizeof(header) + sizeof(crc) ||
+        header.size > delta_size ||
+        header.layout_hash != <<MODULE_NAME>>{name_hash} ||
+        image->header.layout_hash != <<MODULE_NAME>>{name_hash} ||
+        image->header.crc != header.base_crc) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    end = delta + header.size - sizeof(crc);
+    memcpy(&crc, end, sizeof(crc));
+    if (crc != BuildInfo_Crc32(delta, header.size - sizeof(crc))) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    /* Check all the records before changing the image. */
+    record = delta + sizeof(header);
+    for (i = 0; i < header.count; i++) {{
+        if (end - record < (ptrdiff_t)sizeof(id)) {{
+            return <<BOOL_FALSE>>;
+        }}
+        memcpy(&id, record, sizeof(id));
+        record += sizeof(id);
+        if (id >= {len(names)} || end - record < (ptrdiff_t)<<MODULE_NAME>>{name_fields}[id].size) {{
+            return <<BOOL_FALSE>>;
+        }}
+        record += <<MODULE_NAME>>{name_fields}[id].size;
+    }}
+    if (record != end) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+    record = delta + sizeof(header);
+    for (i = 0; i < header.count; i++) {{
+        memcpy(&id, record, sizeof(id));
+        record += sizeof(id);
+        memcpy((uint8_t *)address + <<MODULE_NAME>>{name_fields}[id].offset, record, <<MODULE_NAME>>{name_fields}[id].size);
+        record += <<MODULE_NAME>>{name_fields}[id].size;
+    }}
+
+    /* The image is not valid if the result is not the expected. */
+    image->header.crc = header.crc;
+    return BuildInfo_Crc32((const uint8_t *)address + sizeof(BuildInfo_Image_Header_t), image->header.size) == header.crc;
+"""
+        function = [Accessor("Apply", name_func, prototype, body)]
+        return CodeData(variable=variable, function=function)
+
+    def _GenPackedStruct(self):
+        """Struct with the writable entries of the module, ordered by size to
+        avoid padding, and the functions to copy it as a whole."""
+        entries = [
+            entry
+            for entry in self._ModuleEntries()
+            if self._IsInStruct(entry.key_data)
+        ]
+        if len(entries) == 0:
+            return CodeData()
+        entries.sort(
+            key=lambda entry: -self.TYPE_SIZES.get(entry.key_data.type, 0)
+        )
+
+        name_struct = self._formatter.NameToGlobalVariable("Config")
+        name_type = f"<<MODULE_NAME>>{name_struct}_t"
+        name_block_type = f"<<MODULE_NAME>>{self._formatter.NameToGlobalVariable('Config_Block')}_t"
+        name_hash = self._formatter.NameToMacro("Config_Layout_Hash")
+        name_defaults = self._formatter.NameToMacro("Config_Defaults")
+
+        members = ""
+        values = []
+        layout = []
+        for entry in entries:
+            array = "" if entry.length is None else f"[{entry.length}]"
+            members += f"    {entry.c_type} {entry.name_var}{array};\n"
+            values.append(f"{entry.value}")
+            layout.append(f"{entry.name_var}:{entry.key_data.type}{array}")
+        layout_hash = zlib.crc32(";".join(layout).encode())
+
+        macro = f"""
+typedef struct {{
+{members}}} {name_type};
+
+typedef struct {{
+    uint32_t layout_hash;
+    {name_type} config;
+}} {name_block_type};
+
+#define <<MODULE_NAME>>{name_hash} 0x{layout_hash:08X}UL
+#define <<MODULE_NAME>>{name_defaults} {{{", ".join(values)}}}
+"""
+
+        accessors = []
+
+        # Snapshot
+        name_func = self._formatter.NameToFunction("Snapshot_Config")
+        prototype = f"void <<MODULE_NAME>>{name_func}({name_type} *config)"
+        body = f"""
+    CRITICAL_BLOCK(
+        *config = <<MODULE_NAME>>{name_struct};
+    );
+"""
+        accessors.append(Accessor("Snapshot", name_func, prototype, body))
+        name_snapshot = name_func
+
+        # Save
+        name_func = self._formatter.NameToFunction("Save_Config")
+        prototype = f"void <<MODULE_NAME>>{name_func}({name_block_type} *block)"
+        body = f"""
+    block->layout_hash = <<MODULE_NAME>>{name_hash};
+    <<MODULE_NAME>>{name_snapshot}(&block->config);
+"""
+        accessors.append(Accessor("Save", name_func, prototype, body))
+
+        # Load
+        write_block = self._GenStructWriteBlock(
+            f"        <<MODULE_NAME>>{name_struct} = block->config;\n", entries
+        )
+        name_func = self._formatter.NameToFunction("Load_Config")
+        prototype = f"<<BOOL_TYPE>> <<MODULE_NAME>>{name_func}(const {name_block_type} *block)"
+        body = f"""
+    if (block->layout_hash != <<MODULE_NAME>>{name_hash}) {{
+        return <<BOOL_FALSE>>;
+    }}
+
+{write_block}
+    return <<BOOL_TRUE>>;
+"""
+        accessors.append(Accessor("Load", name_func, prototype, body))
+
+        # Reset
+        write_block = self._GenStructWriteBlock(
+            f"        <<MODULE_NAME>>{name_struct} = defaults;\n", entries
+        )
+        name_func = self._formatter.NameToFunction("Reset_Config")
+        prototype = f"void <<MODULE_NAME>>{name_func}(void)"
+        body = f"""
+    static const {name_type} defaults = <<MODULE_NAME>>{name_defaults};
+
+{write_block}"""
+        accessors.append(Accessor("Reset", name_func, prototype, body))
+
+        header, function = self._GenModuleFunctions(accessors)
+
+        section = self._GenSection("data", name_struct)
+        definition = f"{name_type} <<MODULE_NAME>>{name_struct}{section} = <<MODULE_NAME>>{name_defaults};\n"
+        if self._struct_extern:
+            macro += f"\nextern {name_type} <<MODULE_NAME>>{name_struct};\n"
+            variable = definition
+        else:
+            variable = f"static {definition}"
+
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
+
+    def _GenStructWriteBlock(self, code, entries):
+        """Wrap the code (indented by 8 spaces) writing the whole struct in
+        CRITICAL_BLOCK() as the setters of its entries do: their version
+        counters are incremented and their dirty bits are set. Entries in the
+        struct have no sequence counter of the option Seqlock, their reads
+        are locked."""
+        for entry in entries:
+            if entry.version is not None:
+                code += f"        {entry.version}++;\n"
+            dirty = self._DirtyBit(entry.key_data)
+            if dirty is not None:
+                code += self._GenMarkDirty(dirty)
+        return self._GenCriticalBlock(code, True)
+
+    def _GenModuleFunctions(self, functions):
+        """Header and C code of functions of the module, which are always
+        generated and are never inline."""
+        header = ""
+        function = ""
+        for accessor in functions:
+            header_function, function_function = self._GenFunction(accessor)
+            header += header_function
+            function += function_function
+        return header, function
+
+    def _IsReadLocked(self, key_data):
+        """Reads of read-only entries need no critical section if the option
+        Target_Word_Size is set."""
+        if self._GetOption("Target_Word_Size") is None:
+            return True
+        return "w" in key_data.qualif and self._IsAccessLocked(key_data)
+
+    def _IsAccessLocked(self, key_data):
+        """Scalars no wider than the option Target_Word_Size are read and
+        written atomically."""
+        word_size = self._GetOption("Target_Word_Size")
+        if word_size is None or key_data.type not in self.TYPE_SIZES:
+            return True
+        return 8 * self.TYPE_SIZES[key_data.type] > word_size
+
+    def _DirtyBit(self, key_data):
+        """Macro with the bit of the entry in the dirty bitmap of the option
+        Dirty_Tracking, or None."""
+        if not self._GetOption("Dirty_Tracking") or "w" not in key_data.qualif:
+            return None
+        self._dirty_used = True
+        name_bit = self._formatter.NameToMacro(f"Dirty_{key_data.name}")
+        return f"<<MODULE_NAME>>{name_bit}"
+
+    def _GenMarkDirty(self, bit):
+        """Set the bit in the dirty bitmap, indented for a CRITICAL_BLOCK."""
+        name_dirty = self._formatter.NameToGlobalVariable("Dirty")
+        return f"        <<MODULE_NAME>>{name_dirty}[{bit} / 32] |= (uint32_t)1 << ({bit} % 32);\n"
+
+    def _GenDirty(self):
+        """Dirty bitmap of the module, the bit of each writable entry (its ID
+        in the order of the JSON, the same of Entry_Table) and the functions
+        to find and clear the dirty entries."""
+        if not self._dirty_used:
+            return CodeData()
+        entries = [entry for entry in self._ModuleEntries() if entry.stored]
+
+        name_dirty = self._formatter.NameToGlobalVariable("Dirty")
+        name_count = self._formatter.NameToMacro("Dirty_Count")
+
+        macro = "\n"
+        for id, entry in enumerate(entries):
+            if "w" in entry.key_data.qualif:
+                name_bit = self._formatter.NameToMacro(
+                    f"Dirty_{entry.key_data.name}"
+                )
+                macro += f"#define <<MODULE_NAME>>{name_bit} {id}\n"
+        macro += f"#define <<MODULE_NAME>>{name_count} {len(entries)}\n"
+
+        variable = f"""
+static uint32_t <<MODULE_NAME>>{name_dirty}[{(len(entries) + 31) // 32}];
+"""
+
+        functions = []
+
+        # Next
+        name_func = self._formatter.NameToFunction("Next_Dirty")
+        prototype = f"uint16_t <<MODULE_NAME>>{name_func}(uint16_t id)"
+        body = f"""
+    uint32_t word;
+
+    while (id < <<MODULE_NAME>>{name_count}) {{
+        CRITICAL_BLOCK(
+            word = <<MODULE_NAME>>{name_dirty}[id / 32];
+        );
+        word >>= id % 32;
+        if (word == 0) {{
+            id = (uint16_t)((id / 32 + 1) * 32);
+            continue;
+        }}
+        while ((word & 1) == 0) {{
+            word >>= 1;
+            id++;
+        }}
+        return id;
+    }}
+
+    return <<MODULE_NAME>>{name_count};
+"""
+        functions.append(Accessor("Next", name_func, prototype, body))
+
+        # Clear
+        name_func = self._formatter.NameToFunction("Clear_Dirty")
+        prototype = f"void <<MODULE_NAME>>{name_func}(uint16_t id)"
+        body = f"""
+    if (id >= <<MODULE_NAME>>{name_count}) {{
+        return;
+    }}
+
+    CRITICAL_BLOCK(
+        <<MODULE_NAME>>{name_dirty}[id / 32] &= ~((uint32_t)1 << (id % 32));
+    );
+"""
+        functions.append(Accessor("Clear", name_func, prototype, body))
+
+        header, function = self._GenModuleFunctions(functions)
+        return CodeData(
+            macro=macro, header=header, variable=variable, function=function
+        )
+
+    def _SeqCounter(self, key_data):
+        """Name of the sequence counter of the option Seqlock protecting the
+        entry, or None. Only writable entries that would lock reads have one,
+        except members of the struct of Packed_Struct."""
+        seqlock = self._GetOption("Seqlock")
+        if (
+            seqlock is None
+            or "w" not in key_data.qualif
+            or self._IsInStruct(key_data)
+        ):
+            return None
+        if key_data.type != "string" and not self._IsAccessLocked(key_data):
+            return None
+        if seqlock == "module":
+            return self._formatter.NameToGlobalVariable("Seq")
+        return self._formatter.NameToGlobalVariable(f"{key_data.name}_Seq")
+
+    def _SeqType(self):
+        """Sequence counters are no wider than the option Target_Word_Size,
+        to be read atomically."""
+        word_size = self._GetOption("Target_Word_Size")
+        if word_size is None or word_size >= 32:
+            return "uint32_t"
+        return f"uint{word_size}_t"
+
+    def _GenSeqStorage(self, name_seq, inline):
+        """Declaration and variable of the sequence counter of an entry. The
+        counter of the module is generated with the module."""
+        if name_seq is None:
+            return "", ""
+        elif name_seq == self._formatter.NameToGlobalVariable("Seq"):
+            self._seq_module_extern = self._seq_module_extern or inline
+            return "", ""
+        return self._GenStorage(
+            name_seq,
+            f"volatile {self._SeqType()} <<MODULE_NAME>>{name_seq}",
+            f"volatile {self._SeqType()} <<MODULE_NAME>>{name_seq}",
+            "0",
+            inline,
+        )
+
+    def _GenSeqModule(self):
+        """Sequence counter shared by the entries of the module."""
+        name_seq = self._formatter.NameToGlobalVariable("Seq")
+        seq = f"<<MODULE_NAME>>{name_seq}"
+        if all(entry.seq != seq for entry in self._entries):
+            return CodeData()
+        declaration, variable = self._GenStorage(
+            name_seq,
+            f"volatile {self._SeqType()} <<MODULE_NAME>>{name_seq}",
+            f"volatile {self._SeqType()} <<MODULE_NAME>>{name_seq}",
+            "0",
+            self._seq_module_extern,
+        )
+        return CodeData(macro=declaration, variable=variable)
+
+    def _GenSeqlockRead(self, code, seq):
+        """Repeat the code (indented by 8 spaces) until no write happens
+        meanwhile. The function declares the variable seq."""
+        return f"""\
+    do {{
+        seq = {seq};
+        MEMORY_BARRIER();
+{code}        MEMORY_BARRIER();
+    }} while ((seq & 1) != 0 || seq != {seq});
+"""
+
+    def _GenWriteBlock(self, code, seq, dirty=None):
+        """Wrap the code (indented by 8 spaces) in CRITICAL_BLOCK(). The
+        sequence counter, if any, is odd while the code runs. The dirty bit,
+        if any, is set."""
+        if dirty is not None:
+            code += self._GenMarkDirty(dirty)
+        if seq is not None:
+            code = f"""\
+        {seq}++;
+        MEMORY_BARRIER();
+{code}        MEMORY_BARRIER();
+        {seq}++;
+"""
+        return self._GenCriticalBlock(code, True)
+
+    def _GenCriticalBlock(self, code, locked):
+        """Wrap the code (indented by 8 spaces) in CRITICAL_BLOCK()."""
+        if locked:
+            return f"    CRITICAL_BLOCK(\n{code}    );\n"
+        return re.sub("^    ", "", code, flags=re.MULTILINE)
+
+    def _FunctionName(self, func_prefix, key_data):
+        return self._formatter.NameToFunction(f"{func_prefix}_{key_data.name}")
+
+    def _GenAccessors(self, accessors):
+        """Header and C code of the accessors selected by the option
+        Accessors, and if any of them is inline in the header.
+
+        Functions are placed in their own sections if the option
+        Function_Sections is set. Read accessors are static inline functions
+        in the header if the option Inline_Accessors is set."""
+        header = ""
+        function = ""
+        inline = False
+        for accessor in accessors:
+            if accessor.prefix not in self._GetOption("Accessors"):
+                continue
+            elif accessor.prefix in self.READ_ACCESSORS and self._GetOption(
+                "Inline_Accessors"
+            ):
+                header += f"\nstatic inline {accessor.prototype} {{{accessor.body}}}\n"
+                inline = True
+                continue
+            header_function, function_function = self._GenFunction(accessor)
+            header += header_function
+            function += function_function
+        return header, function, inline
+
+    def _GenFunction(self, accessor):
+        """Prototype for the header and the function for the C file."""
+        section = self._GenSection("text", accessor.name).lstrip()
+        if section != "":
+            section += " "
+        return (
+            f"{accessor.prototype};\n",
+            f"\n{section}{accessor.prototype} {{{accessor.body}}}\n",
+        )
+
+    def _GenStorage(
+        self, name_var, definition, declaration, value, extern, read_only=False
+    ):
+        """Definition of the variable in the C file and its declaration in
+        the header, which is needed if the variable is extern.
+
+        Read-only variables are placed in the section .rodata.SECTION_PREFIX
+        if the option Rodata_Section is set."""
+        if not read_only:
+            section = self._GenSection("data", name_var)
+        elif self._GetOption("Function_Sections"):
+            section = self._GenSection("rodata", name_var)
+        elif self._GetOption("Rodata_Section"):
+            self._AddCDefine(SECTION_MACRO)
+            section = ' BUILD_INFO_SECTION("<<RODATA_SECTION>>")'
+        else:
+            section = ""
+        if extern:
+            return (
+                f"extern {declaration};\n",
+                f"{definition}{section} = {value};\n",
+            )
+        return "", f"static {definition}{section} = {value};\n"
+
+    def _GenSection(self, section_type, name):
+        """Section attribute of a variable or function if the option
+        Function_Sections is set. E.g. .text.INFO_GetVersionNum"""
+        if not self._GetOption("Function_Sections"):
+            return ""
+        self._AddCDefine(SECTION_MACRO)
+        return f' BUILD_INFO_SECTION(".{section_type}.<<MODULE_NAME>>{name}")'
 
     def _GenMacro(self, key_data, value):
         if type(value) is not str:
@@ -716,6 +3728,32 @@ class BuildInfo:
 
         return CodeData(macro=macro)
 
+    def _GenFeature(self, key_data, value):
+        """Define of a feature toggle, 1 or 0, to compile out code with #if."""
+        if type(value) is not bool:
+            raise ValueError(f"invalid bool '{value}'")
+
+        name_macro = self._formatter.NameToMacro(f"Feature_{key_data.name}")
+        self._features.append([f"<<MODULE_NAME>>{name_macro}", value])
+
+        macro = f"#define <<MODULE_NAME>>{name_macro} {int(value)}\n"
+
+        return CodeData(macro=macro)
+
+    def _AddInclude(self, includes, file):
+        if file not in includes:
+            includes.append(file)
+
+    def _AddCDefine(self, define):
+        """Add code to the beginning of the C file, once."""
+        if define not in self._c_code_defines:
+            self._c_code_defines.append(define)
+
+    def _AddHDefine(self, define):
+        """Add code to the beginning of the header, once."""
+        if define not in self._h_code_defines:
+            self._h_code_defines.append(define)
+
     def _AddNewlineSeparators(self):
         self._AddCode(CodeData("\n", "\n", "\n", "\n"))
 
@@ -725,6 +3763,12 @@ class BuildInfo:
         self._c_code_vars.append(code_data.variable)
         self._c_code_funcs.append(code_data.function)
 
+    def _SetCode(self, index, code_data):
+        self._h_code_macros[index] = code_data.macro
+        self._h_code_funcs[index] = code_data.header
+        self._c_code_vars[index] = code_data.variable
+        self._c_code_funcs[index] = code_data.function
+
     def _RepalceTags(self):
         for i, line in enumerate(self._c_code_vars):
             self._c_code_vars[i] = self._ReplaceAllTagsInLine(line)
@@ -734,9 +3778,17 @@ class BuildInfo:
             self._h_code_funcs[i] = self._ReplaceAllTagsInLine(line)
         for i, line in enumerate(self._h_code_macros):
             self._h_code_macros[i] = self._ReplaceAllTagsInLine(line)
+        for feature in self._features:
+            feature[0] = self._ReplaceAllTagsInLine(feature[0])
 
+    @_Synchronized
     def GetH(self, with_hash=True):
-        code = "".join(self._h_code_macros + self._h_code_funcs)
+        code = "".join(
+            self._h_code_defines
+            + ["\n"]
+            + self._h_code_macros
+            + self._h_code_funcs
+        )
         code = self._AddHHeaderGuardsAndIncludes(code)
         code = self._ReplaceAllTagsInLine(code)
         code = self._RemoveExtraNewlines(code)
@@ -744,15 +3796,65 @@ class BuildInfo:
             code = self._AddHeaderWithHash(code)
         return code
 
+    @_Synchronized
     def GetC(self, with_hash=True):
-        code = "".join(self._c_code_vars + self._c_code_funcs)
+        code = "".join(
+            self._c_code_defines
+            + ["\n"]
+            + [self._GenStringPool()]
+            + self._c_code_vars
+            + self._c_code_funcs
+        )
         code = self._AddCIncludes(code)
         code = self._ReplaceAllTagsInLine(code)
+        code = self._ReplaceStringPoolTags(code)
         code = self._RemoveExtraNewlines(code)
         if with_hash:
             code = self._AddHeaderWithHash(code)
         return code
 
+    def _StringPoolLayout(self):
+        """Strings of the pool, each stored once, and the offset of each
+        string of the option String_Pool in the pool.
+
+        Sorted by their reversed bytes, a string that is the suffix of others
+        comes right after the longest of them and shares its end."""
+        strings = sorted(
+            {value for value in self._string_pool if value is not None},
+            key=lambda value: value[::-1],
+            reverse=True,
+        )
+        stored = []
+        offsets = {}
+        size = 0
+        for value in strings:
+            if len(stored) != 0 and stored[-1].endswith(value):
+                offsets[value] = size - len(value) - 1
+                continue
+            stored.append(value)
+            size += len(value) + 1
+            offsets[value] = size - len(value) - 1
+        return stored, [offsets.get(value) for value in self._string_pool]
+
+    def _GenStringPool(self):
+        """Array with the strings of the pool, without the terminator of the
+        literal."""
+        stored, _ = self._StringPoolLayout()
+        if len(stored) == 0:
+            return ""
+        size = sum(len(value) + 1 for value in stored)
+        lines = "".join(f'\n    "{value.decode()}\\0"' for value in stored)
+        return f"""
+static const char {STRING_POOL_NAME}[{size}]{self._string_pool_section} ={lines};
+"""
+
+    def _ReplaceStringPoolTags(self, code):
+        _, offsets = self._StringPoolLayout()
+        for pool, offset in enumerate(offsets):
+            if offset is not None:
+                code = code.replace(f"<<STRING_POOL_{pool}>>", str(offset))
+        return code
+
     def _AddHHeaderGuardsAndIncludes(self, code):
         code = [
             f"#ifndef <<FILE_HEADER_GUARD>>\n",
@@ -807,6 +3909,13 @@ class BuildInfo:
 
         code = code.replace("<<MODULE_NAME>>", module_name)
 
+        if self._module_name == "":
+            rodata_section = ".rodata"
+        else:
+            rodata_section = f".rodata.{self._module_name}"
+
+        code = code.replace("<<RODATA_SECTION>>", rodata_section)
+
         code = code.replace(
             "<<FILE_HEADER_GUARD>>",
             self._formatter.NameToHeaderGuard(filename_base),
@@ -850,9 +3959,192 @@ class BuildInfo:
         code = re.sub("\n\n+", "\n\n", code)
         return code
 
+    @_Synchronized
+    def GetImage(self):
+        """Binary image with the values of the modules with the option Image,
+        each one aligned to 8 bytes. Empty if there is none."""
+        image = b""
+        for module in self._images:
+            image = image.ljust(module["offset"], b"\xFF")
+            image += module["image"]
+        return image
+
+    @_Synchronized
+    def GetImageHex(self, address=0):
+        """Binary image in Intel HEX format, starting at the address."""
+        return IntelHex(self.GetImage(), address)
+
+    @_Synchronized
+    def GetImageDelta(self, old):
+        """Delta to update the binary image of the BuildInfo old to the image
+        of this one, with the entries that changed. Deltas of the modules are
+        concatenated, modules without changes have none.
+
+        Raise ValueError if there is no image or the modules or their layouts
+        are different."""
+        with old._lock:
+            old_images = list(old._images)
+        if len(self._images) == 0:
+            raise ValueError(
+                'no image, set the option "Image" or "Image_Delta"'
+            )
+        if [module["module"] for module in old_images] != [
+            module["module"] for module in self._images
+        ]:
+            raise ValueError("images have different modules")
+
+        delta = b""
+        for old_module, module in zip(old_images, self._images):
+            if old_module["layout_hash"] != module["layout_hash"]:
+                raise ValueError(
+                    f"layout of module '{module['module']}' changed,"
+                    + " the whole image must be updated"
+                )
+            if old_module["image"] == module["image"]:
+                continue
+
+            byte_order = "<" if module["endianness"] == "little" else ">"
+            records = b""
+            count = 0
+            for id, entry in enumerate(module["entries"]):
+                start = entry["offset"]
+                end = start + entry["size"]
+                value = module["image"][start:end]
+                if value != old_module["image"][start:end]:
+                    records += struct.pack(byte_order + "H", id) + value
+                    count += 1
+
+            size = struct.calcsize(DELTA_HEADER_FORMAT) + len(records) + 4
+            data = struct.pack(
+                byte_order + DELTA_HEADER_FORMAT,
+                DELTA_MAGIC,
+                int(module["layout_hash"], 16),
+                int(old_module["crc"], 16),
+                int(module["crc"], 16),
+                size,
+                count,
+                0,
+            )
+            data += records
+            delta += data + struct.pack(byte_order + "I", zlib.crc32(data))
+        return delta
+
+    @_Synchronized
+    def DecodeTlv(self, data, module="", endianness="little"):
+        """Decode the TLV records of Serialize() of the module to a dict with
+        the value of each entry. Records with unknown IDs are ignored.
+
+        Raise ValueError if the module has no TLV records or a record is
+        truncated or has the wrong size for its entry."""
+        if module not in self._tlv_fields:
+            raise ValueError(f"no TLV records of module '{module}'")
+        fields = self._tlv_fields[module]
+        byte_order = "<" if endianness == "little" else ">"
+        values = {}
+        i = 0
+        while i < len(data):
+            if len(data) - i < 2 or len(data) - i - 2 < data[i + 1]:
+                raise ValueError(f"truncated TLV record at {i}")
+            id, size = data[i], data[i + 1]
+            value = data[i + 2 : i + 2 + size]
+            if id >= len(fields):
+                i += 2 + size
+                continue
+            name, entry_type, length = fields[id]
+            if entry_type == "string":
+                expected_size = size
+            else:
+                expected_size = self.TYPE_SIZES[entry_type] * (length or 1)
+            if size != expected_size:
+                raise ValueError(f"invalid size of TLV record at {i}")
+            i += 2 + size
+            if entry_type == "string":
+                values[name] = value.decode()
+            elif length is not None:
+                values[name] = list(
+                    struct.unpack(
+                        f"{byte_order}{length}{IMAGE_FORMATS[entry_type]}",
+                        value,
+                    )
+                )
+            else:
+                (values[name],) = struct.unpack(
+                    byte_order + IMAGE_FORMATS[entry_type], value
+                )
+        return values
+
+    @_Synchronized
+    def GetImageManifest(self):
+        """JSON with the layout of the binary image: offset in the image of
+        each module and offset in the module, type and size of each entry."""
+        modules = [
+            {key: value for key, value in module.items() if key != "image"}
+            for module in self._images
+        ]
+        return json.dumps({"modules": modules}, indent=4) + "\n"
+
+    @_Synchronized
+    def GetSizeReport(self, symbol_sizes=None):
+        """Code generated for each JSON entry, in order: number of functions,
+        header lines and bytes of C code. The code of the whole object (e.g.
+        "Entry_Table") is in the entry "(module)". With symbol_sizes, the
+        size of each symbol of the compiled C file, also the bytes of the
+        symbols that each entry defines."""
+        ends = [first for _, _, first in self._code_ranges[1:]]
+        ends.append(len(self._c_code_vars))
+        report = []
+        for (module, raw_type_data, first), last in zip(
+            self._code_ranges, ends
+        ):
+            header = "".join(
+                self._h_code_macros[first:last] + self._h_code_funcs[first:last]
+            )
+            source = "".join(
+                self._c_code_vars[first:last] + self._c_code_funcs[first:last]
+            )
+            entry = {
+                "module": module,
+                "entry": raw_type_data,
+                "functions": len(FunctionDefinitionRegex.findall(source))
+                + len(re.findall(r"^static inline ", header, re.MULTILINE)),
+                "header_lines": len(
+                    [line for line in header.splitlines() if line.strip()]
+                ),
+                "source_bytes": len(source.strip().encode()),
+            }
+            if symbol_sizes is not None:
+                # Definitions start in the first column of the C file
+                entry["object_bytes"] = sum(
+                    size
+                    for symbol, size in symbol_sizes.items()
+                    if re.search(
+                        rf"^[^\s#].*\b{re.escape(symbol)}\b",
+                        source,
+                        re.MULTILINE,
+                    )
+                )
+            report.append(entry)
+        return report
+
+    @_Synchronized
+    def GetFeatureConfig(self):
+        """Summary of the feature toggles in the .config format of Kconfig,
+        or "" if there are none."""
+        if len(self._features) == 0:
+            return ""
+        lines = ["# Code generated automatically.\n"]
+        for name, value in self._features:
+            if value:
+                lines.append(f"CONFIG_{name}=y\n")
+            else:
+                lines.append(f"# CONFIG_{name} is not set\n")
+        return "".join(lines)
+
+    @_Synchronized
     def CalcCHash(self):
         return self._CalcHash(self.GetC(with_hash=False))
 
+    @_Synchronized
     def CalcHHash(self):
         return self._CalcHash(self.GetH(with_hash=False))
 
@@ -861,52 +4153,528 @@ class BuildInfo:
 
 
 def main(argv, open=open, print=print):
-    import os
+    """Generate the files, or only check the JSON (--check) or check that
+    the files are up to date (--verify), or write the delta between the
+    images of two JSON (--delta), or benchmark the accessors (--bench).
+    Return 0 on success."""
+    args = argv[1:]
+    mode = None
+    if len(args) != 0 and args[0] in (
+        "--check",
+        "--verify",
+        "--delta",
+        "--bench",
+        "--report",
+    ):
+        mode = args.pop(0)
+
+    if mode == "--delta":
+        if len(args) != 3:
+            print(
+                f"Usage: {os.path.basename(argv[0])} --delta"
+                + " OLD.json NEW.json OUTPUT.delta"
+            )
+            return 1
+        return MainDelta(*args, open=open, print=print)
+    elif mode == "--bench":
+        if len(args) not in (1, 2):
+            print(
+                f"Usage: {os.path.basename(argv[0])} --bench"
+                + " INPUT.json [OUTPUT.json]"
+            )
+            return 1
+        return MainBenchmark(*args, open=open, print=print)
+    elif mode == "--report":
+        if len(args) not in (1, 2):
+            print(
+                f"Usage: {os.path.basename(argv[0])} --report"
+                + " INPUT.json [OUTPUT.json]"
+            )
+            return 1
+        return MainSizeReport(*args, open=open, print=print)
 
-    if len(argv) != 3:
-        print(f"Usage: {os.path.basename(argv[0])} INPUT.json OUTPUT[.c|.h]")
+    if len(args) != 2 and not (mode == "--check" and len(args) == 1):
+        print(
+            f"Usage: {os.path.basename(argv[0])} [--check | --verify]"
+            + " INPUT.json OUTPUT[.c|.h]"
+        )
         return 1
 
-    filein = argv[1]
-    fileout = argv[2]
+    filein = args[0]
 
     with open(filein, "r") as fp:
         json_data = fp.read()
 
-    fileout = RemoveFilenameExtension(fileout)
+    if mode == "--check":
+        errors = BuildInfo().CheckJSON(json_data)
+        for error in errors:
+            print(f"{filein}: {error}")
+        return 1 if errors else 0
+
+    fileout = RemoveFilenameExtension(args[1])
     fileoutc = fileout + ".c"
     fileouth = fileout + ".h"
 
     bi = BuildInfo(filename_base=fileout)
-    bi.ProcessJSON(json_data)
+    if mode == "--verify":
+        errors = bi.CheckJSON(json_data, query_git=True)
+        if errors:
+            for error in errors:
+                print(f"{filein}: {error}")
+            return 1
+    else:
+        bi.ProcessJSON(json_data)
     code_c = bi.GetC()
     hash_c = bi.CalcCHash()
     code_h = bi.GetH()
     hash_h = bi.CalcHHash()
 
+    outdated = 0
+    for filename, code, hash in (
+        (fileoutc, code_c, hash_c),
+        (fileouth, code_h, hash_h),
+    ):
+        try:
+            with open(filename, "r") as fp:
+                current_code = fp.read()
+        except FileNotFoundError:
+            current_code = ""
+
+        if hash in current_code:
+            continue
+        elif mode == "--verify":
+            print(f"{filename}: not up to date with {filein}")
+            outdated += 1
+        else:
+            with open(filename, "w") as fp:
+                fp.write(code)
+
+    files = []
+    image = bi.GetImage()
+    if len(image) != 0:
+        files += [
+            (fileout + ".bin", image, "b"),
+            (fileout + ".hex", bi.GetImageHex(), ""),
+            (fileout + ".layout.json", bi.GetImageManifest(), ""),
+        ]
+    config = bi.GetFeatureConfig()
+    if len(config) != 0:
+        files.append((fileout + ".config", config, ""))
+
+    for filename, data, binary in files:
+        try:
+            with open(filename, "r" + binary) as fp:
+                current_data = fp.read()
+        except FileNotFoundError:
+            current_data = None
+
+        if data == current_data:
+            continue
+        elif mode == "--verify":
+            print(f"{filename}: not up to date with {filein}")
+            outdated += 1
+        else:
+            with open(filename, "w" + binary) as fp:
+                fp.write(data)
+
+    return 1 if outdated else 0
+
+
+def MainDelta(fileold, filenew, fileout, open=open, print=print):
+    """Write the delta to update the image of fileold to the one of
+    filenew."""
+    images = []
+    for filein in (fileold, filenew):
+        with open(filein, "r") as fp:
+            json_data = fp.read()
+        bi = BuildInfo()
+        bi.ProcessJSON(json_data)
+        images.append(bi)
+
     try:
-        with open(fileoutc, "r") as fp:
-            current_code_c = fp.read()
-    except FileNotFoundError:
-        current_code_c = ""
+        delta = images[1].GetImageDelta(images[0])
+    except ValueError as e:
+        print(f"{filenew}: {e}")
+        return 1
+    with open(fileout, "wb") as fp:
+        fp.write(delta)
+    return 0
+
 
-    if hash_c not in current_code_c:
-        with open(fileoutc, "w") as fp:
-            fp.write(code_c)
+def MainBenchmark(filein, fileout=None, open=open, print=print):
+    """Benchmark the accessors generated for filein and print the results,
+    or write them to fileout."""
+    with open(filein, "r") as fp:
+        json_data = fp.read()
+    bi = BuildInfo()
+    bi.ProcessJSON(json_data)
 
     try:
-        with open(fileouth, "r") as fp:
-            current_code_h = fp.read()
-    except FileNotFoundError:
-        current_code_h = ""
+        results = Benchmark(
+            bi.GetC(), bi.GetH(), include_dirs=HostIncludeDirs(filein)
+        )
+    except RuntimeError as e:
+        print(f"{filein}: {e}")
+        return 1
 
-    if hash_h not in current_code_h:
-        with open(fileouth, "w") as fp:
-            fp.write(code_h)
+    results = json.dumps(results, indent=4) + "\n"
+    if fileout is None:
+        print(results, end="")
+    else:
+        with open(fileout, "w") as fp:
+            fp.write(results)
+    return 0
+
+
+def HostIncludeDirs(filein):
+    """Directories of the headers of the JSON filein when compiling on the
+    host: its directory and the working directory."""
+    return [os.path.dirname(os.path.abspath(filein)), os.getcwd()]
+
+
+def MainSizeReport(filein, fileout=None, open=open, print=print):
+    """Print the table of the size of the code generated for each entry of
+    filein and write the report to fileout."""
+    with open(filein, "r") as fp:
+        json_data = fp.read()
+    bi = BuildInfo()
+    bi.ProcessJSON(json_data)
 
+    try:
+        report = SizeReport(bi, include_dirs=HostIncludeDirs(filein))
+    except RuntimeError as e:
+        print(f"{filein}: {e}")
+        return 1
+
+    print(SizeReportTable(report), end="")
+    if fileout is not None:
+        with open(fileout, "w") as fp:
+            fp.write(json.dumps(report, indent=4) + "\n")
     return 0
 
 
+def IntelHex(data, address=0):
+    """Data in Intel HEX format, with records of 16 bytes and extended linear
+    address records when crossing 64 KiB."""
+
+    def Record(record_type, record_address, record_data):
+        record = bytes((len(record_data),)) + struct.pack(">H", record_address)
+        record += bytes((record_type,)) + record_data
+        checksum = -sum(record) & 0xFF
+        return f":{record.hex().upper()}{checksum:02X}\n"
+
+    lines = []
+    upper = None
+    for offset in range(0, len(data), 16):
+        current = address + offset
+        chunk = data[offset : offset + 16]
+        if current >> 16 != upper:
+            upper = current >> 16
+            lines.append(Record(4, 0, struct.pack(">H", upper)))
+        if (current & 0xFFFF) + len(chunk) > 0x10000:
+            first = 0x10000 - (current & 0xFFFF)
+            lines.append(Record(0, current & 0xFFFF, chunk[:first]))
+            upper += 1
+            lines.append(Record(4, 0, struct.pack(">H", upper)))
+            lines.append(Record(0, 0, chunk[first:]))
+        else:
+            lines.append(Record(0, current & 0xFFFF, chunk))
+    lines.append(Record(1, 0, b""))
+    return "".join(lines)
+
+
+# Function definitions in the C file: first line ending with ") {".
+FunctionDefinitionRegex = re.compile(r"^[^\s#][^;]*\) \{$", re.MULTILINE)
+
+# Prototypes of the accessors in the header: return type, name and parameters.
+PrototypeRegex = re.compile(
+    r"^(?:static inline )?(\w[\w ]*?) ?\b((?:\w*_)?(?:Get|Set)\w+)\((.*?)\)"
+    + r"(?:;| \{)",
+    re.MULTILINE,
+)
+
+# Host definitions of the macros the generated code needs, used if the JSON
+# does not define them. CRITICAL_BLOCK takes a spinlock, as locking on a target.
+HOST_MACROS = {
+    "CRITICAL_BLOCK": """\
+static char BuildInfo_Bench_Lock;
+#define CRITICAL_BLOCK(code) \\
+    do { \\
+        while (__atomic_test_and_set(&BuildInfo_Bench_Lock, __ATOMIC_ACQUIRE)) { \\
+        } \\
+        code __atomic_clear(&BuildInfo_Bench_Lock, __ATOMIC_RELEASE); \\
+    } while (0)
+""",
+    "MEMORY_BARRIER": """\
+#define MEMORY_BARRIER() __atomic_thread_fence(__ATOMIC_SEQ_CST)
+""",
+}
+
+
+def Benchmark(
+    code_c, code_h, iterations=1000000, cc=None, cflags=None, include_dirs=()
+):
+    """Compile the generated code with a program that calls each Get and Set
+    accessor of the header in a loop and return the results (JSON data):
+    latency (ns/call) and throughput (calls/s) of each accessor and their
+    averages for each type. The compiler and flags default to the
+    environment variables CC (gcc) and CFLAGS (-O2), include_dirs has the
+    directories of the headers of the JSON. Raise RuntimeError if compiling
+    or running fails."""
+    if cc is None:
+        cc = os.environ.get("CC", "gcc")
+    if cflags is None:
+        cflags = os.environ.get("CFLAGS", "-O2").split()
+
+    filename_h = re.search(r'#include "([^"]+)"', code_c).group(1)
+    accessors = BenchmarkAccessors(code_h)
+    main_c = BenchmarkMain(filename_h, accessors, iterations)
+
+    with tempfile.TemporaryDirectory() as directory:
+        HostCompile(
+            directory,
+            code_c,
+            code_h,
+            [cc, *cflags, "build_info.c", "bench.c", "-o", "bench"],
+            {"bench.c": main_c},
+            include_dirs,
+        )
+
+        result = subprocess.run(
+            [os.path.join(directory, "bench")], capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"benchmark failed\n{result.stderr}")
+
+    results = []
+    types = {}
+    for line, (name, kind, c_type, _) in zip(
+        result.stdout.splitlines(), accessors
+    ):
+        nanoseconds = int(line) / iterations
+        results.append(
+            {
+                "function": name,
+                "kind": kind,
+                "type": c_type,
+                "ns_per_call": round(nanoseconds, 3),
+                "calls_per_s": round(1e9 / max(nanoseconds, 1e-3)),
+            }
+        )
+        types.setdefault(c_type, {}).setdefault(kind, []).append(nanoseconds)
+
+    return {
+        "compiler": cc,
+        "cflags": cflags,
+        "iterations": iterations,
+        "accessors": results,
+        "types": {
+            c_type: {
+                f"{kind}_ns_per_call": round(sum(values) / len(values), 3)
+                for kind, values in kinds.items()
+            }
+            for c_type, kinds in types.items()
+        },
+    }
+
+
+def HostCompile(
+    directory, code_c, code_h, command, files=None, include_dirs=()
+):
+    """Write the generated code (build_info.c and its header) and files to
+    directory and run the compiler command there, searching include_dirs for
+    the headers of the JSON. The header has host definitions of the macros
+    that neither the JSON nor its headers define. Raise RuntimeError if it
+    fails."""
+    filename_h = re.search(r'#include "([^"]+)"', code_c).group(1)
+    host_h = "".join(
+        f"#ifndef {macro}\n{definition}#endif\n"
+        for macro, definition in HOST_MACROS.items()
+        if not re.search(rf"^#define {macro}\(", code_h, re.MULTILINE)
+    )
+
+    # After the includes of the header, which may define the macros.
+    includes = list(re.finditer(r"^#include .*\n", code_h, re.MULTILINE))
+    if len(includes) == 0:
+        includes = [re.search(r"^#define .*\n", code_h, re.MULTILINE)]
+    position = includes[-1].end()
+    code_h = code_h[:position] + host_h + code_h[position:]
+
+    files = {"build_info.c": code_c, filename_h: code_h, **(files or {})}
+    for filename, code in files.items():
+        with open(os.path.join(directory, filename), "w") as fp:
+            fp.write(code)
+
+    include_args = [arg for path in include_dirs for arg in ("-I", path)]
+    command = [command[0], *include_args, *command[1:]]
+    result = subprocess.run(
+        command, cwd=directory, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)}\n{result.stderr}")
+
+
+def SizeReport(bi, cc=None, cflags=None, include_dirs=()):
+    """Size of the code generated for each entry of bi (see
+    BuildInfo.GetSizeReport()). If the compiler is available, the C file is
+    compiled with each function and variable in its own section and the
+    report has the size of the object of each entry (nm) and the total
+    (size). The compiler and flags default to the environment variables CC
+    (gcc) and CFLAGS (-Os), include_dirs has the directories of the headers
+    of the JSON. Raise RuntimeError if compiling fails."""
+    if cc is None:
+        cc = os.environ.get("CC", "gcc")
+    if cflags is None:
+        cflags = os.environ.get("CFLAGS", "-Os").split()
+
+    if shutil.which(cc) is None or shutil.which("nm") is None:
+        return {"entries": bi.GetSizeReport()}
+
+    code_c = bi.GetC()
+    with tempfile.TemporaryDirectory() as directory:
+        command = [cc, *cflags, "-ffunction-sections", "-fdata-sections"]
+        command += ["-c", "build_info.c", "-o", "build_info.o"]
+        HostCompile(
+            directory, code_c, bi.GetH(), command, include_dirs=include_dirs
+        )
+
+        result = subprocess.run(
+            ["nm", "--print-size", "build_info.o"],
+            cwd=directory,
+            capture_output=True,
+            text=True,
+        )
+        symbol_sizes = {}
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            if len(fields) == 4:
+                symbol_sizes[fields[3]] = int(fields[1], 16)
+
+        sizes = {}
+        if shutil.which("size") is not None:
+            result = subprocess.run(
+                ["size", "build_info.o"],
+                cwd=directory,
+                capture_output=True,
+                text=True,
+            )
+            lines = result.stdout.splitlines()
+            if len(lines) == 2:
+                sizes = dict(
+                    zip(("text", "data", "bss"), map(int, lines[1].split()[:3]))
+                )
+
+    return {
+        "compiler": cc,
+        "cflags": cflags,
+        "size": sizes,
+        "entries": bi.GetSizeReport(symbol_sizes),
+    }
+
+
+def SizeReportTable(report, sort=None):
+    """Table of the report, sorted by the column sort (default: object_bytes
+    if there are object sizes, else source_bytes), largest first."""
+    entries = report["entries"]
+    columns = ["module", "entry", "functions", "header_lines", "source_bytes"]
+    if len(entries) != 0 and "object_bytes" in entries[0]:
+        columns.append("object_bytes")
+    if sort is None:
+        sort = columns[-1]
+    entries = sorted(entries, key=lambda entry: entry[sort], reverse=True)
+
+    rows = [[column.upper() for column in columns]]
+    rows += [[str(entry[column]) for column in columns] for entry in entries]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    lines = []
+    for row in rows:
+        cells = [
+            cell.ljust(width) if i < 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ]
+        lines.append("  ".join(cells).rstrip() + "\n")
+    return "".join(lines)
+
+
+def BenchmarkAccessors(code_h):
+    """Get and Set accessors of the header as (name, kind, type, call) with
+    the C expression that calls it once. Element accessors of arrays access
+    the first element and strings use the buffer BenchBuff."""
+    accessors = []
+    for return_type, name, params in PrototypeRegex.findall(code_h):
+        kind = "get" if re.search(r"(?:^|_)Get", name) else "set"
+        params = params.replace("const ", "")
+        if kind == "get" and params == "void":
+            accessors.append((name, kind, return_type, f"{name}()"))
+        elif kind == "get" and params == "uint16_t index":
+            accessors.append((name, kind, return_type, f"{name}(0)"))
+        elif params == "char *buff_ptr, uint16_t len":
+            if kind == "get":
+                call = f"{name}(BenchBuff, sizeof(BenchBuff))"
+            else:
+                call = f'{name}("", 1)'
+            accessors.append((name, kind, "string", call))
+        elif kind == "set" and re.fullmatch(r"[\w ]+ val", params):
+            c_type = params[: -len(" val")]
+            accessors.append((name, kind, c_type, f"{name}(({c_type})i)"))
+        elif kind == "set" and re.fullmatch(
+            r"uint16_t index, [\w ]+ val", params
+        ):
+            c_type = params[len("uint16_t index, ") : -len(" val")]
+            accessors.append((name, kind, c_type, f"{name}(0, ({c_type})i)"))
+    return accessors
+
+
+def BenchmarkMain(filename_h, accessors, iterations):
+    """Program that prints the nanoseconds spent in the loop of each
+    accessor, one per line. Results go to a volatile variable so the loops
+    are not removed."""
+    loops = []
+    for name, kind, c_type, call in accessors:
+        if kind == "set":
+            statement = f"{call};"
+        elif c_type == "string":
+            statement = f"BenchSinkInt = {call};"
+        else:
+            statement = f"BenchSinkDouble = (double){call};"
+        loops.append(
+            f"""
+    start = BenchNow();
+    for (i = 0; i < {iterations}u; i++) {{
+        {statement}
+    }}
+    printf("%lld\\n", BenchNow() - start);
+"""
+        )
+    return f"""\
+#define _POSIX_C_SOURCE 199309L
+#include "{filename_h}"
+#include <stdio.h>
+#include <time.h>
+
+static char BenchBuff[0xFFFF];
+static volatile int BenchSinkInt;
+static volatile double BenchSinkDouble;
+
+static long long BenchNow(void) {{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}}
+
+int main(void) {{
+    unsigned long i;
+    long long start;
+
+    (void)i;
+    (void)start;
+    (void)BenchBuff;
+{"".join(loops)}
+    return 0;
+}}
+"""
+
+
 def RemoveFilenameExtension(filename):
     return re.sub(r"\.[cChH]$", "", filename)
 
@@ -914,4 +4682,4 @@ def RemoveFilenameExtension(filename):
 if __name__ == "__main__":
     import sys
 
-    main(sys.argv)
+    sys.exit(main(sys.argv))
@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestAccessors(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def test_Default_AllAccessors(self):
+        self.bi.ProcessJSON('{"string:w:Name": "VALUE"}')
+        lines = [
+            "uint16_t LenName(void);",
+            "const char *PtrName(void);",
+            "bool GetName(char *buff_ptr, uint16_t len);",
+            "bool SetName(const char *buff_ptr, uint16_t len);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+    def test_Module_OnlySelectedAccessors(self):
+        self.bi.ProcessJSON(
+            """{
+                "Accessors": ["Ptr", "Set"],
+                "string:w:Name": "VALUE",
+                "uint32:w:Number": 1
+            }"""
+        )
+        code_h = self.bi.GetH()
+        code_c = self.bi.GetC()
+        self.assertIn("const char *PtrName(void);", code_h)
+        self.assertIn(
+            "bool SetName(const char *buff_ptr, uint16_t len);", code_h
+        )
+        self.assertIn("void SetNumber(uint32_t val);", code_h)
+        for name in ("LenName", "GetName", "GetNumber"):
+            self.assertNotIn(name, code_h)
+            self.assertNotIn(name, code_c)
+
+    def test_Module_AppliesToFollowingObjects(self):
+        self.bi.ProcessJSON(
+            """[
+                {"uint32:First": 1, "Accessors": ["Ptr"]},
+                {"string:Name": "VALUE", "uint32:Second": 1}
+            ]"""
+        )
+        code_h = self.bi.GetH()
+        self.assertIn("uint32_t GetFirst(void);", code_h)
+        self.assertIn("const char *PtrName(void);", code_h)
+        self.assertNotIn("GetName", code_h)
+        self.assertNotIn("Second", code_h)
+        self.assertNotIn("Second", self.bi.GetC())
+
+    def test_Entry_OverridesModule(self):
+        self.bi.ProcessJSON(
+            """{
+                "Accessors": ["Get"],
+                "string:Name": {"Value": "VALUE", "Accessors": ["Len", "Ptr"]},
+                "string:Other": "VALUE"
+            }"""
+        )
+        lines = [
+            "uint16_t LenName(void);",
+            "const char *PtrName(void);",
+            "bool GetOther(char *buff_ptr, uint16_t len);",
+        ]
+        code_h = self.bi.GetH()
+        AssertIsInSequence(lines, code_h, self)
+        self.assertNotIn("GetName", code_h)
+        self.assertNotIn("PtrOther", code_h)
+        self.assertIn('static const char Name[] = "VALUE";', self.bi.GetC())
+
+    def test_Entry_NoAccessors_NoVariable(self):
+        self.bi.ProcessJSON('{"uint32:Number": {"Value": 1, "Accessors": []}}')
+        self.assertNotIn("Number", self.bi.GetC())
+
+    def test_Invalid_RaisesValueError(self):
+        json_data_list = [
+            '{"Accessors": "Get"}',
+            '{"Accessors": ["Read"]}',
+            '{"uint32:Number": {"Value": 1, "Accessors": ["Read"]}}',
+            '{"uint32:Number": {"Accessors": ["Get"]}}',
+            '{"uint32:Number": {"Value": 1, "Function_Sections": true}}',
+            '{"uint32:Number": {"Value": 1, "Invalid": true}}',
+        ]
+        for json_data in json_data_list:
+            with self.subTest(json_data=json_data):
+                with self.assertRaises(ValueError):
+                    self.bi.ProcessJSON(json_data)
+
+
+class TestFunctionSections(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def test_Default_NoSections(self):
+        self.bi.ProcessJSON('{"uint32:w:Number": 1}')
+        self.assertNotIn("BUILD_INFO_SECTION", self.bi.GetC())
+
+    def test_Enabled_EachFunctionAndVariableInItsSection(self):
+        self.bi.ProcessJSON(
+            """{
+                "Function_Sections": true,
+                "Section_Prefix": "INFO",
+                "uint32:w:Number": 1
+            }"""
+        )
+        lines = [
+            "#ifndef BUILD_INFO_SECTION",
+            'static uint32_t INFO_Number BUILD_INFO_SECTION(".data.INFO_Number") = 1;',
+            'BUILD_INFO_SECTION(".text.INFO_GetNumber") uint32_t INFO_GetNumber(void) {',
+            'BUILD_INFO_SECTION(".text.INFO_SetNumber") void INFO_SetNumber(uint32_t val) {',
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+        self.assertIn("uint32_t INFO_GetNumber(void);", self.bi.GetH())
+
+    def test_Enabled_Compiles(self):
+        self.bi.ProcessJSON(
+            """{
+                "Function_Sections": true,
+                "Bool_Is_Integer": true,
+                "macro:CRITICAL_BLOCK(code)": "do { code } while (0)",
+                "uint32:w:Number": 1,
+                "string:w:Name": "VALUE"
+            }"""
+        )
+        main_c = """
+#include "info.h"
+#include <string.h>
+int main(void) {
+    SetNumber(2);
+    return !(GetNumber() == 2 && strcmp(PtrName(), "VALUE") == 0);
+}
+"""
+        CompileAndRun(self, self.bi, main_c, ["-Wl,--gc-sections"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestArrays(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def test_ReadOnly_ConstArray(self):
+        ProcessEntries(self.bi, '"int16[3]:Table": [-1, 0, 1]')
+        lines = [
+            "uint16_t INFO_LenTable(void);",
+            "const int16_t *INFO_PtrTable(void);",
+            "int16_t INFO_GetTable(uint16_t index);",
+            "uint8_t INFO_GetRangeTable(uint16_t first, uint16_t count, int16_t *buff_ptr);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+        self.assertNotIn("INFO_SetTable", self.bi.GetH())
+        self.assertIn(
+            "static const int16_t INFO_Table[3] = {-1, 0, 1};", self.bi.GetC()
+        )
+
+    def test_SizeFromValues(self):
+        ProcessEntries(self.bi, '"float[]:w:Gains": [0.5, 1, 2.25]')
+        self.assertIn(
+            "static float INFO_Gains[3] = {0.5, 1, 2.25};", self.bi.GetC()
+        )
+        self.assertIn(
+            "uint8_t INFO_SetRangeGains(uint16_t first, uint16_t count, const float *buff_ptr);",
+            self.bi.GetH(),
+        )
+
+    def test_InvalidValues_AllReported(self):
+        with self.assertRaises(ValueError) as context:
+            ProcessEntries(self.bi, '"uint8[4]:Table": [0, 256, 1, -1]')
+        self.assertIn("[1, 3]", str(context.exception))
+        with self.assertRaises(ValueError):
+            ProcessEntries(self.bi, '"uint8[4]:Table": [0, 1, 2]')
+        with self.assertRaises(ValueError):
+            ProcessEntries(self.bi, '"int32[2]:Table": [0, 1.5]')
+        with self.assertRaises(ValueError):
+            ProcessEntries(self.bi, '"uint8[]:Table": []')
+
+    def test_Compiles_ElementAndRange(self):
+        ProcessEntries(
+            self.bi,
+            """
+            "uint16[4]:w:Adc_Calibration": [100, 200, 300, 400],
+            "double[]:Coefficients": [0.5, -2.0]
+            """,
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+
+int main(void) {
+    uint16_t buff[4] = {0};
+    uint16_t values[2] = {7, 8};
+    double coefficients[2];
+
+    assert(INFO_LenAdcCalibration() == 4);
+    assert(INFO_GetAdcCalibration(3) == 400);
+    assert(INFO_GetAdcCalibration(4) == 0);
+    assert(INFO_SetAdcCalibration(0, 101) == 1);
+    assert(INFO_SetAdcCalibration(4, 1) == 0);
+    assert(INFO_PtrAdcCalibration()[0] == 101);
+
+    assert(INFO_SetRangeAdcCalibration(2, 2, values) == 1);
+    assert(INFO_SetRangeAdcCalibration(3, 2, values) == 0);
+    assert(INFO_GetRangeAdcCalibration(0, 4, buff) == 1);
+    assert(buff[0] == 101 && buff[1] == 200);
+    assert(buff[2] == 7 && buff[3] == 8);
+    assert(INFO_GetRangeAdcCalibration(4, 0, buff) == 1);
+    assert(INFO_GetRangeAdcCalibration(5, 0, buff) == 0);
+
+    assert(INFO_LenCoefficients() == 2);
+    assert(INFO_GetCoefficients(1) == -2.0);
+    assert(INFO_GetRangeCoefficients(0, 2, coefficients) == 1);
+    assert(coefficients[0] == 0.5);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+    def test_Tlv_RoundTrip(self):
+        ProcessEntries(
+            self.bi, '"uint16[3]:w:Table": [1, 2, 3]', '"Tlv_Serialize": true,'
+        )
+        self.assertIn("#define INFO_TLV_MAX_SIZE 8", self.bi.GetH())
+        data = bytes([0, 6, 1, 0, 2, 0, 3, 0])
+        self.assertEqual(self.bi.DecodeTlv(data, "INFO"), {"Table": [1, 2, 3]})
+
+    def test_Image_ArrayMember(self):
+        ProcessEntries(self.bi, '"uint16[2]:w:Table": [1, 2]', '"Image": true,')
+        self.assertIn("    uint16_t Table[2];", self.bi.GetH())
+        self.assertEqual(self.bi.GetImage()[16:20], bytes([1, 0, 2, 0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
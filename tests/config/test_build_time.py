@@ -38,7 +38,10 @@ class TestProcessJSONTimeData(unittest.TestCase):
 
     def test_TimeData_AddsNumberWithUnixTime_InC(self):
         self.bi.ProcessJSON('{"Date_Time": true}')
-        lines = ["static uint32_t Unix_Time = ", "uint32_t GetUnixTime(void) {"]
+        lines = [
+            "static const uint32_t Unix_Time = ",
+            "uint32_t GetUnixTime(void) {",
+        ]
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
@@ -50,7 +53,10 @@ class TestProcessJSONTimeData(unittest.TestCase):
 
     def test_TimeData_AddsStringWithTime_InC(self):
         self.bi.ProcessJSON('{"Date_Time": true}')
-        lines = ['static char Time_Str[] = "', "const char *PtrTimeStr(void) {"]
+        lines = [
+            'static const char Time_Str[] = "',
+            "const char *PtrTimeStr(void) {",
+        ]
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
@@ -71,7 +77,7 @@ class TestProcessJSONTimeData(unittest.TestCase):
         self.time_mock.SetUnixTime(1.0)
         self.time_mock.SetTimeStr("1970-01-01 00:00:01")
         self.bi.ProcessJSON('{"Date_Time": true}')
-        lines = ["static uint32_t Unix_Time = 1;"]
+        lines = ["static const uint32_t Unix_Time = 1;"]
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
@@ -79,7 +85,7 @@ class TestProcessJSONTimeData(unittest.TestCase):
         self.time_mock.SetUnixTime(1.0)
         self.time_mock.SetTimeStr("1970-01-01 00:00:01")
         self.bi.ProcessJSON('{"Date_Time": true}')
-        lines = ['static char Time_Str[] = "1970-01-01 00:00:01";']
+        lines = ['static const char Time_Str[] = "1970-01-01 00:00:01";']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestDirtyTracking(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries, options=""):
+        ProcessEntries(self.bi, entries, '"Dirty_Tracking": true,' + options)
+
+    def test_SetMarksBit(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "uint32:Read_Only": 3,
+            "string[8]:w:Name": "VALUE"
+            """,
+            '"Target_Word_Size": 32,',
+        )
+        lines = [
+            "#define INFO_DIRTY_SMALL 0",
+            "#define INFO_DIRTY_NAME 2",
+            "#define INFO_DIRTY_COUNT 3",
+            "uint16_t INFO_NextDirty(uint16_t id);",
+            "void INFO_ClearDirty(uint16_t id);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+        lines = [
+            "static uint32_t INFO_Dirty[1];",
+            "void INFO_SetSmall(uint8_t val) {",
+            "    CRITICAL_BLOCK(",
+            "        INFO_Small = val;",
+            "        INFO_Dirty[INFO_DIRTY_SMALL / 32] |= (uint32_t)1 << (INFO_DIRTY_SMALL % 32);",
+            "uint8_t INFO_SetName(const char *buff_ptr, uint16_t len) {",
+            "        INFO_Dirty[INFO_DIRTY_NAME / 32] |= (uint32_t)1 << (INFO_DIRTY_NAME % 32);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+
+    def test_ReadOnly_NoBitmap(self):
+        self.ProcessJSON('"uint8:Small": 1')
+        self.assertNotIn("Dirty", self.bi.GetC())
+
+    def test_Compiles_NextClearDirty(self):
+        entries = ", ".join(f'"uint8:w:Value_{i}": {i}' for i in range(40))
+        self.ProcessJSON(
+            entries + ', "string[8]:w:Name": "VALUE"', '"Entry_Table": true,'
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+
+int main(void) {
+    uint8_t value = 5;
+
+    assert(INFO_NextDirty(0) == INFO_DIRTY_COUNT);
+
+    INFO_SetValue3(1);
+    INFO_SetValue35(1);
+    INFO_SetName("NEW", 4);
+    assert(INFO_SetById(INFO_ID_VALUE_1, &value, sizeof(value)) == 1);
+
+    assert(INFO_NextDirty(0) == INFO_DIRTY_VALUE_1);
+    assert(INFO_NextDirty(INFO_DIRTY_VALUE_1 + 1) == INFO_DIRTY_VALUE_3);
+    assert(INFO_NextDirty(INFO_DIRTY_VALUE_3 + 1) == INFO_DIRTY_VALUE_35);
+    assert(INFO_NextDirty(INFO_DIRTY_VALUE_35 + 1) == INFO_DIRTY_NAME);
+    assert(INFO_NextDirty(INFO_DIRTY_NAME + 1) == INFO_DIRTY_COUNT);
+
+    INFO_ClearDirty(INFO_DIRTY_VALUE_1);
+    INFO_ClearDirty(INFO_DIRTY_VALUE_3);
+    INFO_ClearDirty(INFO_DIRTY_VALUE_35);
+    assert(INFO_NextDirty(0) == INFO_DIRTY_NAME);
+    INFO_ClearDirty(INFO_DIRTY_NAME);
+    assert(INFO_NextDirty(0) == INFO_DIRTY_COUNT);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestEntryTable(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries, options=""):
+        ProcessEntries(self.bi, entries, '"Entry_Table": true,' + options)
+
+    def test_IdsAndDescriptors_InJSONOrder(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[8]:w:Name": "VALUE",
+            "uint32:Read_Only": 3
+            """
+        )
+        lines = [
+            "#ifndef BUILD_INFO_ENTRY_T_",
+            "} BuildInfo_Entry_t;",
+            "typedef enum {",
+            "    INFO_ID_SMALL,",
+            "    INFO_ID_NAME,",
+            "    INFO_ID_READ_ONLY,",
+            "    INFO_ID_COUNT",
+            "} INFO_Id_t;",
+            "extern const BuildInfo_Entry_t INFO_Entries[INFO_ID_COUNT];",
+            "uint8_t INFO_GetById(INFO_Id_t id, void *buff_ptr, uint16_t len);",
+            "uint8_t INFO_SetById(INFO_Id_t id, const void *buff_ptr, uint16_t len);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+        lines = [
+            "#include <string.h>",
+            "const BuildInfo_Entry_t INFO_Entries[INFO_ID_COUNT] = {",
+            "    {&INFO_Small, sizeof(INFO_Small), BUILD_INFO_TYPE_UINT8, BUILD_INFO_FLAG_WRITABLE},",
+            "    {&INFO_Name, sizeof(INFO_Name), BUILD_INFO_TYPE_STRING, BUILD_INFO_FLAG_WRITABLE},",
+            "    {&INFO_Read_Only, sizeof(INFO_Read_Only), BUILD_INFO_TYPE_UINT32, 0},",
+            "};",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+
+    def test_Default_NoTable(self):
+        self.bi.ProcessJSON('{"uint32:w:Number": 1}')
+        self.assertNotIn("BuildInfo_Entry_t", self.bi.GetH())
+        self.assertNotIn("ById", self.bi.GetC())
+
+    def test_NoAccessors_StorageKept(self):
+        self.ProcessJSON('"uint32:Number": {"Value": 1, "Accessors": []}')
+        self.assertIn("static const uint32_t INFO_Number = 1;", self.bi.GetC())
+        self.assertIn("    INFO_ID_NUMBER,", self.bi.GetH())
+
+    def test_PackedStruct_DescriptorPointsToMember(self):
+        self.ProcessJSON('"uint32:w:Number": 1', '"Packed_Struct": true,')
+        self.assertIn(
+            "{&INFO_Config.Number, sizeof(INFO_Config.Number),",
+            self.bi.GetC(),
+        )
+
+    def test_Compiles_GetSetById(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[8]:w:Name": "VALUE",
+            "double:w:Ratio": 0.5,
+            "uint32:Read_Only": 3
+            """
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+int main(void) {
+    uint8_t small = 0;
+    uint32_t number = 0;
+    double ratio = 0.0;
+    char name[8];
+
+    assert(INFO_Entries[INFO_ID_NAME].size == 8);
+    assert(INFO_GetById(INFO_ID_SMALL, &small, sizeof(small)) == 1);
+    assert(small == 1);
+    assert(INFO_GetById(INFO_ID_READ_ONLY, &number, sizeof(number)) == 1);
+    assert(number == 3);
+    assert(INFO_GetById(INFO_ID_READ_ONLY, &small, sizeof(small)) == 0);
+    assert(INFO_GetById(INFO_ID_COUNT, &number, sizeof(number)) == 0);
+
+    small = 2;
+    assert(INFO_SetById(INFO_ID_SMALL, &small, sizeof(small)) == 1);
+    assert(INFO_GetSmall() == 2);
+    ratio = 1.5;
+    assert(INFO_SetById(INFO_ID_RATIO, &ratio, sizeof(ratio)) == 1);
+    assert(INFO_GetRatio() == 1.5);
+    assert(INFO_SetById(INFO_ID_READ_ONLY, &number, sizeof(number)) == 0);
+    assert(INFO_SetById(INFO_ID_RATIO, &small, sizeof(small)) == 0);
+
+    assert(INFO_SetById(INFO_ID_NAME, "NEW", 4) == 1);
+    assert(strcmp(INFO_PtrName(), "NEW") == 0);
+    assert(INFO_SetById(INFO_ID_NAME, "TOO LONG NAME", 14) == 0);
+    assert(strcmp(INFO_PtrName(), "TOO LON") == 0);
+
+    assert(INFO_GetById(INFO_ID_NAME, name, sizeof(name)) == 1);
+    assert(strcmp(name, "TOO LON") == 0);
+    assert(INFO_GetById(INFO_ID_NAME, name, 4) == 0);
+    assert(strcmp(name, "TOO") == 0);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import Mock
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+CONFIG = """[{
+    "macro:CRITICAL_BLOCK(code)": "do { code } while (0)",
+    "feature:Logging": true
+}, {
+    "Section_Prefix": "INFO",
+    "feature:Usb_Host": false,
+    "uint32:Number": 1
+}]"""
+
+
+class TestFeatures(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def test_Defines_WithMacros(self):
+        self.bi.ProcessJSON(CONFIG)
+        lines = [
+            "#define CRITICAL_BLOCK(code) do { code } while (0)",
+            "#define FEATURE_LOGGING 1",
+            "#define INFO_FEATURE_USB_HOST 0",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+        self.assertNotIn("FEATURE", self.bi.GetC())
+
+    def test_Config_Summary(self):
+        self.bi.ProcessJSON(CONFIG)
+        self.assertEqual(
+            "# Code generated automatically.\n"
+            + "CONFIG_FEATURE_LOGGING=y\n"
+            + "# CONFIG_INFO_FEATURE_USB_HOST is not set\n",
+            self.bi.GetFeatureConfig(),
+        )
+
+    def test_NoFeatures_NoConfig(self):
+        self.bi.ProcessJSON('{"uint32:Number": 1}')
+        self.assertEqual("", self.bi.GetFeatureConfig())
+
+    def test_Invalid(self):
+        for entry in (
+            '"feature:Usb_Host": 1',
+            '"feature[1]:Usb_Host": true',
+            '"feature:w:Usb_Host": true',
+        ):
+            with self.subTest(entry=entry):
+                self.bi.Reset()
+                with self.assertRaises(ValueError):
+                    self.bi.ProcessJSON(f"{{{entry}}}")
+
+    def test_Main_WritesConfig(self):
+        open = OpenMock()
+        open.SetFileData("input.json", CONFIG)
+        argv = ["build_info.py", "input.json", "output"]
+        self.assertEqual(0, bi.main(argv, open=open, print=Mock()))
+        self.assertIn(
+            "CONFIG_FEATURE_LOGGING=y\n", open.GetFileData("output.config")
+        )
+
+    def test_Compiles_DisabledCodeRemoved(self):
+        self.bi.ProcessJSON(CONFIG)
+        main_c = """
+#include "info.h"
+
+#if INFO_FEATURE_USB_HOST
+#error "disabled feature compiled"
+#endif
+
+int main(void) {
+#if FEATURE_LOGGING
+    return 0;
+#endif
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
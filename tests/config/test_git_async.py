@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import patch
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestProcessJSONAsync(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.git_mock = GitMock()
+        self.git_mock.SetCommitString("MOCKED_COMMIT_STRING")
+        self.patch = patch("build_info.git", self.git_mock)
+        self.patch_enter = self.patch.__enter__()
+        self.json_data = """[
+            {
+                "Section_Prefix": "FIRST",
+                "uint8:Before": 1,
+                "Git_Repository": ".",
+                "uint8:After": 2
+            },
+            {
+                "Section_Prefix": "SECOND",
+                "Git_Repository": "."
+            }
+        ]"""
+
+    def tearDown(self) -> None:
+        self.patch.__exit__(None, None, None)
+        return super().tearDown()
+
+    def test_SameCodeAsProcessJSON(self):
+        sync_converter = bi.BuildInfo()
+        sync_converter.ProcessJSON(self.json_data)
+        async_converter = bi.BuildInfo()
+        asyncio.run(async_converter.ProcessJSONAsync(self.json_data))
+        self.assertEqual(sync_converter.GetC(), async_converter.GetC())
+        self.assertEqual(sync_converter.GetH(), async_converter.GetH())
+
+    def test_SameCodeAsProcessJSON_OptionsAfterKey(self):
+        json_data = """{
+            "Git_Repository": ".",
+            "Accessors": ["Get"],
+            "Header_Constants": true,
+            "String_Pool": true,
+            "string:Name": "VALUE"
+        }"""
+        sync_converter = bi.BuildInfo()
+        sync_converter.ProcessJSON(json_data)
+        async_converter = bi.BuildInfo()
+        asyncio.run(async_converter.ProcessJSONAsync(json_data))
+        self.assertIn("PtrGitCommitStr", async_converter.GetH())
+        self.assertEqual(sync_converter.GetC(), async_converter.GetC())
+        self.assertEqual(sync_converter.GetH(), async_converter.GetH())
+
+    def test_CommitStringAtOriginalPosition(self):
+        converter = bi.BuildInfo()
+        asyncio.run(converter.ProcessJSONAsync(self.json_data))
+        lines = [
+            "static const uint8_t FIRST_Before = 1;",
+            'static const char FIRST_Git_Commit_Str[] = "MOCKED_COMMIT_STRING";',
+            "static const uint8_t FIRST_After = 2;",
+            'static const char SECOND_Git_Commit_Str[] = "MOCKED_COMMIT_STRING";',
+        ]
+        AssertIsInSequence(lines, converter.GetC(), self)
+
+    def test_InvalidJSON_RaisesValueError(self):
+        for json_data in ["0", "[0]", '{"Git_Repository": 0}']:
+            with self.subTest(json_data=json_data):
+                with self.assertRaises(ValueError):
+                    asyncio.run(bi.BuildInfo().ProcessJSONAsync(json_data))
+
+    def test_GitQueriesOverlapWithGeneration(self):
+        events = []
+
+        async def GetCommitStringAsync(git_data, repository):
+            events.append(f"start {repository}")
+            await asyncio.sleep(0.01)
+            events.append(f"end {repository}")
+            return repository
+
+        json_data = """{
+            "Git_Repository": {"Directory": "A", "Backend": "binary"},
+            "Git_Repository ": {"Directory": "B", "Backend": "binary"},
+            "uint8:Value": 1
+        }"""
+        converter = bi.BuildInfo()
+        with patch.object(
+            bi.GitBinaryData, "GetCommitStringAsync", GetCommitStringAsync
+        ):
+            asyncio.run(converter.ProcessJSONAsync(json_data))
+        self.assertEqual(["start A", "start B", "end A", "end B"], events)
+        lines = [
+            'static const char Git_Commit_Str[] = "A";',
+            'static const char Git_Commit_Str[] = "B";',
+            "static const uint8_t Value = 1;",
+        ]
+        AssertIsInSequence(lines, converter.GetC(), self)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git executable not found")
+class TestGitBinaryDataAsync(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = self.tmp_dir.name
+        env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "Author",
+            "GIT_AUTHOR_EMAIL": "author@example.com",
+            "GIT_COMMITTER_NAME": "Author",
+            "GIT_COMMITTER_EMAIL": "author@example.com",
+        }
+        for args in [
+            ["init", "-q"],
+            ["commit", "-q", "--allow-empty", "-m", "first"],
+            ["tag", "v1.0"],
+            ["commit", "-q", "--allow-empty", "-m", "second"],
+        ]:
+            subprocess.run(["git", *args], cwd=self.repo, env=env, check=True)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_SameAsSynchronous(self):
+        for dirty_detection in bi.GitData.DIRTY_DETECTIONS:
+            with self.subTest(dirty_detection=dirty_detection):
+                git_data = bi.GitBinaryData(dirty_detection, time_budget=60)
+                expected = git_data.GetCommitString(self.repo)
+                commit_string = asyncio.run(
+                    git_data.GetCommitStringAsync(self.repo)
+                )
+                self.assertEqual(expected, commit_string)
+                self.assertTrue(commit_string.startswith("v1.0-1-g"))
+
+    def test_PythonBackend(self):
+        git_data = bi.GitDirData("off")
+        commit_string = asyncio.run(git_data.GetCommitStringAsync(self.repo))
+        self.assertEqual(git_data.GetCommitString(self.repo), commit_string)
+
+    def test_GitError_IsRaised(self):
+        git_data = bi.GitBinaryData()
+        with tempfile.TemporaryDirectory() as not_a_repo:
+            with self.assertRaises(bi.GitCommandError):
+                asyncio.run(git_data.GetCommitStringAsync(not_a_repo))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import Mock, patch
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+@unittest.skipIf(shutil.which("git") is None, "git executable not found")
+class TestGitDirReader(unittest.TestCase):
+    """Compare the .git reader with the git executable on real repos."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = os.path.join(self.tmp_dir.name, "repo")
+        os.mkdir(self.repo)
+        self.environ = patch.dict(
+            os.environ,
+            {
+                "HOME": self.tmp_dir.name,
+                "XDG_CONFIG_HOME": self.tmp_dir.name,
+                "GIT_CONFIG_NOSYSTEM": "1",
+                "GIT_AUTHOR_NAME": "Author",
+                "GIT_AUTHOR_EMAIL": "author@example.com",
+                "GIT_COMMITTER_NAME": "Author",
+                "GIT_COMMITTER_EMAIL": "author@example.com",
+            },
+        )
+        self.environ.start()
+        self.Git("init", "-q")
+        self.Commit("first")
+
+    def tearDown(self):
+        self.environ.stop()
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def Git(self, *args, cwd=None):
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd or self.repo,
+            stdout=subprocess.PIPE,
+            check=True,
+            universal_newlines=True,
+        )
+        return result.stdout.strip()
+
+    def Commit(self, name):
+        with open(os.path.join(self.repo, name), "w") as fp:
+            fp.write(name * 100 + "\n")
+        self.Git("add", name)
+        self.Git("commit", "-q", "-m", name)
+
+    def AssertSameAsGit(self, path=None):
+        path = path or self.repo
+        expected = self.Git("describe", "--always", "--tags", cwd=path)
+        self.assertEqual(expected, bi.GitDirReader(path).Describe())
+
+    def test_NoTags_AbbreviatedCommit(self):
+        self.AssertSameAsGit()
+
+    def test_LightweightTag_ExactMatch(self):
+        self.Git("tag", "v1.0")
+        self.AssertSameAsGit()
+
+    def test_AnnotatedTag_WithDistance(self):
+        self.Git("tag", "-a", "-m", "Version 1.0", "v1.0")
+        self.Commit("second")
+        self.Commit("third")
+        self.AssertSameAsGit()
+
+    def test_AnnotatedTagIsPreferred(self):
+        self.Git("tag", "v1.0-light")
+        self.Git("tag", "-a", "-m", "Version 1.0", "v1.0")
+        self.Commit("second")
+        self.AssertSameAsGit()
+
+    def test_PackedRefsAndObjects(self):
+        self.Git("tag", "-a", "-m", "Version 1.0", "v1.0")
+        for i in range(5):
+            self.Commit(f"file{i}")
+        self.Git("tag", "lightweight/tag")
+        self.Commit("last")
+        self.Git("gc", "-q", "--aggressive")
+        self.assertFalse(
+            os.path.isdir(os.path.join(self.repo, ".git/refs/tags/v1.0"))
+        )
+        self.AssertSameAsGit()
+
+    def test_SubdirectoryOfRepository(self):
+        os.mkdir(os.path.join(self.repo, "sub"))
+        self.AssertSameAsGit(os.path.join(self.repo, "sub"))
+
+    def test_LinkedWorktree(self):
+        self.Git("tag", "v1.0")
+        worktree = os.path.join(self.tmp_dir.name, "worktree")
+        self.Git("worktree", "add", "-q", "-b", "other", worktree)
+        self.Commit("only_in_master")
+        self.AssertSameAsGit(worktree)
+
+    def test_MergeBeforeTag_CannotDecide(self):
+        self.Git("tag", "v1.0")
+        self.Git("checkout", "-q", "-b", "feature")
+        self.Commit("feature")
+        self.Git("checkout", "-q", "-")
+        self.Commit("master")
+        self.Git("merge", "-q", "--no-edit", "feature")
+        self.assertIsNone(bi.GitDirReader(self.repo).Describe())
+
+    def test_NotARepository_CannotDecide(self):
+        shutil.rmtree(os.path.join(self.repo, ".git"))
+        self.assertIsNone(bi.GitDirReader(self.repo).Describe())
+
+    def test_IndexDirty(self):
+        self.assertFalse(bi.GitDirReader(self.repo).IsIndexDirty())
+        with open(os.path.join(self.repo, "first"), "w") as fp:
+            fp.write("changed\n")
+        self.assertFalse(bi.GitDirReader(self.repo).IsIndexDirty())
+        self.Git("add", "first")
+        self.assertTrue(bi.GitDirReader(self.repo).IsIndexDirty())
+
+    def test_IndexDirty_NewFileInSubdirectory(self):
+        self.Git("gc", "-q")
+        os.mkdir(os.path.join(self.repo, "sub"))
+        with open(os.path.join(self.repo, "sub", "new"), "w") as fp:
+            fp.write("new\n")
+        self.Git("add", "sub/new")
+        self.assertTrue(bi.GitDirReader(self.repo).IsIndexDirty())
+        self.Git("rm", "-q", "--cached", "sub/new")
+        self.assertFalse(bi.GitDirReader(self.repo).IsIndexDirty())
+
+    def test_PythonBackend_DoesNotSpawnProcess(self):
+        self.Git("tag", "v1.0")
+        self.Git("add", "-A")
+        git_data = bi.GitDirData("index_only")
+        with patch("build_info.subprocess.run") as run:
+            commit_string = git_data.GetCommitString(self.repo)
+        run.assert_not_called()
+        self.assertEqual("v1.0", commit_string)
+
+    def test_PythonBackend_FallsBackToGitExecutable(self):
+        self.Git("tag", "v1.0")
+        self.Git("checkout", "-q", "-b", "feature")
+        self.Commit("feature")
+        self.Git("checkout", "-q", "-")
+        self.Commit("master")
+        self.Git("merge", "-q", "--no-edit", "feature")
+        expected = self.Git("describe", "--always", "--tags", "--dirty=-D")
+        self.assertEqual(expected, bi.GitDirData().GetCommitString(self.repo))
+        self.assertEqual(
+            expected, bi.GitDirData("off").GetCommitString(self.repo)
+        )
+
+    def test_BinaryBackend(self):
+        self.Git("tag", "v1.0")
+        self.Commit("second")
+        with open(os.path.join(self.repo, "first"), "w") as fp:
+            fp.write("changed\n")
+        expected = self.Git("describe", "--always", "--tags", "--dirty=-D")
+        for dirty_detection in ["full", "fsmonitor"]:
+            git_data = bi.GitBinaryData(dirty_detection)
+            self.assertEqual(expected, git_data.GetCommitString(self.repo))
+        git_data = bi.GitBinaryData("index_only")
+        self.assertEqual(
+            expected[: -len("-D")], git_data.GetCommitString(self.repo)
+        )
+
+    def test_BackendOption(self):
+        self.Git("tag", "v1.0")
+        for backend in ["python", "binary"]:
+            with self.subTest(backend=backend):
+                converter = bi.BuildInfo()
+                converter.ProcessJSON(
+                    f'{{"Git_Repository": {{"Directory": "{self.repo}",'
+                    + f' "Backend": "{backend}"}}}}'
+                )
+                lines = ['static const char Git_Commit_Str[] = "v1.0";']
+                AssertIsInSequence(lines, converter.GetC(), self)
+
+
+class TestGitBackendOption(unittest.TestCase):
+    def test_InvalidBackend_RaisesValueError(self):
+        for backend in ["", "GitPython", "git", 0, None]:
+            with self.subTest(backend=backend):
+                with self.assertRaises(ValueError):
+                    bi.BuildInfo().ProcessJSON(
+                        '{"Git_Repository": {"Directory": ".", "Backend": '
+                        + bi.json.dumps(backend)
+                        + "}}"
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,7 +35,7 @@ class TestProcessJSONGitCommitStr(unittest.TestCase):
     def test_GitCommitStr_AddsStringWithCommit_InC(self):
         self.bi.ProcessJSON('{"Git_Repository": "."}')
         lines = [
-            'static char Git_Commit_Str[] = "',
+            'static const char Git_Commit_Str[] = "',
             "const char *PtrGitCommitStr(void) {",
         ]
         code = self.bi.GetC()
@@ -57,7 +57,7 @@ class TestProcessJSONGitCommitStr(unittest.TestCase):
     def test_GitCommitStr_GetCorrectCommitString(self):
         self.git_mock.SetCommitString("MOCKED_COMMIT_STRING")
         self.bi.ProcessJSON('{"Git_Repository": "."}')
-        lines = ['static char Git_Commit_Str[] = "MOCKED_COMMIT_STRING"']
+        lines = ['static const char Git_Commit_Str[] = "MOCKED_COMMIT_STRING"']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
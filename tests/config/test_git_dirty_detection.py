@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import Mock, patch
+import itertools
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestProcessJSONGitDirtyDetection(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.bi = bi.BuildInfo()
+        self.git_mock = GitMock()
+        self.git_mock.SetCommitString("v1.0-3-gabcdef0")
+        self.patch = patch("build_info.git", self.git_mock)
+        self.patch_enter = self.patch.__enter__()
+        bi.GitData._cache.clear()
+
+    def tearDown(self) -> None:
+        bi.GitData._cache.clear()
+        self.patch.__exit__(None, None, None)
+        return super().tearDown()
+
+    def ProcessGitOptions(self, options):
+        options = {"Directory": ".", **options}
+        json_options = ", ".join(
+            f'"{key}": {bi.json.dumps(value)}' for key, value in options.items()
+        )
+        self.bi.ProcessJSON(f'{{"Git_Repository": {{{json_options}}}}}')
+
+    def AssertCommitString(self, commit_string):
+        lines = [f'static const char Git_Commit_Str[] = "{commit_string}";']
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+
+    def test_StringValue_FullDetection(self):
+        self.bi.ProcessJSON('{"Git_Repository": "."}')
+        describe_args = self.git_mock.GetCallArgs("describe")
+        self.assertEqual(
+            [(["--always", "--tags", "--dirty=-D", "--broken=-B"], {})],
+            describe_args,
+        )
+
+    def test_ObjectValue_DefaultIsFullDetection(self):
+        self.ProcessGitOptions({})
+        describe_args = self.git_mock.GetCallArgs("describe")
+        self.assertIn("--dirty=-D", describe_args[0][0])
+        self.AssertCommitString("v1.0-3-gabcdef0")
+
+    def test_FsmonitorDetection_KeepsRepositoryConfiguration(self):
+        self.ProcessGitOptions({"Dirty_Detection": "fsmonitor"})
+        self.assertEqual([], self.git_mock.GetCallArgs("options"))
+        describe_args = self.git_mock.GetCallArgs("describe")
+        self.assertIn("--dirty=-D", describe_args[0][0])
+
+    def test_IndexOnlyDetection_CleanIndex(self):
+        self.ProcessGitOptions({"Dirty_Detection": "index_only"})
+        describe_args = self.git_mock.GetCallArgs("describe")
+        self.assertEqual([(["--always", "--tags"], {})], describe_args)
+        diff_args = self.git_mock.GetCallArgs("diff_index")
+        self.assertEqual([(["--cached", "--quiet", "HEAD"], {})], diff_args)
+        self.AssertCommitString("v1.0-3-gabcdef0")
+
+    def test_IndexOnlyDetection_DirtyIndex(self):
+        self.git_mock.SetIndexDirty(True)
+        self.ProcessGitOptions({"Dirty_Detection": "index_only"})
+        self.AssertCommitString("v1.0-3-gabcdef0-D")
+
+    def test_OffDetection_DoesNotCheckWorkTree(self):
+        self.git_mock.SetIndexDirty(True)
+        self.ProcessGitOptions({"Dirty_Detection": "off"})
+        describe_args = self.git_mock.GetCallArgs("describe")
+        self.assertEqual([(["--always", "--tags"], {})], describe_args)
+        self.assertEqual([], self.git_mock.GetCallArgs("diff_index"))
+        self.AssertCommitString("v1.0-3-gabcdef0")
+
+    def test_InvalidDetection_RaisesValueError(self):
+        for detection in ["", "FULL", "fast", 0, None]:
+            with self.subTest(detection=detection):
+                with self.assertRaises(ValueError):
+                    self.ProcessGitOptions({"Dirty_Detection": detection})
+
+    def test_InvalidOptions_RaisesValueError(self):
+        options_list = [
+            {"Directory": 0},
+            {"Time_Budget": 0},
+            {"Time_Budget": -1.0},
+            {"Time_Budget": "1"},
+            {"Invalid_Option": 1},
+        ]
+        for options in options_list:
+            with self.subTest(options=options):
+                with self.assertRaises(ValueError):
+                    self.ProcessGitOptions(options)
+
+    def test_TimeBudget_PassesTimeoutToGit(self):
+        self.ProcessGitOptions({"Time_Budget": 2.5})
+        describe_args = self.git_mock.GetCallArgs("describe")
+        timeout = describe_args[0][1]["kill_after_timeout"]
+        self.assertTrue(0 < timeout <= 2.5)
+
+    def test_TimeBudget_Exceeded_UsesUndecoratedString(self):
+        self.git_mock.SetDirtyDescribeError(GitCommandErrorMock(-9))
+        monotonic = Mock(side_effect=itertools.count(step=5))
+        with patch("build_info.time.monotonic", monotonic):
+            self.ProcessGitOptions({"Time_Budget": 1})
+        describe_args = self.git_mock.GetCallArgs("describe")
+        self.assertEqual(["--always", "--tags"], describe_args[-1][0])
+        self.assertIn("kill_after_timeout", describe_args[-1][1])
+        self.AssertCommitString("v1.0-3-gabcdef0")
+
+    def test_TimeBudget_Exceeded_BothDescribesWithinBudget(self):
+        self.git_mock.SetDirtyDescribeError(GitCommandErrorMock(-9))
+        monotonic = Mock(side_effect=[0.0, 0.1, 0.6, 0.7])
+        with patch("build_info.time.monotonic", monotonic):
+            self.ProcessGitOptions({"Time_Budget": 1})
+        describe_args = self.git_mock.GetCallArgs("describe")
+        timeouts = [args[1]["kill_after_timeout"] for args in describe_args]
+        self.assertEqual([0.4, 0.3], [round(t, 6) for t in timeouts])
+
+    def test_TimeBudget_Exceeded_UsesCachedString(self):
+        self.git_mock.SetCommitString("v1.0-3-gabcdef0-D")
+        self.ProcessGitOptions({"Time_Budget": 1})
+
+        self.bi = bi.BuildInfo()
+        self.git_mock.SetCommitString("UNDECORATED")
+        self.git_mock.SetDirtyDescribeError(GitCommandErrorMock(-9))
+        monotonic = Mock(side_effect=itertools.count(step=5))
+        with patch("build_info.time.monotonic", monotonic):
+            self.ProcessGitOptions({"Time_Budget": 1})
+        self.AssertCommitString("v1.0-3-gabcdef0-D")
+
+    def test_TimeBudget_NotExceeded_ErrorIsRaised(self):
+        self.git_mock.SetDirtyDescribeError(GitCommandErrorMock(128))
+        with self.assertRaises(GitCommandErrorMock):
+            self.ProcessGitOptions({"Time_Budget": 60})
+
+
+if __name__ == "__main__":
+    unittest.main()
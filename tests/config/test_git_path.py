@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import patch
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+@unittest.skipIf(shutil.which("git") is None, "git executable not found")
+class TestGitPathScope(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = self.tmp_dir.name
+        self.environ = patch.dict(
+            os.environ,
+            {
+                "GIT_AUTHOR_NAME": "Author",
+                "GIT_AUTHOR_EMAIL": "author@example.com",
+                "GIT_COMMITTER_NAME": "Author",
+                "GIT_COMMITTER_EMAIL": "author@example.com",
+            },
+        )
+        self.environ.start()
+        self.Git("init", "-q")
+        os.mkdir(os.path.join(self.repo, "motor"))
+        os.mkdir(os.path.join(self.repo, "radio"))
+        self.Write("motor/main.c", "1\n")
+        self.Commit("radio/main.c")
+        self.Git("tag", "v1.0")
+
+    def tearDown(self):
+        self.environ.stop()
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def Git(self, *args):
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.repo,
+            stdout=subprocess.PIPE,
+            check=True,
+            universal_newlines=True,
+        )
+        return result.stdout.strip()
+
+    def Commit(self, filename, data="1\n"):
+        self.Write(filename, data)
+        self.Git("add", ".")
+        self.Git("commit", "-q", "-m", filename)
+        return self.Git("rev-parse", "HEAD")
+
+    def Write(self, filename, data):
+        with open(os.path.join(self.repo, filename), "w") as fp:
+            fp.write(data)
+
+    def CommitString(self, path, dirty_detection="full", backend="binary"):
+        converter = bi.BuildInfo()
+        converter.ProcessJSON(
+            bi.json.dumps(
+                {
+                    "Git_Repository": {
+                        "Directory": self.repo,
+                        "Path": path,
+                        "Dirty_Detection": dirty_detection,
+                        "Backend": backend,
+                    }
+                }
+            )
+        )
+        code = converter.GetC()
+        prefix = 'Git_Commit_Str[] = "'
+        start = code.index(prefix) + len(prefix)
+        return code[start : code.index('"', start)]
+
+    def test_UnrelatedCommit_DoesNotChangeCommitString(self):
+        before = self.CommitString("motor")
+        self.Commit("radio/main.c", "2\n")
+        self.assertEqual(before, self.CommitString("motor"))
+        self.assertNotEqual(before, self.CommitString("radio"))
+
+    def test_LastCommitTouchingPath_IsDescribed(self):
+        self.Commit("radio/main.c", "2\n")
+        commit = self.Commit("motor/main.c", "2\n")
+        self.Commit("radio/main.c", "3\n")
+        expected = f"v1.0-2-g{commit[:7]}"
+        self.assertEqual(expected, self.CommitString("motor"))
+        self.assertEqual(expected, self.CommitString("motor", backend="python"))
+
+    def test_DirtyFile_OnlyInItsPath(self):
+        self.Write("radio/main.c", "dirty\n")
+        self.assertEqual("v1.0", self.CommitString("motor"))
+        self.assertEqual("v1.0-D", self.CommitString("radio"))
+        self.assertEqual("v1.0", self.CommitString("radio", "index_only"))
+        self.assertEqual("v1.0", self.CommitString("radio", "off"))
+        self.Git("add", "radio/main.c")
+        self.assertEqual("v1.0-D", self.CommitString("radio", "index_only"))
+        self.assertEqual("v1.0-D", self.CommitString("radio", "fsmonitor"))
+        self.assertEqual("v1.0", self.CommitString("motor", "index_only"))
+
+    def test_PathIsRelativeToDirectory(self):
+        converter = bi.BuildInfo()
+        converter.ProcessJSON(
+            bi.json.dumps(
+                {
+                    "Git_Repository": {
+                        "Directory": os.path.join(self.repo, "motor"),
+                        "Path": ".",
+                        "Backend": "binary",
+                    }
+                }
+            )
+        )
+        lines = ['Git_Commit_Str[] = "v1.0"']
+        AssertIsInSequence(lines, converter.GetC(), self)
+
+    def test_PathMustBeString(self):
+        for path in [0, [], {}, True]:
+            with self.subTest(path=path):
+                with self.assertRaises(ValueError):
+                    self.CommitString(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestHeaderConstants(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries, options='"Header_Constants": true,'):
+        ProcessEntries(self.bi, entries, options)
+
+    def test_ReadOnlyScalarsAndLengths(self):
+        self.ProcessJSON(
+            """
+            "Version": [1, 2, 3, "", ""],
+            "int8:Offset": -3,
+            "int64:Minimum": -9223372036854775808,
+            "double:Ratio": 0.5,
+            "bool:Feature": true,
+            "uint16[3]:Table": [1, 2, 3],
+            "string[16]:w:Name": "abc"
+            """
+        )
+        lines = [
+            "#define INFO_VERSION_STR_LEN 6",
+            "#define INFO_VERSION_NUM_VAL 66051u",
+            "#define INFO_OFFSET_VAL (-3)",
+            "#define INFO_MINIMUM_VAL (-9223372036854775807 - 1)",
+            "#define INFO_RATIO_VAL ((double)0.5)",
+            "#define INFO_FEATURE_VAL 1",
+            "#define INFO_TABLE_LEN 3",
+            "#define INFO_NAME_LEN 16",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+    def test_Writable_NoConstant(self):
+        self.ProcessJSON('"uint32:w:Number": 1')
+        self.assertNotIn("INFO_NUMBER", self.bi.GetH())
+
+    def test_Default_NoConstants(self):
+        self.ProcessJSON('"uint32:Number": 1', "")
+        self.assertNotIn("INFO_NUMBER", self.bi.GetH())
+
+    def test_EntryOption(self):
+        self.ProcessJSON(
+            """
+            "uint32:Number": {"Value": 1, "Header_Constants": true},
+            "uint32:Other": 2
+            """,
+            "",
+        )
+        self.assertIn("#define INFO_NUMBER_VAL 1u", self.bi.GetH())
+        self.assertNotIn("INFO_OTHER", self.bi.GetH())
+
+    def test_Compiles_PreprocessorAndSizes(self):
+        self.ProcessJSON(
+            """
+            "Version": [1, 2, 3, "", ""],
+            "bool:Feature": false,
+            "string:Name": "Build Info"
+            """
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+
+#if INFO_VERSION_NUM_VAL < 0x010200u || INFO_FEATURE_VAL
+#error "constants not usable in #if"
+#endif
+
+int main(void) {
+    char name[INFO_NAME_LEN];
+
+    assert(sizeof(name) == INFO_LenName());
+    assert(INFO_VERSION_NUM_VAL == INFO_GetVersionNum());
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+    def test_Compiles_UpperCaseNames(self):
+        self.ProcessJSON(
+            """
+            "uint8:CRC": 1,
+            "string:PATH": "/dev/ttyS0",
+            "uint8[2]:IDS": [1, 2]
+            """
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+
+int main(void) {
+    assert(INFO_CRC_VAL == INFO_GetCRC());
+    assert(INFO_PATH_LEN == INFO_LenPATH());
+    assert(INFO_IDS_LEN == INFO_LenIDS());
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+    def test_Compiles_StringLenWithEscapeSequences(self):
+        self.ProcessJSON(r'"string:Path": "a\\nb", "string[8]:Tab": "\\x41\\t"')
+        self.assertIn("#define INFO_PATH_LEN 4", self.bi.GetH())
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+int main(void) {
+    assert(INFO_PATH_LEN == INFO_LenPath());
+    assert(strcmp(INFO_PtrPath(), "a\\nb") == 0);
+    assert(strcmp(INFO_PtrTab(), "A\\t") == 0);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+    def test_StringWithInvalidEscapeSequence_RaisesValueError(self):
+        for value in (r"\\x100", r"\\777", "a\\\\"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    self.ProcessJSON(f'"string:Path": "{value}"')
+
+    def test_DefineWithNameOfVariable_RaisesValueError(self):
+        with self.assertRaises(ValueError):
+            self.ProcessJSON('"uint8:CRC": 1, "uint8:CRC_VAL": 2')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import Mock
+import json
+import struct
+import sys
+import zlib
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestImage(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries, options=""):
+        ProcessEntries(self.bi, entries, '"Image": true,' + options)
+
+    def test_Default_NoImage(self):
+        self.bi.ProcessJSON('{"uint32:Number": 1}')
+        self.assertEqual(b"", self.bi.GetImage())
+        self.assertNotIn("Image_t", self.bi.GetH())
+
+    def test_Image_NaturalAlignmentLittleEndian(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[5]:Name": "AB",
+            "uint32:Big": 258
+            """
+        )
+        image = self.bi.GetImage()
+        payload = b"\x01AB\0\0\0\0\0\x02\x01\0\0\0\0\0\0"
+        magic, layout_hash, size, crc = struct.unpack("<4I", image[:16])
+        self.assertEqual(0x464E4942, magic)
+        self.assertEqual(len(payload), size)
+        self.assertEqual(zlib.crc32(payload), crc)
+        self.assertEqual(payload, image[16:])
+
+        lines = [
+            "typedef struct {",
+            "    BuildInfo_Image_Header_t header;",
+            "    uint8_t Small;",
+            "    char Name[5];",
+            "    uint8_t pad_22[2];",
+            "    uint32_t Big;",
+            "    uint8_t pad_28[4];",
+            "} INFO_Image_t;",
+            f"#define INFO_IMAGE_LAYOUT_HASH 0x{layout_hash:08X}UL",
+            "const INFO_Image_t *INFO_MapImage(const void *address, uint32_t size);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+    def test_Image_StringWithEscapeSequences(self):
+        self.ProcessJSON(r'"string:Name": "A\\tB\\0"')
+        self.assertEqual(b"A\tB\0\0", self.bi.GetImage()[16:21])
+        self.assertIn("    char Name[5];", self.bi.GetH())
+
+    def test_Image_PackedBigEndian(self):
+        self.ProcessJSON(
+            '"uint8:Small": 1, "uint16:Number": 258',
+            '"Image_Endianness": "big", "Image_Alignment": 1,',
+        )
+        image = self.bi.GetImage()
+        self.assertEqual(0x464E4942, struct.unpack(">I", image[:4])[0])
+        self.assertEqual(b"\x01\x01\x02", image[16:])
+        self.assertIn("typedef struct BUILD_INFO_PACKED {", self.bi.GetH())
+
+    def test_Manifest_OffsetsOfModulesAndEntries(self):
+        self.bi.ProcessJSON(
+            """[{
+                "Image": true,
+                "Section_Prefix": "A",
+                "uint8:Small": 1
+            }, {
+                "Section_Prefix": "B",
+                "double:Ratio": 0.5
+            }]"""
+        )
+        manifest = json.loads(self.bi.GetImageManifest())
+        module_a, module_b = manifest["modules"]
+        self.assertEqual((0, 24), (module_a["offset"], module_a["size"]))
+        self.assertEqual((24, 24), (module_b["offset"], module_b["size"]))
+        self.assertEqual(
+            {
+                "name": "Ratio",
+                "type": "double",
+                "offset": 16,
+                "size": 8,
+                "writable": False,
+            },
+            module_b["entries"][0],
+        )
+        image = self.bi.GetImage()
+        self.assertEqual(48, len(image))
+        self.assertEqual(0.5, struct.unpack("<d", image[40:48])[0])
+
+    def test_InvalidOptions_Error(self):
+        for option in (
+            '"Image_Endianness": "middle"',
+            '"Image_Alignment": 3',
+        ):
+            with self.assertRaises(ValueError):
+                self.bi.ProcessJSON("{%s}" % option)
+
+    def test_IntelHex_RecordsAndExtendedAddress(self):
+        text = bi.IntelHex(bytes(range(20)), 0x1FFF8)
+        lines = [
+            ":020000040001F9",
+            ":08FFF8000001020304050607E5",
+            ":020000040002F8",
+            ":0800000008090A0B0C0D0E0F9C",
+            ":0400080010111213AE",
+            ":00000001FF",
+        ]
+        self.assertEqual(lines, text.split())
+
+    def test_Main_WritesImageFiles(self):
+        open = OpenMock()
+        open.SetFileData("input.json", '{"Image": true, "uint8:Small": 1}')
+        argv = ["build_info.py", "input.json", "output"]
+        self.assertEqual(0, bi.main(argv, open=open, print=Mock()))
+        self.assertEqual(24, len(open.GetFileData("output.bin")))
+        self.assertIn(":00000001FF", open.GetFileData("output.hex"))
+        self.assertIn('"modules"', open.GetFileData("output.layout.json"))
+
+        argv = ["build_info.py", "--verify", "input.json", "output"]
+        self.assertEqual(0, bi.main(argv, open=open, print=Mock()))
+
+    def test_Compiles_MapImage(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[6]:Name": "VALUE",
+            "double:Ratio": 0.5,
+            "bool:Enabled": true,
+            "int16:Offset": -2
+            """
+        )
+        image = ", ".join(str(byte) for byte in self.bi.GetImage())
+        main_c = f"""
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+static union {{
+    double align;
+    uint8_t data[{len(self.bi.GetImage())}];
+}} image = {{.data = {{{image}}}}};
+
+int main(void) {{
+    const INFO_Image_t *config = INFO_MapImage(image.data, sizeof(image.data));
+
+    assert(config != 0);
+    assert(config->Small == 1);
+    assert(strcmp(config->Name, "VALUE") == 0);
+    assert(config->Ratio == 0.5);
+    assert(config->Enabled == 1);
+    assert(config->Offset == -2);
+
+    assert(INFO_MapImage(image.data, sizeof(image.data) - 1) == 0);
+    image.data[sizeof(image.data) - 1] ^= 1;
+    assert(INFO_MapImage(image.data, sizeof(image.data)) == 0);
+    return 0;
+}}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import Mock
+import struct
+import sys
+import zlib
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+def Config(small, name, ratio):
+    return f"""[{{
+        "Image_Delta": true,
+        "Bool_Is_Integer": true,
+        "macro:CRITICAL_BLOCK(code)": "do {{ code }} while (0)"
+    }}, {{
+        "Section_Prefix": "INFO",
+        "uint8:w:Small": {small},
+        "string[8]:w:Name": "{name}",
+        "double:Ratio": {ratio}
+    }}]"""
+
+
+class TestImageDelta(unittest.TestCase):
+    def setUp(self):
+        self.old = bi.BuildInfo()
+        self.new = bi.BuildInfo()
+
+    def test_Delta_OnlyChangedEntries(self):
+        self.old.ProcessJSON(Config(1, "OLD", 0.5))
+        self.new.ProcessJSON(Config(2, "OLD", 0.5))
+        delta = self.new.GetImageDelta(self.old)
+
+        header = struct.unpack("<5I2H", delta[:24])
+        old_crc = struct.unpack("<I", self.old.GetImage()[12:16])[0]
+        new_crc = struct.unpack("<I", self.new.GetImage()[12:16])[0]
+        self.assertEqual(bi.DELTA_MAGIC, header[0])
+        self.assertEqual((old_crc, new_crc), header[2:4])
+        self.assertEqual((len(delta), 1, 0), header[4:7])
+        self.assertEqual(b"\0\0\x02", delta[24:27])
+        self.assertEqual(
+            zlib.crc32(delta[:27]), struct.unpack("<I", delta[27:])[0]
+        )
+
+    def test_Delta_NoChanges_Empty(self):
+        self.old.ProcessJSON(Config(1, "OLD", 0.5))
+        self.new.ProcessJSON(Config(1, "OLD", 0.5))
+        self.assertEqual(b"", self.new.GetImageDelta(self.old))
+
+    def test_Delta_LayoutChanged_Error(self):
+        self.old.ProcessJSON(Config(1, "OLD", 0.5))
+        self.new.ProcessJSON(Config(1, "OLD", 0.5).replace("[8]", "[9]"))
+        with self.assertRaises(ValueError):
+            self.new.GetImageDelta(self.old)
+
+    def test_Main_WritesDelta(self):
+        open = OpenMock()
+        open.SetFileData("old.json", Config(1, "OLD", 0.5))
+        open.SetFileData("new.json", Config(1, "NEW", 0.5))
+        argv = ["build_info.py", "--delta", "old.json", "new.json", "out"]
+        self.assertEqual(0, bi.main(argv, open=open, print=Mock()))
+        self.assertEqual(38, len(open.GetFileData("out")))
+
+    def test_Compiles_ApplyDelta(self):
+        self.old.ProcessJSON(Config(1, "OLD", 0.5))
+        self.new.ProcessJSON(Config(2, "NEW", 0.5))
+        delta = self.new.GetImageDelta(self.old)
+        image = ", ".join(str(byte) for byte in self.old.GetImage())
+        main_c = f"""
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+static union {{
+    double align;
+    uint8_t data[{len(self.old.GetImage())}];
+}} image = {{.data = {{{image}}}}};
+
+static uint8_t delta[] = {{{", ".join(str(byte) for byte in delta)}}};
+
+int main(void) {{
+    const INFO_Image_t *config;
+
+    delta[sizeof(delta) - 5] ^= 1;
+    assert(INFO_ApplyDelta(image.data, delta, sizeof(delta)) == 0);
+    delta[sizeof(delta) - 5] ^= 1;
+    assert(INFO_ApplyDelta(image.data, delta, sizeof(delta) - 1) == 0);
+    assert(INFO_MapImage(image.data, sizeof(image.data)) != 0);
+
+    assert(INFO_ApplyDelta(image.data, delta, sizeof(delta)) == 1);
+    config = INFO_MapImage(image.data, sizeof(image.data));
+    assert(config != 0);
+    assert(config->Small == 2);
+    assert(strcmp(config->Name, "NEW") == 0);
+    assert(config->Ratio == 0.5);
+
+    /* Base is not the image anymore. */
+    assert(INFO_ApplyDelta(image.data, delta, sizeof(delta)) == 0);
+    return 0;
+}}
+"""
+        CompileAndRun(self, self.old, main_c)
+
+    def test_Compiles_ApplyDeltaLargerThan64KiB(self):
+        values = ", ".join(["0"] * 20000)
+        entries = f'"uint32[]:w:Table": [{values}]'
+        ProcessEntries(self.old, entries, '"Image_Delta": true,')
+        ProcessEntries(
+            self.new, entries.replace("0", "7"), '"Image_Delta": true,'
+        )
+        delta = self.new.GetImageDelta(self.old)
+        header = struct.unpack("<5I2H", delta[:24])
+        self.assertEqual((len(delta), 1), header[4:6])
+        self.assertGreater(len(delta), 0x10000)
+        image = ", ".join(str(byte) for byte in self.old.GetImage())
+        main_c = f"""
+#include "info.h"
+#include <assert.h>
+
+static union {{
+    uint32_t align;
+    uint8_t data[{len(self.old.GetImage())}];
+}} image = {{.data = {{{image}}}}};
+
+static const uint8_t delta[] = {{{", ".join(str(byte) for byte in delta)}}};
+
+int main(void) {{
+    const INFO_Image_t *config;
+
+    assert(INFO_ApplyDelta(image.data, delta, sizeof(delta)) == 1);
+    config = INFO_MapImage(image.data, sizeof(image.data));
+    assert(config != 0);
+    assert(config->Table[0] == 7);
+    assert(config->Table[19999] == 7);
+    return 0;
+}}
+"""
+        CompileAndRun(self, self.old, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestInlineAccessors(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def test_Enabled_ReadAccessorsInlineInH(self):
+        self.bi.ProcessJSON(
+            """{
+                "Inline_Accessors": true,
+                "Section_Prefix": "INFO",
+                "uint32:w:Number": 1,
+                "string:Name": "VALUE"
+            }"""
+        )
+        lines = [
+            "extern uint32_t INFO_Number;",
+            "static inline uint32_t INFO_GetNumber(void) {",
+            "void INFO_SetNumber(uint32_t val);",
+            "extern const char INFO_Name[6];",
+            "static inline uint16_t INFO_LenName(void) {",
+            "static inline const char *INFO_PtrName(void) {",
+            "static inline bool INFO_GetName(char *buff_ptr, uint16_t len) {",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+        code_c = self.bi.GetC()
+        lines = [
+            "uint32_t INFO_Number = 1;",
+            'const char INFO_Name[] = "VALUE";',
+            "void INFO_SetNumber(uint32_t val) {",
+        ]
+        AssertIsInSequence(lines, code_c, self)
+        self.assertNotIn("static", code_c)
+        self.assertNotIn("GetNumber", code_c)
+
+    def test_FixedSizeString_DeclaredWithSize(self):
+        self.bi.ProcessJSON(
+            '{"Inline_Accessors": true, "string[16]:w:Name": "VALUE"}'
+        )
+        self.assertIn("extern char Name[16];", self.bi.GetH())
+        self.assertIn('char Name[16] = "VALUE";', self.bi.GetC())
+
+    def test_Compiles_StringWithEscapeSequences(self):
+        self.bi.ProcessJSON(
+            r"""{
+                "Inline_Accessors": true,
+                "Bool_Is_Integer": true,
+                "macro:CRITICAL_BLOCK(code)": "do { code } while (0)",
+                "string:Name": "A\\tB"
+            }"""
+        )
+        self.assertIn("extern const char Name[4];", self.bi.GetH())
+        main_c = """
+#include "info.h"
+int main(void) {
+    return !(LenName() == 4 && PtrName()[1] == '\\t');
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+    def test_Entry_OnlyThisEntryInline(self):
+        self.bi.ProcessJSON(
+            """{
+                "uint32:Hot": {"Value": 1, "Inline_Accessors": true},
+                "uint32:Cold": 2
+            }"""
+        )
+        code_h = self.bi.GetH()
+        self.assertIn("static inline uint32_t GetHot(void) {", code_h)
+        self.assertIn("uint32_t GetCold(void);", code_h)
+        self.assertIn("static const uint32_t Cold = 2;", self.bi.GetC())
+
+    def test_Invalid_RaisesValueError(self):
+        with self.assertRaises(ValueError):
+            self.bi.ProcessJSON('{"Inline_Accessors": 1}')
+
+    def test_Enabled_Compiles(self):
+        self.bi.ProcessJSON(
+            """{
+                "Inline_Accessors": true,
+                "Bool_Is_Integer": true,
+                "macro:CRITICAL_BLOCK(code)": "do { code } while (0)",
+                "uint32:w:Number": 1,
+                "string:w:Name": "VALUE"
+            }"""
+        )
+        main_c = """
+#include "info.h"
+#include <string.h>
+int main(void) {
+    char buff[8];
+    SetNumber(2);
+    SetName("NEW", 4);
+    return !(GetNumber() == 2 && LenName() == 6 && GetName(buff, 8)
+             && strcmp(buff, "NEW") == 0);
+}
+"""
+        CompileAndRun(self, self.bi, main_c, ["-O2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
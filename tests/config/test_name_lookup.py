@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+NAMES = ["Name_%d" % i for i in range(40)] + ["A", "S", "R", "N"]
+
+
+class TestNameLookup(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries):
+        ProcessEntries(self.bi, entries, '"Name_Lookup": true,')
+
+    def test_PerfectHash_EachNameInItsSlot(self):
+        for size in (1, 2, 4, len(NAMES)):
+            names = NAMES[-size:]
+            displacements, slots = bi.BuildInfo._PerfectHash(names)
+            self.assertEqual(sorted(slots), list(range(size)))
+            for index, name in enumerate(names):
+                value = displacements[bi.BuildInfo._NameHash(0, name) % size]
+                if value < 0:
+                    slot = -value - 1
+                else:
+                    slot = bi.BuildInfo._NameHash(value, name) % size
+                self.assertEqual(slots[slot], index)
+
+    def test_NamesAndLookupFunction(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "uint32:Read_Only": 3
+            """
+        )
+        lines = [
+            "    INFO_ID_COUNT",
+            "extern const char *const INFO_Names[INFO_ID_COUNT];",
+            "uint8_t INFO_IdByName(const char *name, INFO_Id_t *id_ptr);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+        lines = [
+            "static uint32_t BuildInfo_NameHash(uint32_t seed, const char *name) {",
+            "const char *const INFO_Names[INFO_ID_COUNT] = {",
+            '    "Small",',
+            '    "Read_Only",',
+            "static const int32_t INFO_Name_Displacements[2] = {",
+            "static const uint16_t INFO_Name_Slots[2] = {",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+
+    def test_Compiles_IdByName(self):
+        self.ProcessJSON(
+            ", ".join('"uint32:%s": %d' % (n, i) for i, n in enumerate(NAMES))
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+
+int main(void) {
+    INFO_Id_t id;
+    uint32_t value;
+    int i;
+
+    for (i = 0; i < INFO_ID_COUNT; i++) {
+        assert(INFO_IdByName(INFO_Names[i], &id) == 1);
+        assert(id == (INFO_Id_t)i);
+        assert(INFO_GetById(id, &value, sizeof(value)) == 1);
+        assert(value == (uint32_t)i);
+    }
+    assert(INFO_IdByName("", &id) == 0);
+    assert(INFO_IdByName("Name_", &id) == 0);
+    assert(INFO_IdByName("Unknown", &id) == 0);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
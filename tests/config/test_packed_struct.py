@@ -0,0 +1,211 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import re
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestPackedStruct(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries):
+        ProcessEntries(self.bi, entries, '"Packed_Struct": true,')
+
+    def GetLayoutHash(self):
+        return re.search(
+            "#define INFO_CONFIG_LAYOUT_HASH (.*)\n", self.bi.GetH()
+        ).group(1)
+
+    def test_WritableEntries_InStructOrderedBySize(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[8]:w:Name": "VALUE",
+            "uint32:w:Big": 2,
+            "uint32:Read_Only": 3
+            """
+        )
+        lines = [
+            "typedef struct {",
+            "    uint32_t Big;",
+            "    uint8_t Small;",
+            "    char Name[8];",
+            "} INFO_Config_t;",
+            "#define INFO_CONFIG_LAYOUT_HASH 0x",
+            '#define INFO_CONFIG_DEFAULTS {2, 1, "VALUE"}',
+            "void INFO_SnapshotConfig(INFO_Config_t *config);",
+            "void INFO_SaveConfig(INFO_Config_Block_t *block);",
+            "uint8_t INFO_LoadConfig(const INFO_Config_Block_t *block);",
+            "void INFO_ResetConfig(void);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+        code = self.bi.GetC()
+        lines = [
+            "static const uint32_t INFO_Read_Only = 3;",
+            "static INFO_Config_t INFO_Config = INFO_CONFIG_DEFAULTS;",
+            "val = INFO_Config.Small;",
+            "INFO_Config.Big = val;",
+        ]
+        AssertIsInSequence(lines, code, self)
+        self.assertNotIn("INFO_Small =", code)
+
+    def test_Default_NoStruct(self):
+        self.bi.ProcessJSON('{"uint32:w:Number": 1}')
+        self.assertNotIn("typedef", self.bi.GetH())
+        self.assertIn("static uint32_t Number = 1;", self.bi.GetC())
+
+    def test_LayoutHash_ChangesOnlyWithLayout(self):
+        self.ProcessJSON('"uint32:w:Number": 1, "uint8:w:Small": 1')
+        layout_hash = self.GetLayoutHash()
+
+        self.ProcessJSON('"uint32:w:Number": 2, "uint8:w:Small": 3')
+        self.assertEqual(layout_hash, self.GetLayoutHash())
+
+        for entries in (
+            '"uint16:w:Number": 1, "uint8:w:Small": 1',
+            '"uint32:w:Other": 1, "uint8:w:Small": 1',
+            '"uint32:w:Number": 1',
+        ):
+            with self.subTest(entries=entries):
+                self.ProcessJSON(entries)
+                self.assertNotEqual(layout_hash, self.GetLayoutHash())
+
+    def test_InlineAccessors_StructIsExtern(self):
+        self.bi.ProcessJSON(
+            """{
+                "Packed_Struct": true,
+                "Inline_Accessors": true,
+                "uint32:w:Number": 1
+            }"""
+        )
+        self.assertIn("extern Config_t Config;", self.bi.GetH())
+        self.assertIn("\nConfig_t Config = CONFIG_DEFAULTS;", self.bi.GetC())
+
+    def test_Compiles_LoadSaveReset(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[8]:w:Name": "VALUE",
+            "double:w:Ratio": 0.5
+            """
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+int main(void) {
+    INFO_Config_Block_t block;
+
+    INFO_SaveConfig(&block);
+    assert(block.layout_hash == INFO_CONFIG_LAYOUT_HASH);
+    assert(block.config.Small == 1 && block.config.Ratio == 0.5);
+    assert(strcmp(block.config.Name, "VALUE") == 0);
+
+    INFO_SetSmall(2);
+    INFO_SetName("NEW", 4);
+    assert(INFO_LoadConfig(&block) == 1);
+    assert(INFO_GetSmall() == 1);
+    assert(strcmp(INFO_PtrName(), "VALUE") == 0);
+
+    block.config.Small = 3;
+    block.layout_hash ^= 1;
+    assert(INFO_LoadConfig(&block) == 0);
+    assert(INFO_GetSmall() == 1);
+
+    INFO_SetRatio(1.5);
+    INFO_ResetConfig();
+    assert(INFO_GetRatio() == 0.5);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+    def test_Compiles_LoadResetMarkDirtyAndBumpVersions(self):
+        ProcessEntries(
+            self.bi,
+            """
+            "uint64:w:Big": 1,
+            "string[24]:w:Name": "VALUE",
+            "uint8:Read_Only": 2
+            """,
+            """
+            "Packed_Struct": true, "Dirty_Tracking": true,
+            "Seqlock": "entry", "Target_Word_Size": 32,
+            "String_Copy": "memcpy", "String_Chunk_Size": 8,
+            """,
+        )
+        lines = [
+            "uint8_t INFO_LoadConfig(const INFO_Config_Block_t *block) {",
+            "    CRITICAL_BLOCK(",
+            "        INFO_Config = block->config;",
+            "        INFO_Dirty[INFO_DIRTY_BIG / 32] |= (uint32_t)1 << (INFO_DIRTY_BIG % 32);",
+            "        INFO_Name_Version++;",
+            "        INFO_Dirty[INFO_DIRTY_NAME / 32] |= (uint32_t)1 << (INFO_DIRTY_NAME % 32);",
+            "    );",
+            "void INFO_ResetConfig(void) {",
+            "    CRITICAL_BLOCK(",
+            "        INFO_Config = defaults;",
+            "        INFO_Dirty[INFO_DIRTY_BIG / 32] |= (uint32_t)1 << (INFO_DIRTY_BIG % 32);",
+            "        INFO_Name_Version++;",
+            "        INFO_Dirty[INFO_DIRTY_NAME / 32] |= (uint32_t)1 << (INFO_DIRTY_NAME % 32);",
+            "    );",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+        self.assertNotIn("_Seq", self.bi.GetC())
+
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+int main(void) {
+    INFO_Config_Block_t block;
+    char name[24];
+
+    INFO_SaveConfig(&block);
+    block.config.Big = 3;
+    strcpy(block.config.Name, "LOADED");
+
+    assert(INFO_LoadConfig(&block) == 1);
+    assert(INFO_NextDirty(0) == INFO_DIRTY_BIG);
+    assert(INFO_NextDirty(INFO_DIRTY_BIG + 1) == INFO_DIRTY_NAME);
+    assert(INFO_GetBig() == 3);
+    assert(INFO_GetName(name, sizeof(name)) == 1);
+    assert(strcmp(name, "LOADED") == 0);
+
+    INFO_ClearDirty(INFO_DIRTY_BIG);
+    INFO_ClearDirty(INFO_DIRTY_NAME);
+    assert(INFO_NextDirty(0) == INFO_DIRTY_COUNT);
+
+    INFO_ResetConfig();
+    assert(INFO_NextDirty(0) == INFO_DIRTY_BIG);
+    assert(INFO_NextDirty(INFO_DIRTY_BIG + 1) == INFO_DIRTY_NAME);
+    assert(INFO_GetBig() == 1);
+    assert(INFO_GetName(name, sizeof(name)) == 1);
+    assert(strcmp(name, "VALUE") == 0);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
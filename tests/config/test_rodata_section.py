@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestRodataSection(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def test_ReadOnly_IsConst(self):
+        self.bi.ProcessJSON(
+            '{"string:Name": "VALUE", "uint32:Number": 1, "bool:Flag": true}'
+        )
+        lines = [
+            'static const char Name[] = "VALUE";',
+            "static const uint32_t Number = 1;",
+            "static const bool Flag = true;",
+        ]
+        code = self.bi.GetC()
+        AssertIsInSequence(lines, code, self)
+        self.assertNotIn("BUILD_INFO_SECTION", code)
+
+    def test_Enabled_ReadOnlyInSectionOfPrefix(self):
+        self.bi.ProcessJSON(
+            """{
+                "Rodata_Section": true,
+                "Section_Prefix": "INFO",
+                "string:Name": "VALUE",
+                "uint32:Number": 1,
+                "uint32:w:Writable": 1
+            }"""
+        )
+        lines = [
+            "#ifndef BUILD_INFO_SECTION",
+            'static const char INFO_Name[] BUILD_INFO_SECTION(".rodata.INFO") = "VALUE";',
+            'static const uint32_t INFO_Number BUILD_INFO_SECTION(".rodata.INFO") = 1;',
+            "static uint32_t INFO_Writable = 1;",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+
+    def test_Enabled_NoPrefix(self):
+        self.bi.ProcessJSON('{"Rodata_Section": true, "uint32:Number": 1}')
+        self.assertIn(
+            'static const uint32_t Number BUILD_INFO_SECTION(".rodata") = 1;',
+            self.bi.GetC(),
+        )
+
+    def test_FunctionSections_SectionPerVariable(self):
+        self.bi.ProcessJSON(
+            """{
+                "Rodata_Section": true,
+                "Function_Sections": true,
+                "Section_Prefix": "INFO",
+                "uint32:Number": 1
+            }"""
+        )
+        self.assertIn(
+            'static const uint32_t INFO_Number BUILD_INFO_SECTION(".rodata.INFO_Number") = 1;',
+            self.bi.GetC(),
+        )
+
+    def test_Enabled_Compiles(self):
+        self.bi.ProcessJSON(
+            """[{
+                "Rodata_Section": true,
+                "Bool_Is_Integer": true,
+                "macro:CRITICAL_BLOCK(code)": "do { code } while (0)"
+            }, {
+                "Section_Prefix": "INFO",
+                "string:Name": "VALUE",
+                "uint32:Number": 1,
+                "bool:Flag": true
+            }]"""
+        )
+        main_c = """
+#include "info.h"
+#include <string.h>
+int main(void) {
+    return !(INFO_GetNumber() == 1 && INFO_GetFlag() == 1
+             && strcmp(INFO_PtrName(), "VALUE") == 0);
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
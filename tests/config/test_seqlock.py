@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+MACROS = """
+    "macro:CRITICAL_BLOCK(code)": "do { extern void Lock(void); extern void Unlock(void); Lock(); code Unlock(); } while (0)",
+    "macro:MEMORY_BARRIER()": "__sync_synchronize()"
+"""
+
+
+class TestSeqlock(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries, options=""):
+        options = '"Target_Word_Size": 32,' + options
+        ProcessEntries(self.bi, entries, options, MACROS)
+
+    def test_Entry_WideValueReadsRetry(self):
+        self.ProcessJSON(
+            '"uint64:w:Big": 1, "uint32:w:Small": 2',
+            '"Seqlock": "entry",',
+        )
+        lines = [
+            "static uint64_t INFO_Big = 1;",
+            "static volatile uint32_t INFO_Big_Seq = 0;",
+            "uint64_t INFO_GetBig(void) {",
+            "    uint32_t seq;",
+            "    do {",
+            "        seq = INFO_Big_Seq;",
+            "        MEMORY_BARRIER();",
+            "        val = INFO_Big;",
+            "        MEMORY_BARRIER();",
+            "    } while ((seq & 1) != 0 || seq != INFO_Big_Seq);",
+            "void INFO_SetBig(uint64_t val) {",
+            "    CRITICAL_BLOCK(",
+            "        INFO_Big_Seq++;",
+            "        MEMORY_BARRIER();",
+            "        INFO_Big = val;",
+            "        MEMORY_BARRIER();",
+            "        INFO_Big_Seq++;",
+            "    );",
+            "uint32_t INFO_GetSmall(void) {",
+            "    return *(volatile uint32_t *)&INFO_Small;",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+        self.assertNotIn("INFO_Small_Seq", self.bi.GetC())
+
+    def test_Module_OneCounter(self):
+        self.ProcessJSON(
+            '"double:w:Ratio": 0.5, "string[8]:w:Name": "VALUE"',
+            '"Seqlock": "module", "Target_Word_Size": 16,',
+        )
+        code = self.bi.GetC()
+        self.assertIn("static volatile uint16_t INFO_Seq = 0;", code)
+        self.assertEqual(4, code.count("INFO_Seq++;"))
+        self.assertNotIn("INFO_Ratio_Seq", code)
+
+    def test_ReadOnly_NoCounter(self):
+        self.ProcessJSON('"uint64:Big": 1', '"Seqlock": "entry",')
+        self.assertNotIn("Seq", self.bi.GetC())
+
+    def test_InvalidSeqlock_Error(self):
+        with self.assertRaises(ValueError):
+            self.bi.ProcessJSON('{"Seqlock": "global"}')
+
+    def CompileAndRunThreads(self):
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <pthread.h>
+#include <string.h>
+
+static pthread_mutex_t lock = PTHREAD_MUTEX_INITIALIZER;
+
+void Lock(void) {
+    pthread_mutex_lock(&lock);
+}
+
+void Unlock(void) {
+    pthread_mutex_unlock(&lock);
+}
+
+#define LOOPS 100000
+
+static void *Writer(void *arg) {
+    uint32_t i;
+    (void)arg;
+    for (i = 0; i < LOOPS; i++) {
+        INFO_SetBig((i & 1) ? 0xFFFFFFFFFFFFFFFFULL : 0);
+        INFO_SetName((i & 1) ? "BBBBBBB" : "AAAAAAA", 8);
+    }
+    return NULL;
+}
+
+int main(void) {
+    pthread_t thread;
+    uint64_t value;
+    char name[8];
+    uint32_t i;
+
+    assert(pthread_create(&thread, NULL, Writer, NULL) == 0);
+    for (i = 0; i < LOOPS; i++) {
+        value = INFO_GetBig();
+        assert(value == 0 || value == 0xFFFFFFFFFFFFFFFFULL);
+        assert(INFO_GetName(name, sizeof(name)) == 1);
+        assert(strcmp(name, "AAAAAAA") == 0 || strcmp(name, "BBBBBBB") == 0);
+    }
+    assert(pthread_join(thread, NULL) == 0);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c, cflags=["-pthread"])
+
+    def test_Compiles_NoTornReads(self):
+        for options in (
+            '"Seqlock": "entry",',
+            '"Seqlock": "module", "String_Copy": "memcpy",',
+        ):
+            with self.subTest(options=options):
+                self.ProcessJSON(
+                    '"uint64:w:Big": 0, "string[8]:w:Name": "AAAAAAA"',
+                    options,
+                )
+                self.CompileAndRunThreads()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+# Same checks of tests/test_generated_code/main.c
+MAIN_C = """
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+#define INIT_VALUE 0x5A
+
+int main(void) {
+    char buff_eight[10];
+    char buff_five[7];
+
+    memset(buff_eight, INIT_VALUE, sizeof(buff_eight));
+    memset(buff_five, INIT_VALUE, sizeof(buff_five));
+
+    assert(GetString(buff_eight + 1, 8) == 1);
+    assert(buff_eight[0] == INIT_VALUE);
+    assert(strcmp(buff_eight + 1, "Value") == 0);
+    assert(buff_eight[7] == INIT_VALUE);
+    assert(buff_eight[8] == 0);
+    assert(buff_eight[9] == INIT_VALUE);
+
+    assert(GetString(buff_five + 1, 5) == 0);
+    assert(buff_five[0] == INIT_VALUE);
+    assert(strcmp(buff_five + 1, "Valu") == 0);
+    assert(buff_five[6] == INIT_VALUE);
+
+    assert(SetString("", 0) == 1);
+    assert(strcmp(PtrString(), "Value") == 0);
+    assert(SetString("T", 2) == 1);
+    assert(strcmp(PtrString(), "T") == 0);
+    assert(SetString("TESTA", 6) == 1);
+    assert(strcmp(PtrString(), "TESTA") == 0);
+    assert(SetString("TESTAB", 7) == 0);
+    assert(strcmp(PtrString(), "TESTA") == 0);
+    assert(SetString("AB", 3) == 1);
+    assert(GetString(buff_eight + 1, 8) == 1);
+    assert(strcmp(buff_eight + 1, "AB") == 0);
+
+    assert(GetLong(buff_eight, 10) == 0);
+    assert(strcmp(buff_eight, "012345678") == 0);
+    assert(SetLong("ABCDEFGHIJK", 12) == 1);
+    assert(GetLong(buff_eight, 10) == 0);
+    assert(strcmp(buff_eight, "ABCDEFGHI") == 0);
+    return 0;
+}
+"""
+
+
+class TestStringCopy(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, options):
+        self.bi.ProcessJSON(
+            f"""{{
+                {options}
+                "Bool_Is_Integer": true,
+                "macro:CRITICAL_BLOCK(code)": "do {{ code }} while (0)",
+                "string:w:String": "Value",
+                "string[24]:w:Long": "0123456789ABCDEF"
+            }}"""
+        )
+
+    def test_Default_ByteLoop(self):
+        self.ProcessJSON("")
+        code = self.bi.GetC()
+        self.assertIn("*buff_ptr++ = *ptr++;", code)
+        self.assertNotIn("memcpy", code)
+
+    def test_Memcpy_CopiesUpToTerminator(self):
+        self.ProcessJSON('"String_Copy": "memcpy",')
+        lines = [
+            "#include <string.h>",
+            "n = strlen(String) + 1;",
+            "memcpy(buff_ptr, String, n);",
+            "memcpy(String, buff_ptr, n);",
+        ]
+        code = self.bi.GetC()
+        AssertIsInSequence(lines, code, self)
+        self.assertNotIn("*buff_ptr++ = *ptr++;", code)
+        self.assertNotIn("Version", code)
+
+    def test_Chunks_OnlyLargerStringsVersioned(self):
+        self.ProcessJSON('"String_Copy": "memcpy", "String_Chunk_Size": 8,')
+        lines = [
+            "static uint16_t Long_Version = 0;",
+            "version = Long_Version;",
+            "n = max - i < 8 ? max - i : 8;",
+            "retry = version != Long_Version;",
+            "Long_Version++;",
+        ]
+        code = self.bi.GetC()
+        AssertIsInSequence(lines, code, self)
+        self.assertNotIn("String_Version", code)
+
+    def test_Chunks_SetInOneCriticalBlock(self):
+        self.ProcessJSON('"String_Copy": "memcpy", "String_Chunk_Size": 8,')
+        code = self.bi.GetC()
+        set_long = code[code.index("SetLong(") :]
+        set_long = set_long[: set_long.index("\n}\n")]
+        self.assertEqual(1, set_long.count("CRITICAL_BLOCK("))
+        self.assertIn("memcpy(Long, buff_ptr, n);", set_long)
+
+    def test_Chunks_ReadOnly_NotVersioned(self):
+        self.bi.ProcessJSON(
+            """{
+                "String_Copy": "memcpy",
+                "String_Chunk_Size": 8,
+                "string:Long": "0123456789ABCDEF"
+            }"""
+        )
+        code = self.bi.GetC()
+        self.assertIn("n = max - i < 8 ? max - i : 8;", code)
+        self.assertNotIn("Version", code)
+
+    def test_Invalid_RaisesValueError(self):
+        json_data_list = [
+            '{"String_Copy": "strcpy"}',
+            '{"String_Chunk_Size": 0}',
+            '{"String_Chunk_Size": "8"}',
+        ]
+        for json_data in json_data_list:
+            with self.subTest(json_data=json_data):
+                with self.assertRaises(ValueError):
+                    self.bi.ProcessJSON(json_data)
+
+    def test_AllModes_SameSemantics(self):
+        for options in (
+            "",
+            '"String_Copy": "memcpy",',
+            '"String_Copy": "memcpy", "String_Chunk_Size": 4,',
+            '"String_Copy": "memcpy", "Inline_Accessors": true,',
+            '"String_Copy": "memcpy", "Target_Word_Size": 32,',
+        ):
+            with self.subTest(options=options):
+                self.bi.Reset()
+                self.ProcessJSON(options)
+                CompileAndRun(self, self.bi, MAIN_C)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestStringPool(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo(filename_base="info")
+
+    def ProcessJSON(self, options=""):
+        self.bi.Reset()
+        self.bi.ProcessJSON(
+            f"""[{{
+                "String_Pool": true,
+                "Bool_Is_Integer": true,
+                {options}
+                "macro:CRITICAL_BLOCK(code)": "do {{ code }} while (0)"
+            }}, {{
+                "Section_Prefix": "INFO",
+                "string:Vendor": "ACME Corp",
+                "string:Url": "https://acme.example",
+                "string:Short": "Corp",
+                "string:w:Name": "ACME Corp",
+                "string[16]:Fixed": "ACME Corp"
+            }}, {{
+                "Section_Prefix": "OTHER",
+                "string:Vendor": "ACME Corp"
+            }}]"""
+        )
+
+    def test_Pool_DeduplicatedAndSuffixesMerged(self):
+        self.ProcessJSON()
+        lines = [
+            "static const char BuildInfo_String_Pool[31] =",
+            '    "ACME Corp\\0"',
+            '    "https://acme.example\\0";',
+            "#define INFO_Vendor (*(const char (*)[10])&BuildInfo_String_Pool[0])",
+            "#define INFO_Url (*(const char (*)[21])&BuildInfo_String_Pool[10])",
+            "#define INFO_Short (*(const char (*)[5])&BuildInfo_String_Pool[5])",
+            'static char INFO_Name[] = "ACME Corp";',
+            'static const char INFO_Fixed[16] = "ACME Corp";',
+            "#define OTHER_Vendor (*(const char (*)[10])&BuildInfo_String_Pool[0])",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+        self.assertNotIn("BuildInfo_String_Pool", self.bi.GetH())
+
+    def test_Default_NoPool(self):
+        self.bi.ProcessJSON('{"string:Vendor": "ACME Corp"}')
+        self.assertNotIn("BuildInfo_String_Pool", self.bi.GetC())
+        self.assertIn(
+            'static const char Vendor[] = "ACME Corp";', self.bi.GetC()
+        )
+
+    def test_NoAccessors_NotInPool(self):
+        self.bi.ProcessJSON(
+            """{
+                "String_Pool": true,
+                "string:Vendor": "ACME Corp",
+                "string:Unused": {"Value": "UNUSED", "Accessors": []}
+            }"""
+        )
+        self.assertIn("BuildInfo_String_Pool[10] =", self.bi.GetC())
+        self.assertNotIn("UNUSED", self.bi.GetC())
+
+    def test_InlineAccessors_NotInPool(self):
+        self.ProcessJSON('"Inline_Accessors": true,')
+        self.assertNotIn("BuildInfo_String_Pool", self.bi.GetC())
+
+    def test_RodataSection(self):
+        self.ProcessJSON('"Rodata_Section": true,')
+        self.assertIn(
+            'BuildInfo_String_Pool[31] BUILD_INFO_SECTION(".rodata.BuildInfo_String_Pool") =',
+            self.bi.GetC(),
+        )
+
+    def test_Compiles_Accessors(self):
+        self.ProcessJSON('"Entry_Table": true, "Tlv_Serialize": true,')
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+int main(void) {
+    char buff[32];
+    uint8_t tlv[INFO_TLV_MAX_SIZE];
+
+    assert(INFO_LenShort() == 5);
+    assert(strcmp(INFO_PtrShort(), "Corp") == 0);
+    assert(INFO_PtrVendor() == OTHER_PtrVendor());
+    assert(INFO_PtrShort() == INFO_PtrVendor() + 5);
+    assert(INFO_GetUrl(buff, sizeof(buff)) == 1);
+    assert(strcmp(buff, "https://acme.example") == 0);
+    assert(INFO_GetById(INFO_ID_VENDOR, buff, sizeof(buff)) == 1);
+    assert(strcmp(buff, "ACME Corp") == 0);
+    assert(INFO_Entries[INFO_ID_URL].size == 21);
+    assert(INFO_Serialize(tlv, sizeof(tlv)) > 0);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+    def test_Compiles_EscapeSequences_NotInPool(self):
+        self.bi.ProcessJSON(
+            r"""{
+                "String_Pool": true,
+                "Bool_Is_Integer": true,
+                "macro:CRITICAL_BLOCK(code)": "do { code } while (0)",
+                "string:Tab": "A\\tB",
+                "string:Name": "XB",
+                "string:Last": "B"
+            }"""
+        )
+        self.assertIn('static const char Tab[] = "A\\tB";', self.bi.GetC())
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <string.h>
+
+int main(void) {
+    assert(LenTab() == 4);
+    assert(strcmp(PtrTab(), "A\\tB") == 0);
+    assert(LenName() == 3);
+    assert(strcmp(PtrName(), "XB") == 0);
+    assert(LenLast() == 2);
+    assert(strcmp(PtrLast(), "B") == 0);
+    return 0;
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestTargetWordSize(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def GetFunction(self, code, prototype):
+        start = code.index(prototype)
+        return code[start : code.index("\n}\n", start)]
+
+    def test_Default_AllLocked(self):
+        self.bi.ProcessJSON('{"uint8:Read_Only": 1, "uint8:w:Writable": 1}')
+        code = self.bi.GetC()
+        for prototype in (
+            "uint8_t GetReadOnly(void) {",
+            "uint8_t GetWritable(void) {",
+            "void SetWritable(uint8_t val) {",
+        ):
+            self.assertIn("CRITICAL_BLOCK(", self.GetFunction(code, prototype))
+
+    def test_ReadOnly_LockFree(self):
+        self.bi.ProcessJSON(
+            """{
+                "Target_Word_Size": 32,
+                "uint64:Number": 1,
+                "bool:Flag": true,
+                "string:Name": "VALUE"
+            }"""
+        )
+        code = self.bi.GetC()
+        lines = [
+            "uint64_t GetNumber(void) {\n    return Number;\n}",
+            "bool GetFlag(void) {\n    return Flag;\n}",
+        ]
+        AssertIsInSequence(lines, code, self)
+        self.assertNotIn("CRITICAL_BLOCK", code)
+
+    def test_Writable_NoWiderThanWord_LockFree(self):
+        self.bi.ProcessJSON(
+            """{
+                "Target_Word_Size": 32,
+                "uint32:w:Number": 1,
+                "float:w:Ratio": 1.5
+            }"""
+        )
+        lines = [
+            "uint32_t GetNumber(void) {\n"
+            + "    return *(volatile uint32_t *)&Number;\n}",
+            "void SetNumber(uint32_t val) {\n"
+            + "    *(volatile uint32_t *)&Number = val;\n}",
+            "float GetRatio(void) {\n    return *(volatile float *)&Ratio;\n}",
+        ]
+        code = self.bi.GetC()
+        AssertIsInSequence(lines, code, self)
+        self.assertNotIn("CRITICAL_BLOCK", code)
+
+    def test_Writable_WiderThanWord_Locked(self):
+        self.bi.ProcessJSON(
+            """{
+                "Target_Word_Size": 16,
+                "uint32:w:Number": 1,
+                "double:w:Ratio": 1.5,
+                "string:w:Name": "VALUE"
+            }"""
+        )
+        code = self.bi.GetC()
+        for prototype in (
+            "uint32_t GetNumber(void) {",
+            "void SetNumber(uint32_t val) {",
+            "double GetRatio(void) {",
+            "bool GetName(char *buff_ptr, uint16_t len) {",
+            "bool SetName(const char *buff_ptr, uint16_t len) {",
+        ):
+            self.assertIn("CRITICAL_BLOCK(", self.GetFunction(code, prototype))
+
+    def test_Invalid_RaisesValueError(self):
+        for value in ("0", "24", "32.0", "true", '"32"', "null"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    self.bi.ProcessJSON(f'{{"Target_Word_Size": {value}}}')
+
+    def test_Enabled_Compiles(self):
+        self.bi.ProcessJSON(
+            """{
+                "Target_Word_Size": 32,
+                "Bool_Is_Integer": true,
+                "macro:CRITICAL_BLOCK(code)": "do { code } while (0)",
+                "uint32:w:Number": 1,
+                "uint64:w:Wide": 1,
+                "string:Name": "VALUE"
+            }"""
+        )
+        main_c = """
+#include "info.h"
+#include <string.h>
+int main(void) {
+    char buff[8];
+    SetNumber(2);
+    SetWide(3);
+    return !(GetNumber() == 2 && GetWide() == 3 && GetName(buff, 8)
+             && strcmp(buff, "VALUE") == 0);
+}
+"""
+        CompileAndRun(self, self.bi, main_c)
+
+
+if __name__ == "__main__":
+    unittest.main()
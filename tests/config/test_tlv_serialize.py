@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    sys.path.append("../../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+class TestTlvSerialize(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def ProcessJSON(self, entries, options=""):
+        ProcessEntries(self.bi, entries, '"Tlv_Serialize": true,' + options)
+
+    def test_MaxSizeAndFunctions(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[8]:w:Name": "VALUE",
+            "uint32:Read_Only": {"Value": 3, "Accessors": []}
+            """
+        )
+        lines = [
+            "#define INFO_TLV_MAX_SIZE 18",
+            "uint16_t INFO_Serialize(uint8_t *buff_ptr, uint16_t len);",
+            "uint8_t INFO_Deserialize(const uint8_t *buff_ptr, uint16_t len);",
+        ]
+        AssertIsInSequence(lines, self.bi.GetH(), self)
+
+        lines = [
+            "static const uint32_t INFO_Read_Only = 3;",
+            "static const BuildInfo_Entry_t INFO_Entries[3] = {",
+            "    {&INFO_Read_Only, sizeof(INFO_Read_Only), BUILD_INFO_TYPE_UINT32, 0},",
+        ]
+        AssertIsInSequence(lines, self.bi.GetC(), self)
+
+    def test_EntryTable_SharesTable(self):
+        self.ProcessJSON('"uint8:w:Small": 1', '"Entry_Table": true,')
+        code = self.bi.GetC()
+        self.assertIn(
+            "const BuildInfo_Entry_t INFO_Entries[INFO_ID_COUNT]", code
+        )
+        self.assertNotIn("static const BuildInfo_Entry_t", code)
+
+    def test_DecodeTlv(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[8]:w:Name": "VALUE",
+            "int16:Offset": -2
+            """
+        )
+        data = b"\x00\x01\x07\x01\x02AB\x02\x02\xfe\xff\x09\x01\x00"
+        self.assertEqual(
+            {"Small": 7, "Name": "AB", "Offset": -2},
+            self.bi.DecodeTlv(data, "INFO"),
+        )
+        with self.assertRaises(ValueError):
+            self.bi.DecodeTlv(data[:-1], "INFO")
+        with self.assertRaises(ValueError):
+            self.bi.DecodeTlv(b"\x02\x01\xfe", "INFO")
+        with self.assertRaises(ValueError):
+            self.bi.DecodeTlv(data, "OTHER")
+
+    def test_Compiles_SerializeDeserialize(self):
+        self.ProcessJSON(
+            """
+            "uint8:w:Small": 1,
+            "string[8]:w:Name": "VALUE",
+            "double:w:Ratio": 0.5,
+            "int16:Offset": -2
+            """
+        )
+        main_c = """
+#include "info.h"
+#include <assert.h>
+#include <stdio.h>
+#include <string.h>
+
+int main(void) {
+    uint8_t buff[INFO_TLV_MAX_SIZE];
+    uint16_t size;
+    uint16_t i;
+
+    assert(INFO_Serialize(buff, sizeof(buff) - 1) == 0);
+    size = INFO_Serialize(buff, sizeof(buff));
+    for (i = 0; i < size; i++) {
+        printf("%02x", buff[i]);
+    }
+
+    INFO_SetSmall(2);
+    INFO_SetName("NEW", 4);
+    assert(INFO_Deserialize(buff, size - 1) == 0);
+    assert(INFO_GetSmall() == 2);
+    assert(INFO_Deserialize(buff, size) == 1);
+    assert(INFO_GetSmall() == 1);
+    assert(strcmp(INFO_PtrName(), "VALUE") == 0);
+    assert(INFO_GetOffset() == -2);
+
+    buff[1] = 2;
+    assert(INFO_Deserialize(buff, size) == 0);
+    return 0;
+}
+"""
+        output = CompileAndRun(self, self.bi, main_c)
+        self.assertEqual(
+            {"Small": 1, "Name": "VALUE", "Ratio": 0.5, "Offset": -2},
+            self.bi.DecodeTlv(bytes.fromhex(output), "INFO"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,8 +29,8 @@ class TestProcessJSONVersionData(unittest.TestCase):
     def test_VersionString_CreateVariablesAndFunctions_InC(self):
         self.bi.ProcessJSON('{"Version": [1, 0, 0, "", ""]}')
         lines = [
-            'static char Version_Str[] = "',
-            "static uint32_t Version_Num = ",
+            'static const char Version_Str[] = "',
+            "static const uint32_t Version_Num = ",
             "const char *PtrVersionStr(void) {",
             "uint32_t GetVersionNum(void) {",
         ]
@@ -48,37 +48,37 @@ class TestProcessJSONVersionData(unittest.TestCase):
 
     def test_VersionString_MajorMinor_v10(self):
         self.bi.ProcessJSON('{"Version": [1, 0, 0, "", ""]}')
-        lines = ['static char Version_Str[] = "1.0"']
+        lines = ['static const char Version_Str[] = "1.0"']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
     def test_VersionString_MajorMinor_v01(self):
         self.bi.ProcessJSON('{"Version": [0, 1, 0, "", ""]}')
-        lines = ['static char Version_Str[] = "0.1"']
+        lines = ['static const char Version_Str[] = "0.1"']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
     def test_VersionString_MajorMinorPatch_v012(self):
         self.bi.ProcessJSON('{"Version": [0, 1, 2, "", ""]}')
-        lines = ['static char Version_Str[] = "0.1.2"']
+        lines = ['static const char Version_Str[] = "0.1.2"']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
     def test_VersionString_PreRelease(self):
         self.bi.ProcessJSON('{"Version": [0, 1, 2, "alpha", ""]}')
-        lines = ['static char Version_Str[] = "0.1.2-alpha"']
+        lines = ['static const char Version_Str[] = "0.1.2-alpha"']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
     def test_VersionString_PreReleaseAndBuildMetadata(self):
         self.bi.ProcessJSON('{"Version": [0, 1, 2, "alpha", "001"]}')
-        lines = ['static char Version_Str[] = "0.1.2-alpha+001"']
+        lines = ['static const char Version_Str[] = "0.1.2-alpha+001"']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
     def test_VersionString_BuildMetadata(self):
         self.bi.ProcessJSON('{"Version": [0, 1, 2, "", "001"]}')
-        lines = ['static char Version_Str[] = "0.1.2+001"']
+        lines = ['static const char Version_Str[] = "0.1.2+001"']
         code = self.bi.GetC()
         AssertIsInSequence(lines, code, self)
 
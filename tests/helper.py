@@ -2,6 +2,14 @@
 # Build Info - https://github.com/djboni/build_info
 # MIT License - Copyright (c) 2021 Djones A. Boni
 
+import os
+import shutil
+import subprocess
+import tempfile
+
+CC = os.environ.get("CC", "gcc")
+CFLAGS = ["-std=c99", "-Wall", "-Wextra", "-Werror"]
+
 
 class IOWrapperMock:
     def __init__(self, filename, mode, file_manager):
@@ -59,10 +67,10 @@ class OpenMock:
         }
 
     def __call__(self, filename, mode):
-        if mode == "r" and filename not in self.file_system:
+        if mode in ("r", "rb") and filename not in self.file_system:
             raise FileNotFoundError()
-        elif mode == "w":
-            self.SetFileData(filename, "")
+        elif mode in ("w", "wb"):
+            self.SetFileData(filename, b"" if mode == "wb" else "")
 
         if filename in self.open_files:
             io_wrapper = self.open_files[filename]["io_wrapper"]
@@ -100,11 +108,23 @@ class OpenMock:
         return self.GetFileWriteCount(filename) != 0
 
 
+class GitCommandErrorMock(Exception):
+    def __init__(self, status):
+        super().__init__(status)
+        self.status = status
+
+
 class GitMock:
     """Used to mock git module (import git)."""
 
+    GitCommandError = GitCommandErrorMock
+    DIRTY_ARG = "--dirty=-D"
+
     def __init__(self):
         self.commit_string = "DEFAULT_COMMIT_STRING"
+        self.index_dirty = False
+        self.describe_error = None
+        self.calls = []
 
         """Allow call git.Repo(#).git"""
         self.git = self
@@ -113,13 +133,38 @@ class GitMock:
         """Allow call git.Repo(#)"""
         return self
 
-    def describe(self, *args):
+    def __call__(self, **kwargs):
+        """Allow call git.Repo(#).git(c=#)"""
+        self.calls.append(("options", kwargs))
+        return self
+
+    def describe(self, *args, **kwargs):
         """Allow call git.Repo(#).git.describe"""
+        self.calls.append(("describe", *args, kwargs))
+        if self.describe_error is not None and self.DIRTY_ARG in args[0]:
+            raise self.describe_error
         return self.commit_string
 
+    def diff_index(self, *args, **kwargs):
+        """Allow call git.Repo(#).git.diff_index"""
+        self.calls.append(("diff_index", *args, kwargs))
+        if self.index_dirty:
+            raise GitCommandErrorMock(1)
+        return ""
+
     def SetCommitString(self, commit_string):
         self.commit_string = commit_string
 
+    def SetIndexDirty(self, index_dirty):
+        self.index_dirty = index_dirty
+
+    def SetDirtyDescribeError(self, error):
+        """Make every describe that checks the work tree raise error."""
+        self.describe_error = error
+
+    def GetCallArgs(self, command):
+        return [call[1:] for call in self.calls if call[0] == command]
+
 
 class TimeMock:
     """Used to mock time module (import time)."""
@@ -157,3 +202,61 @@ def AssertIsInSequence(list_of_lines, code, test):
         test.assertIn(line, code)
         test.assertNotEqual(-1, idx, f"out of sequence {line=}")
         next_idx = idx + len(line)
+
+
+CRITICAL_BLOCK = '"macro:CRITICAL_BLOCK(code)": "do { code } while (0)"'
+
+
+def ProcessEntries(bi, entries, options="", macros=CRITICAL_BLOCK):
+    """Reset bi and process the entries in the module INFO. The options
+    (JSON members, each followed by a comma) and the macros go in an object
+    before the module."""
+    bi.Reset()
+    bi.ProcessJSON(
+        f"""[{{
+            "Bool_Is_Integer": true,
+            {options}
+            {macros}
+        }}, {{
+            "Section_Prefix": "INFO",
+            {entries}
+        }}]"""
+    )
+
+
+def CompileAndRun(test, bi, main_c, cflags=(), filename_base="info"):
+    """Compile the code generated by bi with main_c and run the program.
+    Skip the test if there is no C compiler. Return the program output."""
+    if shutil.which(CC) is None:
+        test.skipTest(f"C compiler {CC} not available")
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = {
+            f"{filename_base}.c": bi.GetC(),
+            f"{filename_base}.h": bi.GetH(),
+            "main.c": main_c,
+        }
+        for filename, code in files.items():
+            with open(os.path.join(directory, filename), "w") as fp:
+                fp.write(code)
+
+        program = os.path.join(directory, "main")
+        result = subprocess.run(
+            [
+                CC,
+                *CFLAGS,
+                *cflags,
+                f"{filename_base}.c",
+                "main.c",
+                "-o",
+                program,
+            ],
+            cwd=directory,
+            capture_output=True,
+            text=True,
+        )
+        test.assertEqual(0, result.returncode, result.stderr)
+
+        result = subprocess.run([program], capture_output=True, text=True)
+        test.assertEqual(0, result.returncode, result.stdout + result.stderr)
+        return result.stdout
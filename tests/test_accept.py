@@ -37,7 +37,7 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "build_info.h"',
-            'static char BUILD_INFO_Project_Name[] = "Build Info";',
+            'static const char BUILD_INFO_Project_Name[] = "Build Info";',
             "const char *BUILD_INFO_PtrProjectName(void) {",
             "}",
         ]
@@ -67,14 +67,14 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "build.h"',
-            'static char BUILD_Project_Name[] = "Build Info";',
-            'static char BUILD_Version[] = "v0.1";',
-            "static int8_t BUILD_Version_Major = 0;",
-            "static int8_t BUILD_Version_Minor = 1;",
-            "static int8_t BUILD_Version_Fix = 0;",
-            "static int32_t BUILD_Version_Number = 256;",
-            "static int16_t BUILD_Var16 = 0;",
-            "static int64_t BUILD_Var64 = 0;",
+            'static const char BUILD_Project_Name[] = "Build Info";',
+            'static const char BUILD_Version[] = "v0.1";',
+            "static const int8_t BUILD_Version_Major = 0;",
+            "static const int8_t BUILD_Version_Minor = 1;",
+            "static const int8_t BUILD_Version_Fix = 0;",
+            "static const int32_t BUILD_Version_Number = 256;",
+            "static const int16_t BUILD_Var16 = 0;",
+            "static const int64_t BUILD_Var64 = 0;",
             "const char *BUILD_PtrProjectName(void) {",
             "}",
             "const char *BUILD_PtrVersion(void) {",
@@ -125,14 +125,14 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "build.h"',
-            'static char BUILD_Project_Name[] = "Build Info";',
-            'static char BUILD_Version[] = "v0.1";',
-            "static uint8_t BUILD_Version_Major = 0;",
-            "static uint8_t BUILD_Version_Minor = 1;",
-            "static uint8_t BUILD_Version_Fix = 0;",
-            "static uint32_t BUILD_Version_Number = 256;",
-            "static uint16_t BUILD_Var16 = 0;",
-            "static uint64_t BUILD_Var64 = 0;",
+            'static const char BUILD_Project_Name[] = "Build Info";',
+            'static const char BUILD_Version[] = "v0.1";',
+            "static const uint8_t BUILD_Version_Major = 0;",
+            "static const uint8_t BUILD_Version_Minor = 1;",
+            "static const uint8_t BUILD_Version_Fix = 0;",
+            "static const uint32_t BUILD_Version_Number = 256;",
+            "static const uint16_t BUILD_Var16 = 0;",
+            "static const uint64_t BUILD_Var64 = 0;",
             "const char *BUILD_PtrProjectName(void) {",
             "}",
             "const char *BUILD_PtrVersion(void) {",
@@ -181,8 +181,8 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "build.h"',
-            'static char Project_Name[] = "Build Info";',
-            "static uint32_t BUILD_Timestamp = 1638628121;",
+            'static const char Project_Name[] = "Build Info";',
+            "static const uint32_t BUILD_Timestamp = 1638628121;",
             "const char *PtrProjectName(void) {",
             "}",
             "uint32_t BUILD_GetTimestamp(void) {",
@@ -226,7 +226,7 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "project_info.h"',
-            'static char BUILD_Project_Name[] = "Build Info";',
+            'static const char BUILD_Project_Name[] = "Build Info";',
             "const char *BUILD_PtrProjectName(void) {",
             "}",
         ]
@@ -253,8 +253,8 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "project_info.h"',
-            'static char BUILD_Project_Name[] = "Build Info";',
-            'static char BUILD_Commit_Hash[41] = "0000000000000000000000000000000000000000";',
+            'static const char BUILD_Project_Name[] = "Build Info";',
+            'static const char BUILD_Commit_Hash[41] = "0000000000000000000000000000000000000000";',
             "const char *BUILD_PtrProjectName(void) {",
             "}",
             "const char *BUILD_PtrCommitHash(void) {",
@@ -290,8 +290,8 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "project_info.h"',
-            'static char BUILD_Project_Name[] = "Build Info";',
-            'static char BUILD_Commit_Hash[41] = "0000000000000000000000000000000000000000";',
+            'static const char BUILD_Project_Name[] = "Build Info";',
+            'static const char BUILD_Commit_Hash[41] = "0000000000000000000000000000000000000000";',
             "const char *BUILD_PtrProjectName(void) {",
             "}",
             "const char *BUILD_PtrCommitHash(void) {",
@@ -323,9 +323,9 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "control_parameters.h"',
-            "static float CONTROL_P = 1.0;",
-            "static float CONTROL_I = 0.05;",
-            "static float CONTROL_D = 0.2;",
+            "static const float CONTROL_P = 1.0;",
+            "static const float CONTROL_I = 0.05;",
+            "static const float CONTROL_D = 0.2;",
             "float CONTROL_GetP(void) {",
             "}",
             "float CONTROL_GetI(void) {",
@@ -357,9 +357,9 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "control_parameters.h"',
-            "static double CONTROL_P = 1.0;",
-            "static double CONTROL_I = 0.05;",
-            "static double CONTROL_D = 0.2;",
+            "static const double CONTROL_P = 1.0;",
+            "static const double CONTROL_I = 0.05;",
+            "static const double CONTROL_D = 0.2;",
             "double CONTROL_GetP(void) {",
             "}",
             "double CONTROL_GetI(void) {",
@@ -389,8 +389,8 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "debug.h"',
-            "static bool DEBUG_Display_Enabled = true;",
-            "static bool DEBUG_Keypad_Enabled = false;",
+            "static const bool DEBUG_Display_Enabled = true;",
+            "static const bool DEBUG_Keypad_Enabled = false;",
             "bool DEBUG_GetDisplayEnabled(void) {",
             "}",
             "bool DEBUG_GetKeypadEnabled(void) {",
@@ -418,8 +418,8 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "debug.h"',
-            "static uint8_t DEBUG_Display_Enabled = 1;",
-            "static uint8_t DEBUG_Keypad_Enabled = 0;",
+            "static const uint8_t DEBUG_Display_Enabled = 1;",
+            "static const uint8_t DEBUG_Keypad_Enabled = 0;",
             "uint8_t DEBUG_GetDisplayEnabled(void) {",
             "}",
             "uint8_t DEBUG_GetKeypadEnabled(void) {",
@@ -456,18 +456,18 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "test.h"',
-            'static char TEST_String[] = "TEST1";',
-            "static int8_t TEST_Int8_t = -1;",
-            "static int16_t TEST_Int16_t = -2;",
-            "static int32_t TEST_Int32_t = -4;",
-            "static int64_t TEST_Int64_t = -8;",
-            "static uint8_t TEST_Uint8_t = 1;",
-            "static uint16_t TEST_Uint16_t = 2;",
-            "static uint32_t TEST_Uint32_t = 4;",
-            "static uint64_t TEST_Uint64_t = 8;",
-            "static float TEST_Float = 1000000.0;",
-            "static double TEST_Double = 1000000000000.0;",
-            "static bool TEST_Bool = true;",
+            'static const char TEST_String[] = "TEST1";',
+            "static const int8_t TEST_Int8_t = -1;",
+            "static const int16_t TEST_Int16_t = -2;",
+            "static const int32_t TEST_Int32_t = -4;",
+            "static const int64_t TEST_Int64_t = -8;",
+            "static const uint8_t TEST_Uint8_t = 1;",
+            "static const uint16_t TEST_Uint16_t = 2;",
+            "static const uint32_t TEST_Uint32_t = 4;",
+            "static const uint64_t TEST_Uint64_t = 8;",
+            "static const float TEST_Float = 1000000.0;",
+            "static const double TEST_Double = 1000000000000.0;",
+            "static const bool TEST_Bool = true;",
             "uint16_t TEST_LenString(void) {",
             "}",
             "const char *TEST_PtrString(void) {",
@@ -670,12 +670,12 @@ class TestCreateCFile(unittest.TestCase):
 
         self.expected_source_lines = [
             '#include "info.h"',
-            "static uint8_t Var_U8 = 0;",
-            "static uint16_t Var_U16 = 0;",
-            "static uint32_t Var_U32 = 0;",
+            "static const uint8_t Var_U8 = 0;",
+            "static const uint16_t Var_U16 = 0;",
+            "static const uint32_t Var_U32 = 0;",
             "static uint64_t Var_U64 = 0;",
-            'static char Str_A[] = "";',
-            'static char Str_B[4] = "";',
+            'static const char Str_A[] = "";',
+            'static const char Str_B[4] = "";',
         ]
 
         self.expected_header_lines = [
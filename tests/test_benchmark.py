@@ -0,0 +1,150 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import Mock
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+CONFIG = """[{
+    "Bool_Is_Integer": true,
+    "Target_Word_Size": 32
+}, {
+    "Section_Prefix": "INFO",
+    "uint32:w:Number": 1,
+    "double:Ratio": 0.5,
+    "string[16]:w:Name": "NAME",
+    "uint16[4]:w:Table": [1, 2, 3, 4]
+}]"""
+
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def test_Accessors_FromHeader(self):
+        self.bi.ProcessJSON(CONFIG)
+        self.assertEqual(
+            [
+                ("INFO_GetNumber", "get", "uint32_t", "INFO_GetNumber()"),
+                (
+                    "INFO_SetNumber",
+                    "set",
+                    "uint32_t",
+                    "INFO_SetNumber((uint32_t)i)",
+                ),
+                ("INFO_GetRatio", "get", "double", "INFO_GetRatio()"),
+                (
+                    "INFO_GetName",
+                    "get",
+                    "string",
+                    "INFO_GetName(BenchBuff, sizeof(BenchBuff))",
+                ),
+                ("INFO_SetName", "set", "string", 'INFO_SetName("", 1)'),
+                ("INFO_GetTable", "get", "uint16_t", "INFO_GetTable(0)"),
+                (
+                    "INFO_SetTable",
+                    "set",
+                    "uint16_t",
+                    "INFO_SetTable(0, (uint16_t)i)",
+                ),
+            ],
+            bi.BenchmarkAccessors(self.bi.GetH()),
+        )
+
+    def test_Accessors_Inline(self):
+        self.bi.ProcessJSON(
+            '{"Inline_Accessors": true, "macro:CRITICAL_BLOCK(code)": "code",'
+            + ' "uint32:Number": 1}'
+        )
+        self.assertEqual(
+            [("GetNumber", "get", "uint32_t", "GetNumber()")],
+            bi.BenchmarkAccessors(self.bi.GetH()),
+        )
+
+    def test_Benchmark_Results(self):
+        if shutil.which(CC) is None:
+            self.skipTest(f"C compiler {CC} not available")
+        self.bi.ProcessJSON(CONFIG)
+        results = bi.Benchmark(self.bi.GetC(), self.bi.GetH(), iterations=100)
+        self.assertEqual(100, results["iterations"])
+        self.assertEqual(
+            ["INFO_GetNumber", "INFO_SetNumber", "INFO_GetRatio"],
+            [result["function"] for result in results["accessors"][:3]],
+        )
+        self.assertEqual(
+            {"get_ns_per_call", "set_ns_per_call"},
+            set(results["types"]["string"]),
+        )
+        self.assertGreater(results["accessors"][0]["calls_per_s"], 0)
+
+    def test_Benchmark_CompileError(self):
+        if shutil.which(CC) is None:
+            self.skipTest(f"C compiler {CC} not available")
+        self.bi.ProcessJSON(CONFIG)
+        with self.assertRaises(RuntimeError):
+            bi.Benchmark(
+                self.bi.GetC() + "#error\n", self.bi.GetH(), iterations=1
+            )
+
+    def test_Main_WritesJSON(self):
+        if shutil.which(CC) is None:
+            self.skipTest(f"C compiler {CC} not available")
+        open = OpenMock()
+        open.SetFileData("input.json", CONFIG)
+        argv = ["build_info.py", "--bench", "input.json", "bench.json"]
+        self.assertEqual(0, bi.main(argv, open=open, print=Mock()))
+        results = json.loads(open.GetFileData("bench.json"))
+        self.assertEqual(7, len(results["accessors"]))
+
+    def test_Main_MacrosFromIncludedHeader(self):
+        if shutil.which(CC) is None:
+            self.skipTest(f"C compiler {CC} not available")
+        platform_h = """
+#ifdef CRITICAL_BLOCK
+#error "host CRITICAL_BLOCK defined before the header of the JSON"
+#endif
+#define CRITICAL_BLOCK(code) do { code } while (0)
+"""
+        config = CONFIG.replace(
+            '"Bool_Is_Integer": true,',
+            '"Bool_Is_Integer": true, "Include_Header": ["platform.h"],',
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            files = {"platform.h": platform_h, "input.json": config}
+            for filename, data in files.items():
+                with open(os.path.join(directory, filename), "w") as fp:
+                    fp.write(data)
+            filein = os.path.join(directory, "input.json")
+            fileout = os.path.join(directory, "bench.json")
+            argv = ["build_info.py", "--bench", filein, fileout]
+            self.assertEqual(0, bi.main(argv, print=Mock()))
+            with open(fileout, "r") as fp:
+                results = json.load(fp)
+        self.assertEqual(7, len(results["accessors"]))
+
+    def test_Main_NoInput_ShowsUsage(self):
+        print = Mock()
+        argv = ["build_info.py", "--bench"]
+        self.assertEqual(1, bi.main(argv, open=OpenMock(), print=print))
+        self.assertIn("Usage:", str(print.call_args))
+
+
+if __name__ == "__main__":
+    unittest.main()
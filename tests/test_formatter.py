@@ -25,7 +25,7 @@ class TestProcessJSONDefaultFormatter(unittest.TestCase):
     def test_FormatGlobalVariable(self):
         self.converter.ProcessJSON('{"int8:r:Int_Val": 0}')
         code = self.converter.GetC()
-        lines = ["static int8_t Int_Val = 0;"]
+        lines = ["static const int8_t Int_Val = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_FormatFunction(self):
@@ -45,7 +45,7 @@ class TestProcessJSONDefaultFormatter(unittest.TestCase):
             '{"Section_Prefix": "MDL_NAM", "int8:r:Int_Val": 0}'
         )
         code = self.converter.GetC()
-        lines = ["static int8_t MDL_NAM_Int_Val = 0;"]
+        lines = ["static const int8_t MDL_NAM_Int_Val = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_FormatHeaderFilename(self):
@@ -68,7 +68,7 @@ class TestProcessJSONSecondFormatter(unittest.TestCase):
     def test_FormatGlobalVariable(self):
         self.converter.ProcessJSON('{"int8:r:Int_Val": 0}')
         code = self.converter.GetC()
-        lines = ["static int8_t IntVal = 0;"]
+        lines = ["static const int8_t IntVal = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_FormatFunction(self):
@@ -88,7 +88,7 @@ class TestProcessJSONSecondFormatter(unittest.TestCase):
             '{"Section_Prefix": "MDL_NAM", "int8:r:Int_Val": 0}'
         )
         code = self.converter.GetC()
-        lines = ["static int8_t MDL_NAM_IntVal = 0;"]
+        lines = ["static const int8_t MDL_NAM_IntVal = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_FormatHeaderFilename(self):
@@ -84,7 +84,7 @@ class TestMainGoodParameters(TestMainBadParameters):
 
         self.output_c_data = [
             '#include "output.h"',
-            "static int8_t Var = 0;",
+            "static const int8_t Var = 0;",
             "int8_t GetVar(void) {",
             "}",
         ]
@@ -166,7 +166,7 @@ class TestMainUpdateIfNecessary(TestMainGoodParameters):
 
         self.other_output_c_data = [
             '#include "output.h"',
-            "static int8_t Var = 1;",
+            "static const int8_t Var = 1;",
             "int8_t GetVar(void) {",
             "}",
         ]
@@ -224,6 +224,117 @@ class TestMainUpdateIfNecessary(TestMainGoodParameters):
         self.assertEqual(self.open.GetFileWriteCount(filename), 1)
 
 
+class TestMainCheck(unittest.TestCase):
+    def setUp(self):
+        self.open = OpenMock()
+        self.print = Mock()
+        self.open.SetFileData("input.json", '{"int8:Var": 0}')
+
+    def CallMain(self, *parameters):
+        argv = ["build_info.py", *parameters]
+        self.return_value = bi.main(argv, open=self.open, print=self.print)
+
+    def test_Check_ValidJSON_ReturnSuccess_NoFilesWritten(self):
+        self.CallMain("--check", "input.json")
+        self.assertEqual(0, self.return_value)
+        self.print.assert_not_called()
+        self.assertFalse(self.open.FileExists("output.c"))
+        self.assertFalse(self.open.FileExists("info.c"))
+
+    def test_Check_AcceptsOutputParameter(self):
+        self.CallMain("--check", "input.json", "output")
+        self.assertEqual(0, self.return_value)
+        self.assertFalse(self.open.FileExists("output.c"))
+        self.assertFalse(self.open.FileExists("output.h"))
+
+    def test_Check_ReportsAllErrorsInOnePass(self):
+        self.open.SetFileData(
+            "input.json",
+            """[{
+                "int8:Var": 1000,
+                "uint8:Ok": 1,
+                "string[2]:Str": "too long",
+                "Version": [1, 2, 3]
+            }, 0]""",
+        )
+        self.CallMain("--check", "input.json")
+        self.assertEqual(1, self.return_value)
+        self.assertEqual(4, self.print.call_count)
+        messages = [str(call) for call in self.print.call_args_list]
+        self.assertIn("int8:Var", messages[0])
+        self.assertIn("string[2]:Str", messages[1])
+        self.assertIn("Version", messages[2])
+        self.assertIn("object 1", messages[3])
+
+    def test_Check_InvalidJSONSyntax_ReportsError(self):
+        self.open.SetFileData("input.json", '{"int8:Var": }')
+        self.CallMain("--check", "input.json")
+        self.assertEqual(1, self.return_value)
+        self.print.assert_called_once()
+
+    def test_Check_DoesNotQueryGit(self):
+        self.open.SetFileData(
+            "input.json", '{"Git_Repository": "/does/not/exist"}'
+        )
+        self.CallMain("--check", "input.json")
+        self.assertEqual(0, self.return_value)
+
+    def test_Check_ValidatesGitOptions(self):
+        self.open.SetFileData(
+            "input.json", '{"Git_Repository": {"Directory": 0}}'
+        )
+        self.CallMain("--check", "input.json")
+        self.assertEqual(1, self.return_value)
+
+    def test_Verify_MissingOutputs_ReportsBoth(self):
+        self.CallMain("--verify", "input.json", "output")
+        self.assertEqual(1, self.return_value)
+        self.assertEqual(2, self.print.call_count)
+        self.assertFalse(self.open.FileExists("output.c"))
+        self.assertFalse(self.open.FileExists("output.h"))
+
+    def test_Verify_UpToDateOutputs_ReturnSuccess(self):
+        self.CallMain("input.json", "output")
+        self.CallMain("--verify", "input.json", "output")
+        self.assertEqual(0, self.return_value)
+        self.print.assert_not_called()
+        self.assertEqual(1, self.open.GetFileWriteCount("output.c"))
+        self.assertEqual(1, self.open.GetFileWriteCount("output.h"))
+
+    def test_Verify_OutdatedOutput_ReportsOnlyIt(self):
+        self.CallMain("input.json", "output")
+        self.open.SetFileData("input.json", '{"int8:Var": 1}')
+        self.CallMain("--verify", "input.json", "output")
+        self.assertEqual(1, self.return_value)
+        self.print.assert_called_once()
+        self.assertIn("output.c", str(self.print.call_args))
+        self.assertEqual(1, self.open.GetFileWriteCount("output.c"))
+
+    def test_Verify_InvalidJSON_ReportsAllErrors(self):
+        self.open.SetFileData(
+            "input.json", '{"int8:Var": 1000, "uint8:Var2": -1}'
+        )
+        self.CallMain("--verify", "input.json", "output")
+        self.assertEqual(1, self.return_value)
+        self.assertEqual(2, self.print.call_count)
+
+    def test_Delta_NoImage_ReportsError(self):
+        self.open.SetFileData("new.json", '{"int8:Var": 1}')
+        self.CallMain("--delta", "input.json", "new.json", "out.delta")
+        self.assertEqual(1, self.return_value)
+        self.print.assert_called_once()
+        self.assertIn("Image", str(self.print.call_args))
+        self.assertFalse(self.open.FileExists("out.delta"))
+
+    def test_Check_MissingInput_ShowsUsage(self):
+        for mode in ["--check", "--verify"]:
+            with self.subTest(mode=mode):
+                self.print.reset_mock()
+                self.CallMain(mode)
+                self.assertEqual(1, self.return_value)
+                self.assertIn("Usage:", str(self.print.call_args))
+
+
 class TestMainUserDefinedCode(TestMainGoodParameters):
     def test_SectionsOfUserDefinedCode_AreKeptOnFileUpdate(self):
         self.skipTest("not implemented")
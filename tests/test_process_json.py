@@ -71,19 +71,19 @@ class TestStringProcessJSON(unittest.TestCase):
     def test_PassKeyString_VariablePresentInC(self):
         self.converter.ProcessJSON('{"string:NAME": "VALUE"}')
         code = self.converter.GetC()
-        lines = ['static char NAME[] = "VALUE";']
+        lines = ['static const char NAME[] = "VALUE";']
         AssertIsInSequence(lines, code, self)
 
     def test_PassOtherString_VariablePresentInC(self):
         self.converter.ProcessJSON('{"string:NAME": "OTHER_VALUE"}')
-        lines = ['static char NAME[] = "OTHER_VALUE";']
+        lines = ['static const char NAME[] = "OTHER_VALUE";']
         code = self.converter.GetC()
         AssertIsInSequence(lines, code, self)
 
     def test_PassOtherKey_VariablePresentInC(self):
         self.converter.ProcessJSON('{"string:OTHER_NAME": "VALUE"}')
         code = self.converter.GetC()
-        lines = ['static char OTHER_NAME[] = "VALUE";']
+        lines = ['static const char OTHER_NAME[] = "VALUE";']
         AssertIsInSequence(lines, code, self)
 
     def test_PassKeyString_FunctionPresentInC(self):
@@ -115,7 +115,7 @@ class TestStringProcessJSON(unittest.TestCase):
             }"""
         )
         code = self.converter.GetC()
-        lines = ['static char BUILD_NAME[] = "VALUE";']
+        lines = ['static const char BUILD_NAME[] = "VALUE";']
         AssertIsInSequence(lines, code, self)
 
     def test_PassKeyStringAndModuleName_FunctionPresentInC(self):
@@ -138,7 +138,7 @@ class TestStringProcessJSON(unittest.TestCase):
             }"""
         )
         code = self.converter.GetC()
-        lines = ['static char BUILD_NAME[] = "VALUE";']
+        lines = ['static const char BUILD_NAME[] = "VALUE";']
         AssertIsInSequence(lines, code, self)
 
     def test_PassTwoStrings_VariablesPresentInC(self):
@@ -150,8 +150,8 @@ class TestStringProcessJSON(unittest.TestCase):
         )
         code = self.converter.GetC()
         lines = [
-            'static char NAME1[] = "VALUE1";',
-            'static char NAME2[] = "VALUE2";',
+            'static const char NAME1[] = "VALUE1";',
+            'static const char NAME2[] = "VALUE2";',
         ]
         AssertIsInSequence(lines, code, self)
 
@@ -284,7 +284,7 @@ class TestFormatter(unittest.TestCase):
     def test_Underscore_KeepOnVariable(self):
         self.converter.ProcessJSON('{"string:Project_Name": "Build Info"}')
         code = self.converter.GetC()
-        lines = ['static char Project_Name[] = "Build Info";']
+        lines = ['static const char Project_Name[] = "Build Info";']
         AssertIsInSequence(lines, code, self)
 
     def test_Underscore_RemoveOnFunction(self):
@@ -312,13 +312,13 @@ class TestSignedIntegerProcessJSON(unittest.TestCase):
     def test_SInt8Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int8:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static int8_t NAME = 0;"]
+        lines = ["static const int8_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt8Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int8:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static int8_t NAME = 1;"]
+        lines = ["static const int8_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt8Bit_FunctionIsPresentInC(self):
@@ -348,13 +348,13 @@ class TestSignedIntegerProcessJSON(unittest.TestCase):
     def test_SInt16Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int16:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static int16_t NAME = 0;"]
+        lines = ["static const int16_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt16Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int16:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static int16_t NAME = 1;"]
+        lines = ["static const int16_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt16Bit_FunctionIsPresentInC(self):
@@ -384,13 +384,13 @@ class TestSignedIntegerProcessJSON(unittest.TestCase):
     def test_SInt16Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int16:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static int16_t NAME = 0;"]
+        lines = ["static const int16_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt32Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int32:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static int32_t NAME = 1;"]
+        lines = ["static const int32_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt32Bit_FunctionIsPresentInC(self):
@@ -420,13 +420,13 @@ class TestSignedIntegerProcessJSON(unittest.TestCase):
     def test_SInt64Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int64:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static int64_t NAME = 0;"]
+        lines = ["static const int64_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt64Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"int64:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static int64_t NAME = 1;"]
+        lines = ["static const int64_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_SInt64Bit_FunctionIsPresentInC(self):
@@ -489,13 +489,13 @@ class TestUnsignedIntegerProcessJSON(unittest.TestCase):
     def test_UInt8Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint8:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static uint8_t NAME = 0;"]
+        lines = ["static const uint8_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt8Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint8:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static uint8_t NAME = 1;"]
+        lines = ["static const uint8_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt8Bit_FunctionIsPresentInC(self):
@@ -525,13 +525,13 @@ class TestUnsignedIntegerProcessJSON(unittest.TestCase):
     def test_UInt16Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint16:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static uint16_t NAME = 0;"]
+        lines = ["static const uint16_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt16Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint16:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static uint16_t NAME = 1;"]
+        lines = ["static const uint16_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt16Bit_FunctionIsPresentInC(self):
@@ -561,13 +561,13 @@ class TestUnsignedIntegerProcessJSON(unittest.TestCase):
     def test_UInt16Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint16:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static uint16_t NAME = 0;"]
+        lines = ["static const uint16_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt32Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint32:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static uint32_t NAME = 1;"]
+        lines = ["static const uint32_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt32Bit_FunctionIsPresentInC(self):
@@ -597,13 +597,13 @@ class TestUnsignedIntegerProcessJSON(unittest.TestCase):
     def test_UInt64Bit_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint64:NAME": 0}')
         code = self.converter.GetC()
-        lines = ["static uint64_t NAME = 0;"]
+        lines = ["static const uint64_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt64Bit_OtherValue_VariableIsPresentInC(self):
         self.converter.ProcessJSON('{"uint64:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static uint64_t NAME = 1;"]
+        lines = ["static const uint64_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_UInt64Bit_FunctionIsPresentInC(self):
@@ -653,8 +653,8 @@ class TestArrayOfObjects(unittest.TestCase):
         )
 
         lines = [
-            'static char NAME1[] = "VALUE1";',
-            'static char BUILD_NAME2[] = "VALUE2";',
+            'static const char NAME1[] = "VALUE1";',
+            'static const char BUILD_NAME2[] = "VALUE2";',
             "const char *PtrNAME1(void) {",
             "const char *BUILD_PtrNAME2(void) {",
         ]
@@ -682,8 +682,8 @@ class TestArrayOfObjects(unittest.TestCase):
         )
 
         lines = [
-            'static char BUILD_NAME1[] = "VALUE1";',
-            'static char NAME2[] = "VALUE2";',
+            'static const char BUILD_NAME1[] = "VALUE1";',
+            'static const char NAME2[] = "VALUE2";',
             "const char *BUILD_PtrNAME1(void) {",
             "const char *PtrNAME2(void) {",
         ]
@@ -738,13 +738,13 @@ class TestStringsWitMaximumSize(unittest.TestCase):
     def test_StringSize_AnySize(self):
         self.converter.ProcessJSON('{"string[]:NAME": "VALUE"}')
         code = self.converter.GetC()
-        lines = ['static char NAME[] = "VALUE"']
+        lines = ['static const char NAME[] = "VALUE"']
         AssertIsInSequence(lines, code, self)
 
     def test_StringSize_AllUsed_AccountNullTerminator(self):
         self.converter.ProcessJSON('{"string[6]:NAME": "VALUE"}')
         code = self.converter.GetC()
-        lines = ['static char NAME[6] = "VALUE"']
+        lines = ['static const char NAME[6] = "VALUE"']
         AssertIsInSequence(lines, code, self)
 
     def test_StringSize_OutOfBounds_AccountNullTerminator(self):
@@ -754,7 +754,7 @@ class TestStringsWitMaximumSize(unittest.TestCase):
     def test_StringSize_NotAllUsed_AccountNullTerminator(self):
         self.converter.ProcessJSON('{"string[2]:NAME": ""}')
         code = self.converter.GetC()
-        lines = ['static char NAME[2] = ""']
+        lines = ['static const char NAME[2] = ""']
         AssertIsInSequence(lines, code, self)
 
 
@@ -822,7 +822,7 @@ class TestFloat(unittest.TestCase):
     def test_Float_VariableInC(self):
         self.converter.ProcessJSON('{"float:NAME": 1.0}')
         code = self.converter.GetC()
-        lines = ["static float NAME = 1.0;"]
+        lines = ["static const float NAME = 1.0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_Float_FunctionInC(self):
@@ -845,7 +845,7 @@ class TestFloat(unittest.TestCase):
     def test_FloatValue_CanBeInteger(self):
         self.converter.ProcessJSON('{"float:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static float NAME = 1;"]
+        lines = ["static const float NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_FloatValue_MustBeFloatOrInt(self):
@@ -874,7 +874,7 @@ class TestDouble(unittest.TestCase):
 
     def test_Double_VariableInC(self):
         self.converter.ProcessJSON('{"double:NAME": 1.0}')
-        lines = ["static double NAME = 1.0;"]
+        lines = ["static const double NAME = 1.0;"]
         code = self.converter.GetC()
         AssertIsInSequence(lines, code, self)
 
@@ -898,7 +898,7 @@ class TestDouble(unittest.TestCase):
     def test_DoubleValue_CanBeInteger(self):
         self.converter.ProcessJSON('{"double:NAME": 1}')
         code = self.converter.GetC()
-        lines = ["static double NAME = 1;"]
+        lines = ["static const double NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_DoubleValue_MustBeDoubleOrInt(self):
@@ -927,14 +927,14 @@ class TestBool(unittest.TestCase):
         self.converter.ProcessJSON('{"bool:NAME": true}')
 
     def test_Bool_ValueTrue_VariableInC(self):
-        lines = ["static bool NAME = true;"]
+        lines = ["static const bool NAME = true;"]
         code = self.converter.GetC()
         AssertIsInSequence(lines, code, self)
 
     def test_Bool_ValueFalse_VariableInC(self):
         self.converter.Reset()
         self.converter.ProcessJSON('{"bool:NAME": false}')
-        lines = ["static bool NAME = false;"]
+        lines = ["static const bool NAME = false;"]
         code = self.converter.GetC()
         AssertIsInSequence(lines, code, self)
 
@@ -973,7 +973,7 @@ class TestBoolAsInteger(unittest.TestCase):
 
     def test_Bool_ValueTrue_VariableInC(self):
         code = self.converter.GetC()
-        lines = ["static uint8_t NAME = 1;"]
+        lines = ["static const uint8_t NAME = 1;"]
         AssertIsInSequence(lines, code, self)
 
     def test_Bool_ValueFalse_VariableInC(self):
@@ -985,7 +985,7 @@ class TestBoolAsInteger(unittest.TestCase):
             }"""
         )
         code = self.converter.GetC()
-        lines = ["static uint8_t NAME = 0;"]
+        lines = ["static const uint8_t NAME = 0;"]
         AssertIsInSequence(lines, code, self)
 
     def test_Bool_AsIntegerAtTheEnd_StillHasEffect(self):
@@ -996,7 +996,7 @@ class TestBoolAsInteger(unittest.TestCase):
                 "Bool_Is_Integer": true
             }"""
         )
-        lines = ["static uint8_t NAME = 1;"]
+        lines = ["static const uint8_t NAME = 1;"]
         code = self.converter.GetC()
         AssertIsInSequence(lines, code, self)
 
@@ -1254,7 +1254,7 @@ class TestReadableVariablesCode(unittest.TestCase):
         self.converter.ProcessJSON('{"int8:r:Val": 0}')
         code = self.converter.GetC()
         lines = [
-            "static int8_t Val = 0;",
+            "static const int8_t Val = 0;",
             "int8_t GetVal(void) {",
             "int8_t val;",
             "CRITICAL_BLOCK(",
@@ -1269,7 +1269,7 @@ class TestReadableVariablesCode(unittest.TestCase):
         self.converter.ProcessJSON('{"bool:r:Val": false}')
         code = self.converter.GetC()
         lines = [
-            "static bool Val = false;",
+            "static const bool Val = false;",
             "bool GetVal(void) {",
             "bool val;",
             "CRITICAL_BLOCK(",
@@ -1286,7 +1286,7 @@ class TestReadableVariablesCode(unittest.TestCase):
         )
         code = self.converter.GetC()
         lines = [
-            "static uint8_t Val = 0;",
+            "static const uint8_t Val = 0;",
             "uint8_t GetVal(void) {",
             "uint8_t val;",
             "CRITICAL_BLOCK(",
@@ -1301,7 +1301,7 @@ class TestReadableVariablesCode(unittest.TestCase):
         self.converter.ProcessJSON('{"string:r:Val": "A"}')
         code = self.converter.GetC()
         lines = [
-            'static char Val[] = "A";',
+            'static const char Val[] = "A";',
             "uint16_t LenVal(void) {",
             "return sizeof(Val);",
             "}",
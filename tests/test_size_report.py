@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import Mock
+import asyncio
+import json
+import shutil
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+CONFIG = """[{
+    "Bool_Is_Integer": true,
+    "macro:CRITICAL_BLOCK(code)": "do { code } while (0)"
+}, {
+    "Section_Prefix": "INFO",
+    "Entry_Table": true,
+    "uint32:w:Number": 1,
+    "string:Name": "NAME"
+}]"""
+
+
+class TestSizeReport(unittest.TestCase):
+    def setUp(self):
+        self.bi = bi.BuildInfo()
+
+    def Entry(self, report, name):
+        return [entry for entry in report if entry["entry"] == name][-1]
+
+    def test_Entries_InOrder(self):
+        self.bi.ProcessJSON(CONFIG)
+        report = self.bi.GetSizeReport()
+        self.assertEqual(
+            [
+                ("", "Bool_Is_Integer"),
+                ("", "macro:CRITICAL_BLOCK(code)"),
+                ("", "(module)"),
+                ("INFO", "Section_Prefix"),
+                ("INFO", "Entry_Table"),
+                ("INFO", "uint32:w:Number"),
+                ("INFO", "string:Name"),
+                ("INFO", "(module)"),
+            ],
+            [(entry["module"], entry["entry"]) for entry in report],
+        )
+
+    def test_Entries_SameAsProcessJSONAsync(self):
+        self.bi.ProcessJSON(CONFIG)
+        async_bi = bi.BuildInfo()
+        asyncio.run(async_bi.ProcessJSONAsync(CONFIG))
+        self.assertEqual(self.bi.GetSizeReport(), async_bi.GetSizeReport())
+
+    def test_Entries_Metrics(self):
+        self.bi.ProcessJSON(CONFIG)
+        report = self.bi.GetSizeReport()
+        entry = self.Entry(report, "string:Name")
+        self.assertEqual(3, entry["functions"])
+        self.assertEqual(3, entry["header_lines"])
+        self.assertGreater(
+            entry["source_bytes"],
+            len('static const char INFO_Name[] = "NAME";'),
+        )
+        self.assertLessEqual(
+            sum(entry["source_bytes"] for entry in report),
+            len(self.bi.GetC()),
+        )
+        self.assertEqual(
+            1, self.Entry(report, "macro:CRITICAL_BLOCK(code)")["header_lines"]
+        )
+        self.assertEqual(
+            0, self.Entry(report, "Section_Prefix")["source_bytes"]
+        )
+        self.assertEqual(2, self.Entry(report, "(module)")["functions"])
+
+    def test_Entries_SymbolSizes(self):
+        self.bi.ProcessJSON(CONFIG)
+        report = self.bi.GetSizeReport(
+            {"INFO_Number": 4, "INFO_GetNumber": 10, "INFO_SetNumber": 12}
+        )
+        self.assertEqual(
+            26, self.Entry(report, "uint32:w:Number")["object_bytes"]
+        )
+        self.assertEqual(0, self.Entry(report, "string:Name")["object_bytes"])
+
+    def test_Table_SortedLargestFirst(self):
+        report = {
+            "entries": [
+                {
+                    "module": "INFO",
+                    "entry": "a",
+                    "functions": 1,
+                    "header_lines": 1,
+                    "source_bytes": 10,
+                },
+                {
+                    "module": "INFO",
+                    "entry": "b",
+                    "functions": 2,
+                    "header_lines": 2,
+                    "source_bytes": 200,
+                },
+            ]
+        }
+        self.assertEqual(
+            "MODULE  ENTRY  FUNCTIONS  HEADER_LINES  SOURCE_BYTES\n"
+            + "INFO    b              2             2           200\n"
+            + "INFO    a              1             1            10\n",
+            bi.SizeReportTable(report),
+        )
+        table = bi.SizeReportTable(report, sort="entry")
+        self.assertLess(table.index("INFO    b"), table.index("INFO    a"))
+
+    def test_SizeReport_ObjectSizes(self):
+        if shutil.which(CC) is None or shutil.which("nm") is None:
+            self.skipTest(f"C compiler {CC} or nm not available")
+        self.bi.ProcessJSON(CONFIG)
+        report = bi.SizeReport(self.bi)
+        self.assertGreater(
+            self.Entry(report["entries"], "uint32:w:Number")["object_bytes"], 0
+        )
+        self.assertGreater(
+            self.Entry(report["entries"], "(module)")["object_bytes"], 0
+        )
+
+    def test_Main_PrintsTableWritesJSON(self):
+        open = OpenMock()
+        print = Mock()
+        open.SetFileData("input.json", CONFIG)
+        argv = ["build_info.py", "--report", "input.json", "report.json"]
+        self.assertEqual(0, bi.main(argv, open=open, print=print))
+        self.assertIn("HEADER_LINES", str(print.call_args))
+        report = json.loads(open.GetFileData("report.json"))
+        self.assertEqual(8, len(report["entries"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
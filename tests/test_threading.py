@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+# Build Info - https://github.com/djboni/build_info
+# MIT License - Copyright (c) 2021 Djones A. Boni
+
+import unittest
+from unittest.mock import patch
+import asyncio
+import concurrent.futures
+import sys
+
+try:
+    import build_info as bi
+except ModuleNotFoundError:
+    sys.path.append("../src")
+    import build_info as bi
+
+try:
+    from helper import *
+except ModuleNotFoundError:
+    sys.path.append("..")
+    from helper import *
+
+
+def ModuleJSON(i):
+    return f"""[
+        {{"Module_Name": "module{i}", "Bool_Is_Integer": {str(i % 2 == 0).lower()}}},
+        {{
+            "Section_Prefix": "MODULE{i}",
+            "uint32:w:Value": {i},
+            "bool:Flag": true,
+            "string:Name": "module {i}"
+        }}
+    ]"""
+
+
+def Generate(i, converter=None):
+    if converter is None:
+        converter = bi.BuildInfo(filename_base=f"module{i}")
+    converter.ProcessJSON(ModuleJSON(i))
+    return converter.GetC(), converter.GetH()
+
+
+class TestThreadSafety(unittest.TestCase):
+    def test_FormatterIsNotSharedBetweenInstances(self):
+        self.assertIsNot(bi.BuildInfo()._formatter, bi.BuildInfo()._formatter)
+
+    def test_Reset_ClearsAllProcessingState(self):
+        converter = bi.BuildInfo(filename_base="first")
+        converter.ProcessJSON(ModuleJSON(0))
+        converter.Reset()
+        converter.ProcessJSON('{"bool:Flag": true}')
+        code = converter.GetC()
+        lines = ['#include "first.h"', "static const bool Flag = true;"]
+        AssertIsInSequence(lines, code, self)
+        self.assertNotIn("Value", code)
+
+    def test_ThreadPool_InstancesPerModule_NoCrossTalk(self):
+        expected = [Generate(i) for i in range(32)]
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(Generate, range(32)))
+        self.assertEqual(expected, results)
+
+    def test_ThreadPool_SharedInstance_CallsAreSerialized(self):
+        converter = bi.BuildInfo()
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(
+                executor.map(
+                    converter.ProcessJSON,
+                    [
+                        f'{{"Section_Prefix": "M{i}", "int8:V": 0}}'
+                        for i in range(64)
+                    ],
+                )
+            )
+        code = converter.GetC()
+        for i in range(64):
+            self.assertEqual(
+                1, code.count(f"static const int8_t M{i}_V = 0;\n")
+            )
+
+    def test_ProcessJSON_WhileProcessingAsync_RaisesRuntimeError(self):
+        converter = bi.BuildInfo()
+
+        async def GetCommitStringAsync(git_data, repository):
+            with self.assertRaises(RuntimeError):
+                converter.ProcessJSON("{}")
+            return "COMMIT"
+
+        with patch.object(
+            bi.GitBinaryData, "GetCommitStringAsync", GetCommitStringAsync
+        ):
+            asyncio.run(
+                converter.ProcessJSONAsync(
+                    '{"Git_Repository": {"Directory": ".", "Backend": "binary"}}'
+                )
+            )
+        self.assertIn('Git_Commit_Str[] = "COMMIT"', converter.GetC())
+
+
+if __name__ == "__main__":
+    unittest.main()